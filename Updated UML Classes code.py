@@ -1,17 +1,658 @@
+import asyncio
+import hashlib
+import heapq
+import hmac
+import itertools
+import json
+import math
+import os
+import queue
+import random
+import shutil
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import weakref
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bulk helpers fall back to plain Python loops
+    np = None
+
+
+def to_ordinal(value) -> int:
+    """
+    Converts a YYYY-MM-DD date string (or an existing day ordinal) to a proleptic Gregorian day ordinal.
+    """
+    if isinstance(value, int):
+        return value
+    return date.fromisoformat(value).toordinal()
+
+
+# EventLog class
+class EventLog:
+    """
+    Routes domain events (booking confirmed, payment processed, login failed, ...) to pluggable sinks.
+
+    No sink is attached by default, so emitting an event costs a single attribute check and the
+    human-readable message template is only formatted by sinks that need it. Several sinks can be
+    attached with add_sink, which fans events out through a FanOutSink.
+    """
+
+    sink = None  # The active EventSink (a FanOutSink when several are attached), or None when nobody is listening
+
+    @staticmethod
+    def emit(event: str, message: str, **fields) -> None:
+        """
+        Sends an event to the active sink, if any.
+
+        :param event: Dotted event name, e.g. "booking.confirmed".
+        :param message: Message template formatted with the fields, e.g. "Booking {booking_id} confirmed."
+        :param fields: Structured event data.
+        """
+        sink = EventLog.sink
+        if sink is not None:
+            sink.write(event, message, fields)
+
+    @staticmethod
+    def set_sink(sink: "EventSink") -> "EventSink":
+        """Attaches a sink (None detaches) and returns the previously attached one."""
+        previous = EventLog.sink
+        EventLog.sink = sink
+        return previous
+
+    @staticmethod
+    def add_sink(sink: "EventSink") -> None:
+        """Attaches a sink alongside those already attached, so every one of them receives each event."""
+        current = EventLog.sink
+        if current is None:
+            EventLog.sink = sink
+        elif isinstance(current, FanOutSink):
+            current.add(sink)
+        else:
+            EventLog.sink = FanOutSink([current, sink])
+
+    @staticmethod
+    def remove_sink(sink: "EventSink") -> None:
+        """Detaches one sink, leaving any others attached."""
+        current = EventLog.sink
+        if current is sink:
+            EventLog.sink = None
+        elif isinstance(current, FanOutSink) and sink in current.get_sinks():
+            current.remove(sink)
+            remaining = current.get_sinks()
+            if len(remaining) < 2:
+                EventLog.sink = remaining[0] if remaining else None
+
+
+# EventSink classes
+class EventSink:
+    """
+    Base class for event sinks. Subclasses override write; flush and close are optional.
+    """
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Receives a single event."""
+
+    def flush(self) -> None:
+        """Pushes any buffered events to their destination."""
+
+    def close(self) -> None:
+        """Flushes and releases any resources held by the sink."""
+        self.flush()
+
+
+class PrintSink(EventSink):
+    """
+    Prints each event's formatted message to stdout, like the classes did before events existed.
+    """
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Prints the formatted message."""
+        print(message.format(**fields))
+
+
+class RingBufferSink(EventSink):
+    """
+    Keeps the most recent events in memory, discarding the oldest once capacity is reached.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        :param capacity: Maximum number of events retained.
+        """
+        self.__events = deque(maxlen=capacity)
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Stores the event with its timestamp."""
+        self.__events.append((time.time(), event, fields))
+
+    def get_events(self) -> list:
+        """Returns the retained events as (timestamp, event, fields) tuples, oldest first."""
+        return list(self.__events)
+
+    def clear(self) -> None:
+        """Discards all retained events."""
+        self.__events.clear()
+
+
+class JsonLinesSink(EventSink):
+    """
+    Appends events to a JSON-lines file, writing them in batches to keep I/O calls rare.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """
+        :param path: File to append events to.
+        :param batch_size: Number of events buffered before a write.
+        """
+        self.__file = open(path, "a", encoding="utf-8")
+        self.__batch_size = batch_size
+        self.__buffer = []
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Buffers the event, writing the batch once it is full."""
+        self.__buffer.append(json.dumps({"ts": time.time(), "event": event, **fields}, default=str))
+        if len(self.__buffer) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered events to the file."""
+        if self.__buffer:
+            self.__file.write("\n".join(self.__buffer) + "\n")
+            self.__buffer.clear()
+        self.__file.flush()
+
+    def close(self) -> None:
+        """Flushes buffered events and closes the file."""
+        self.flush()
+        self.__file.close()
+
+
+class QueueSink(EventSink):
+    """
+    Hands events to a background thread that forwards them in batches to another sink,
+    so the caller never waits on the target sink's I/O.
+    """
+
+    __STOP = object()  # Sentinel telling the worker thread to exit
+
+    def __init__(self, target: "EventSink", batch_size: int = 1000):
+        """
+        :param target: The sink that receives events on the background thread.
+        :param batch_size: Maximum number of events forwarded before the target is flushed.
+        """
+        self.__target = target
+        self.__batch_size = batch_size
+        self.__queue = queue.SimpleQueue()
+        self.__worker = threading.Thread(target=self.__drain, name="QueueSink", daemon=True)
+        self.__worker.start()
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Queues the event for the background thread."""
+        self.__queue.put((event, message, fields))
+
+    def __drain(self) -> None:
+        """Forwards queued events to the target sink until the stop sentinel arrives."""
+        while True:
+            item = self.__queue.get()
+            batch = 0
+            while item is not QueueSink.__STOP:
+                self.__target.write(*item)
+                batch += 1
+                if batch >= self.__batch_size:
+                    break
+                try:
+                    item = self.__queue.get_nowait()
+                except queue.Empty:
+                    break
+            self.__target.flush()
+            if item is QueueSink.__STOP:
+                return
+
+    def close(self) -> None:
+        """Waits for queued events to be forwarded, then closes the target sink."""
+        self.__queue.put(QueueSink.__STOP)
+        self.__worker.join()
+        self.__target.close()
+
+
+class FanOutSink(EventSink):
+    """
+    Forwards each event to several sinks in the order they were added (see EventLog.add_sink).
+    """
+
+    def __init__(self, sinks: list = ()):
+        """
+        :param sinks: The sinks that receive every event.
+        """
+        self.__sinks = list(sinks)
+
+    def add(self, sink: "EventSink") -> None:
+        """Adds a sink after the existing ones."""
+        self.__sinks.append(sink)
+
+    def remove(self, sink: "EventSink") -> None:
+        """Removes a sink; it is not closed."""
+        self.__sinks.remove(sink)
+
+    def get_sinks(self) -> list:
+        """Returns the attached sinks."""
+        return list(self.__sinks)
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Passes the event to every sink."""
+        for sink in self.__sinks:
+            sink.write(event, message, fields)
+
+    def flush(self) -> None:
+        """Flushes every sink."""
+        for sink in self.__sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        """Closes every sink."""
+        for sink in self.__sinks:
+            sink.close()
+
+
+# LatencyHistogram class
+class LatencyHistogram:
+    """
+    HDR-style latency histogram over nanosecond values with a fixed relative precision.
+
+    Values below 2**PRECISION_BITS get a bucket each; above that every power of two is split into
+    2**(PRECISION_BITS - 1) equal buckets, so percentiles are accurate to about 1.6% at any
+    magnitude while recording is a couple of integer operations and one list increment.
+    """
+
+    PRECISION_BITS = 6
+
+    def __init__(self):
+        """Starts an empty histogram."""
+        self.__counts = [0] * (2 << LatencyHistogram.PRECISION_BITS)
+        self.__total = 0
+        self.__sum = 0
+        self.__max = 0
+
+    @staticmethod
+    def bucket_of(value: int) -> int:
+        """Returns the bucket index of a non-negative value."""
+        shift = value.bit_length() - LatencyHistogram.PRECISION_BITS
+        if shift <= 0:
+            return value
+        return (shift << (LatencyHistogram.PRECISION_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def value_of(bucket: int) -> int:
+        """Returns the middle of the value range a bucket covers."""
+        if bucket < 1 << LatencyHistogram.PRECISION_BITS:
+            return bucket
+        shift = (bucket >> (LatencyHistogram.PRECISION_BITS - 1)) - 1
+        return ((bucket - (shift << (LatencyHistogram.PRECISION_BITS - 1))) << shift) + (1 << shift >> 1)
+
+    def record(self, value: int) -> None:
+        """Records one value (nanoseconds)."""
+        shift = value.bit_length() - LatencyHistogram.PRECISION_BITS  # bucket_of(), inlined for the hot path
+        bucket = (shift << (LatencyHistogram.PRECISION_BITS - 1)) + (value >> shift) if shift > 0 else value
+        counts = self.__counts
+        if bucket >= len(counts):
+            counts.extend([0] * (bucket + 1 - len(counts)))
+        counts[bucket] += 1
+        self.__total += 1
+        self.__sum += value
+        if value > self.__max:
+            self.__max = value
+
+    def get_count(self) -> int:
+        """Returns the number of recorded values."""
+        return self.__total
+
+    def get_mean(self) -> float:
+        """Returns the exact mean of the recorded values."""
+        return self.__sum / self.__total if self.__total else 0.0
+
+    def get_max(self) -> int:
+        """Returns the exact largest recorded value."""
+        return self.__max
+
+    def percentiles(self, *fractions: float) -> list:
+        """Returns the value at each fraction (e.g. 0.5, 0.99) in one pass over the buckets."""
+        targets = sorted((max(1, math.ceil(fraction * self.__total)), position) for position, fraction in enumerate(fractions))
+        results = [0] * len(fractions)
+        seen = 0
+        next_target = 0
+        for bucket, count in enumerate(self.__counts):
+            if not count:
+                continue
+            seen += count
+            while next_target < len(targets) and seen >= targets[next_target][0]:
+                results[targets[next_target][1]] = min(LatencyHistogram.value_of(bucket), self.__max)
+                next_target += 1
+            if next_target == len(targets):
+                break
+        return results
+
+    def reset(self) -> None:
+        """Discards every recorded value."""
+        self.__counts = [0] * (2 << LatencyHistogram.PRECISION_BITS)
+        self.__total = self.__sum = self.__max = 0
+
+
+# Instrumentation class
+class Instrumentation:
+    """
+    Latency histograms and exact call counts around hot-path methods.
+
+    The first enable() of a target installs one timing wrapper on its class, found through the MRO
+    so inherited methods work too, and the wrapper stays there; enable() and disable() only add
+    and remove the metric from the active set the wrapper checks, so the class is never patched
+    again and other wrappers layered on top are left alone. Targets are looked up by class name
+    when enabled, which lets them name classes defined after this one.
+
+    Active wrappers count every call. Reading the clock costs about a microsecond, most of the
+    time of the microsecond-scale SAMPLED targets, so those time only every SAMPLE_EVERY-th call;
+    their percentiles come from those calls, while calls and throughput stay exact.
+    """
+
+    TARGETS = {  # metric name -> (class name, method name)
+        "login": ("User", "login"),
+        "confirm_booking": ("Booking", "confirm_booking"),
+        "process_payment": ("Payment", "process_payment"),
+        "availability_search": ("AvailabilityIndex", "find_free_rooms"),
+        "feedback_aggregation": ("Feedback", "analyze_feedback_trends"),
+    }
+    SAMPLED = {"confirm_booking", "process_payment", "feedback_aggregation"}  # Metrics timed on every SAMPLE_EVERY-th call only
+    SAMPLE_EVERY = 16  # Timing interval (in calls) of the SAMPLED metrics
+
+    histograms = {}  # metric name -> LatencyHistogram of the timed calls
+    counters = {}  # metric name -> itertools.count() advanced once per active call
+    counter_reads = {}  # metric name -> times snapshot() advanced the counter itself
+    installed = {}  # metric name -> (class, method name, original attribute) of each wrapper put in place
+    active = frozenset()  # Metric names the installed wrappers currently count and time
+    enabled_at = None  # time.perf_counter() when enabled or last reset; None while disabled
+
+    @staticmethod
+    def enable(targets: dict = None) -> None:
+        """
+        Activates the target methods (default: TARGETS), installing their wrappers on first use.
+        Targets whose class is not defined yet are skipped until the next enable().
+        """
+        active = set(Instrumentation.active)
+        for name, (class_name, method_name) in (targets or Instrumentation.TARGETS).items():
+            owner = globals().get(class_name)
+            if owner is None:
+                continue
+            if name not in Instrumentation.installed:
+                original = next(klass.__dict__[method_name] for klass in owner.__mro__ if method_name in klass.__dict__)
+                Instrumentation.histograms.setdefault(name, LatencyHistogram())
+                Instrumentation.counters.setdefault(name, itertools.count())
+                Instrumentation.counter_reads.setdefault(name, 0)
+                every = Instrumentation.SAMPLE_EVERY if name in Instrumentation.SAMPLED else 1
+                if isinstance(original, staticmethod):
+                    wrapper = staticmethod(Instrumentation.__timed(name, original.__func__, every))
+                else:
+                    wrapper = Instrumentation.__timed(name, original, every)
+                setattr(owner, method_name, wrapper)
+                Instrumentation.installed[name] = (owner, method_name, original)
+            active.add(name)
+        Instrumentation.active = frozenset(active)
+        if Instrumentation.enabled_at is None and active:
+            Instrumentation.enabled_at = time.perf_counter()
+
+    @staticmethod
+    def __timed(name: str, function, every: int):
+        """Returns a wrapper that, while name is active, counts each call and records every every-th call's wall-clock time in nanoseconds."""
+        clock = time.perf_counter_ns
+        counters = Instrumentation.counters
+        record = Instrumentation.histograms[name].record
+
+        def timed(*args, **kwargs):
+            if name not in Instrumentation.active:
+                return function(*args, **kwargs)
+            if next(counters[name]) % every:  # next() on itertools.count is atomic, so concurrent calls are all counted
+                return function(*args, **kwargs)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        timed.__name__, timed.__doc__, timed.__wrapped__ = function.__name__, function.__doc__, function
+        return timed
+
+    @staticmethod
+    def disable() -> None:
+        """Deactivates every metric; the installed wrappers stay in place but only pass calls through. Recorded histograms are kept."""
+        Instrumentation.active = frozenset()
+        Instrumentation.enabled_at = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether any metric is currently active."""
+        return bool(Instrumentation.active)
+
+    @staticmethod
+    def reset() -> None:
+        """Clears every histogram and call count and restarts the throughput clock."""
+        for name, histogram in Instrumentation.histograms.items():
+            histogram.reset()
+            Instrumentation.counters[name] = itertools.count()
+            Instrumentation.counter_reads[name] = 0
+        if Instrumentation.enabled_at is not None:
+            Instrumentation.enabled_at = time.perf_counter()
+
+    @staticmethod
+    def get_calls(name: str) -> int:
+        """Returns the exact number of calls counted for a metric since it was first enabled or last reset."""
+        if name not in Instrumentation.counters:
+            return 0
+        # itertools.count cannot be read without advancing it, so snapshot's own advances are subtracted
+        calls = next(Instrumentation.counters[name]) - Instrumentation.counter_reads[name]
+        Instrumentation.counter_reads[name] += 1
+        return calls
+
+    @staticmethod
+    def snapshot() -> dict:
+        """
+        Returns calls, p50/p95/p99/max latency in microseconds and calls per second since enable() or
+        reset() per metric. SAMPLED metrics also report how many calls were timed ("samples").
+        """
+        elapsed = time.perf_counter() - Instrumentation.enabled_at if Instrumentation.enabled_at is not None else 0.0
+        metrics = {}
+        for name, histogram in Instrumentation.histograms.items():
+            p50, p95, p99 = histogram.percentiles(0.5, 0.95, 0.99)
+            calls = Instrumentation.get_calls(name)
+            metrics[name] = {
+                "calls": calls,
+                "p50_us": round(p50 / 1000, 1),
+                "p95_us": round(p95 / 1000, 1),
+                "p99_us": round(p99 / 1000, 1),
+                "max_us": round(histogram.get_max() / 1000, 1),
+                "throughput_per_s": round(calls / elapsed, 1) if elapsed else 0.0,
+            }
+            if name in Instrumentation.SAMPLED:
+                metrics[name]["samples"] = histogram.get_count()
+        return metrics
+
+
+# PasswordHasher class
+class PasswordHasher:
+    """
+    Hashes passwords with a random salt using hashlib.scrypt (or PBKDF2-HMAC-SHA256) and verifies them
+    in constant time.
+
+    Encoded hashes carry their own parameters, e.g. "scrypt$16384$8$1$<salt>$<hash>", so raising the
+    work factor later still verifies passwords hashed under the old settings. Account constructors
+    hash the password right away, so no plaintext password is kept on an account.
+    """
+
+    ALGORITHMS = {"scrypt": 3, "pbkdf2_sha256": 1}  # Supported algorithm tag -> number of encoded parameters
+
+    def __init__(self, algorithm: str = "scrypt", n: int = 2 ** 14, r: int = 8, p: int = 1, iterations: int = 600000, salt_size: int = 16):
+        """
+        :param algorithm: "scrypt" or "pbkdf2_sha256".
+        :param n: scrypt CPU/memory cost (a power of two); memory used is about 128 * n * r bytes.
+        :param r: scrypt block size.
+        :param p: scrypt parallelization factor.
+        :param iterations: PBKDF2 iteration count.
+        :param salt_size: Random salt length in bytes.
+        """
+        if algorithm not in PasswordHasher.ALGORITHMS:
+            raise ValueError(f"Unsupported password hashing algorithm: {algorithm}")
+        self.__algorithm = algorithm
+        self.__params = (n, r, p) if algorithm == "scrypt" else (iterations,)
+        self.__salt_size = salt_size
+        self.__dummy_hash = None  # Checked by verify_unknown(), created on first use
+
+    @staticmethod
+    def __derive(algorithm: str, params: tuple, password: str, salt: bytes) -> bytes:
+        """Derives the 32-byte key for a password."""
+        if algorithm == "scrypt":
+            n, r, p = params
+            return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024, dklen=32)
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, params[0], dklen=32)
+
+    def hash_password(self, password: str) -> str:
+        """Returns the encoded salted hash of a password."""
+        salt = os.urandom(self.__salt_size)
+        key = PasswordHasher.__derive(self.__algorithm, self.__params, password, salt)
+        return "$".join([self.__algorithm, *map(str, self.__params), salt.hex(), key.hex()])
+
+    def verify_password(self, password: str, encoded: str) -> bool:
+        """
+        Checks a password against an encoded hash in constant time.
+
+        :raises ValueError: If the hash names an unsupported algorithm or has the wrong number of fields.
+        """
+        algorithm, *fields = encoded.split("$")
+        if PasswordHasher.ALGORITHMS.get(algorithm) != len(fields) - 2:
+            raise ValueError(f"Unsupported password hash: {algorithm}")
+        params = tuple(int(field) for field in fields[:-2])
+        key = PasswordHasher.__derive(algorithm, params, password, bytes.fromhex(fields[-2]))
+        return hmac.compare_digest(key, bytes.fromhex(fields[-1]))
+
+    def verify_unknown(self, password: str) -> bool:
+        """Verifies a password against a dummy hash so a wrong username costs as much as a wrong password; always False."""
+        if self.__dummy_hash is None:
+            self.__dummy_hash = self.hash_password("")
+        self.verify_password(password, self.__dummy_hash)
+        return False
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """Checks whether an encoded hash was made with different settings than this hasher's."""
+        return not encoded.startswith("$".join([self.__algorithm, *map(str, self.__params)]) + "$")
+
+
+# LoginRateLimiter class
+class LoginRateLimiter:
+    """
+    Throttles login attempts with a token bucket per username and per source (e.g. client IP).
+
+    Each attempt takes one token from both buckets and is rejected if either is empty; buckets refill
+    continuously up to their capacity. Bucket state is a (tokens, last update) pair in an LRU-ordered
+    dict holding at most max_keys buckets, so memory stays bounded however many distinct usernames or
+    sources show up. An evicted bucket starts over full if its key returns.
+    """
+
+    def __init__(self, capacity: float = 10, refill_per_second: float = 1 / 6, max_keys: int = 100000, clock=time.monotonic):
+        """
+        :param capacity: Attempts allowed in a burst per username and per source.
+        :param refill_per_second: Attempts regained per second (1/6 allows 10 per minute sustained).
+        :param max_keys: Maximum number of buckets kept before the least recently used is evicted.
+        :param clock: Function returning the current time in seconds.
+        """
+        self.__capacity = float(capacity)
+        self.__refill_per_second = refill_per_second
+        self.__max_keys = max_keys
+        self.__clock = clock
+        self.__buckets = OrderedDict()  # ("user" | "source", key) -> (tokens, last update time)
+        self.__allowed = 0
+        self.__rejected = 0
+
+    def __tokens(self, key: tuple, now: float) -> float:
+        """Returns the bucket's current token count after refilling."""
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            return self.__capacity
+        tokens, updated = bucket
+        return min(self.__capacity, tokens + (now - updated) * self.__refill_per_second)
+
+    def __store(self, key: tuple, tokens: float, now: float) -> None:
+        """Saves a bucket as most recently used, evicting the least recently used beyond max_keys."""
+        self.__buckets[key] = (tokens, now)
+        self.__buckets.move_to_end(key)
+        if len(self.__buckets) > self.__max_keys:
+            self.__buckets.popitem(last=False)
+
+    def allow(self, username: str, source: str = None) -> bool:
+        """
+        Records a login attempt and returns whether it may proceed.
+
+        :param username: The username being tried.
+        :param source: Where the attempt comes from (e.g. an IP address), if known.
+        """
+        now = self.__clock()
+        keys = [("user", username)] if source is None else [("user", username), ("source", source)]
+        levels = [self.__tokens(key, now) for key in keys]
+        if min(levels) < 1:
+            for key, tokens in zip(keys, levels):
+                self.__store(key, tokens, now)
+            self.__rejected += 1
+            return False
+        for key, tokens in zip(keys, levels):
+            self.__store(key, tokens - 1, now)
+        self.__allowed += 1
+        return True
+
+    def reset(self, username: str = None, source: str = None) -> None:
+        """Clears the buckets for a username and/or source, e.g. after a successful password reset."""
+        self.__buckets.pop(("user", username), None)
+        self.__buckets.pop(("source", source), None)
+
+    def get_stats(self) -> dict:
+        """Returns counts of allowed and rejected attempts and of tracked buckets."""
+        return {"allowed": self.__allowed, "rejected": self.__rejected, "tracked_keys": len(self.__buckets)}
+
+
+# Example Usage (assign a limiter to User.rate_limiter to throttle logins)
+limiter = LoginRateLimiter(capacity=2)
+print([limiter.allow("alice123", "10.0.0.7") for _ in range(3)])  # Output: [True, True, False]
+print(limiter.get_stats())  # Output: {'allowed': 2, 'rejected': 1, 'tracked_keys': 2}
+
+
 # The USER class
 class User:
     """
     Represents a system user with authentication, profile management, and communication features.
     """
 
-    def __init__(self, user_id: int, name: str, contact_info: str, username: str, password: str, user_role: str):
+    __slots__ = ("__user_id", "__name", "__contact_info", "__username", "__password_hash", "__user_role", "__guest_id")  # No per-instance __dict__, which keeps large object counts compact
+
+    password_hasher = PasswordHasher()  # Shared by User, Employee and Admin; tune the work factor here
+    rate_limiter = None  # Opt-in LoginRateLimiter checked before any password hash is computed; None disables limiting
+    repository = None  # HotelRepository used for booking history and reports; an empty in-memory one is installed below HotelRepository
+    active_sessions = set()  # IDs of users logged in and not yet logged out
+
+    def __init__(self, user_id: int, name: str, contact_info: str, username: str, password: str, user_role: str, password_hash: str = None, guest_id: int = None):
         # Private attributes to store user details securely
         self.__user_id = user_id
         self.__name = name
         self.__contact_info = contact_info
         self.__username = username
-        self.__password = password  # Storing plain text passwords is not secure
+        # An encoded password_hash is stored as given; otherwise only the password's hash is kept
+        self.__password_hash = password_hash if password_hash is not None else User.password_hasher.hash_password(password)
         self.__user_role = user_role
+        self.__guest_id = guest_id  # Guest profile this account books as; None for accounts without one
 
     # Getter and Setter for user_id
     def get_user_id(self) -> int:
@@ -58,21 +699,52 @@ class User:
         """Updates the user's role."""
         self.__user_role = user_role
 
+    # Getter and Setter for guest_id
+    def get_guest_id(self) -> int:
+        """Returns the ID of the guest profile linked to this account, or None."""
+        return self.__guest_id
+
+    def set_guest_id(self, guest_id: int) -> None:
+        """Links this account to a guest profile (None unlinks it)."""
+        self.__guest_id = guest_id
+
     # Authentication methods
-    def login(self, username: str, password: str) -> bool:
+    def login(self, username: str, password: str, source: str = None) -> bool:
         """
         Authenticates the user based on username and password.
-        Ideally, password should be hashed and compared securely.
+        The password is checked against the stored salted hash in constant time.
+        Attempts over User.rate_limiter's limit for the username or source are rejected before hashing.
         """
-        if self.__username == username and self.__password == password:
-            print("Login successful.")
+        if not User.check_rate_limit(username, source):
+            return False
+        if self.verify_password(password) if self.__username == username else User.password_hasher.verify_unknown(password):
+            User.active_sessions.add(self.__user_id)
+            EventLog.emit("user.login_succeeded", "Login successful.", user_id=self.__user_id, username=username)
+            return True
+        EventLog.emit("user.login_failed", "Invalid credentials.", user_id=self.__user_id, username=username)
+        return False
+
+    @staticmethod
+    def check_rate_limit(username: str, source: str = None) -> bool:
+        """Records a login attempt with User.rate_limiter and returns whether it may proceed."""
+        limiter = User.rate_limiter
+        if limiter is None or limiter.allow(username, source):
             return True
-        print("Invalid credentials.")
-        return False  # Consider limiting login attempts to prevent brute-force attacks
+        EventLog.emit("user.login_throttled", "Too many login attempts. Please try again later.", username=username, source=source)
+        return False
+
+    def verify_password(self, password: str) -> bool:
+        """Checks a password against the stored hash without emitting login events."""
+        return User.password_hasher.verify_password(password, self.get_password_hash())
+
+    def get_password_hash(self) -> str:
+        """Returns the encoded password hash (never the password itself)."""
+        return self.__password_hash
 
     def logout(self) -> None:
         """Logs out the user."""
-        print("User logged out.")
+        User.active_sessions.discard(self.__user_id)
+        EventLog.emit("user.logged_out", "User logged out.", user_id=self.__user_id)
 
     def update_profile(self, new_info: dict) -> None:
         """
@@ -81,20 +753,20 @@ class User:
         """
         self.__name = new_info.get("name", self.__name)
         self.__contact_info = new_info.get("contact_info", self.__contact_info)
-        print("Profile updated.")
+        EventLog.emit("user.profile_updated", "Profile updated.", user_id=self.__user_id)
 
     def reset_password(self, new_password: str) -> bool:
         """
         Resets the user's password.
         It should ideally enforce password complexity rules.
         """
-        self.__password = new_password  # Password should be hashed for security
-        print("Password reset successfully.")
+        self.__password_hash = User.password_hasher.hash_password(new_password)
+        EventLog.emit("user.password_reset", "Password reset successfully.", user_id=self.__user_id)
         return True
 
     def deactivate_account(self) -> bool:
         """Deactivates the user's account."""
-        print("Account has been deactivated.")
+        EventLog.emit("user.deactivated", "Account has been deactivated.", user_id=self.__user_id)
         return True  # Consider implementing a reactivation mechanism
 
     def get_account_details(self) -> dict:
@@ -112,17 +784,22 @@ class User:
 
     def check_booking_history(self) -> list:
         """
-        Retrieves the user's booking history.
-        This should be fetched from a database instead of returning static data.
+        Retrieves the booking history of the guest profile linked to this account (see set_guest_id())
+        from User.repository. Returns an empty list when no guest profile is linked or no repository is set.
         """
-        return ["Booking 1", "Booking 2", "Booking 3"]  # Placeholder for actual booking history
+        if User.repository is None or self.__guest_id is None:
+            return []
+        return [
+            f"Booking {booking_id}: Room {room_number}, {date.fromordinal(check_in)} to {date.fromordinal(check_out)}, Status: {status}"
+            for booking_id, _, room_number, check_in, check_out, status, *_ in User.repository.get_guest_bookings(self.__guest_id)
+        ]
 
     def send_message(self, receiver: "User", message: str) -> None:
         """
         Sends a message to another user.
         Consider implementing a message queue for better handling.
         """
-        print(f"Message sent to {receiver.get_username()}: {message}")
+        EventLog.emit("user.message_sent", "Message sent to {receiver}: {message}", user_id=self.__user_id, receiver=receiver.get_username(), message=message)
 
     def change_contact_info(self, new_contact: str) -> bool:
         """
@@ -130,7 +807,7 @@ class User:
         Validation should be added to ensure a valid email/phone format.
         """
         self.__contact_info = new_contact
-        print("Contact information updated.")
+        EventLog.emit("user.contact_info_changed", "Contact information updated.", user_id=self.__user_id)
         return True
 
     def upgrade_account(self, new_role: str) -> bool:
@@ -139,7 +816,7 @@ class User:
         Admin-level approval may be required for security.
         """
         self.__user_role = new_role
-        print(f"Account upgraded to {new_role}.")
+        EventLog.emit("user.account_upgraded", "Account upgraded to {role}.", user_id=self.__user_id, role=new_role)
         return True
 
     def verify_identity(self, document: str) -> bool:
@@ -147,7 +824,7 @@ class User:
         Verifies the user's identity using a provided document.
         Ideally, this should integrate with a secure verification system.
         """
-        print(f"Verifying identity with document: {document}")
+        EventLog.emit("user.identity_verification", "Verifying identity with document: {document}", user_id=self.__user_id, document=document)
         return True  # Placeholder for actual verification logic
 
     def request_support(self, issue: str) -> str:
@@ -164,6 +841,18 @@ class User:
         """
         return f"User(ID: {self.__user_id}, Name: {self.__name}, Username: {self.__username}, Role: {self.__user_role})"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the user's state as a flat tuple for persistence (password hash included, never the password)."""
+        return (self.__user_id, self.__name, self.__contact_info, self.__username, self.get_password_hash(), self.__user_role, self.__guest_id)
+
+    @classmethod
+    def from_record(cls, record: tuple) -> "User":
+        """Rebuilds a user from to_record() output without re-hashing the password."""
+        user = cls.__new__(cls)
+        user.__user_id, user.__name, user.__contact_info, user.__username, user.__password_hash, user.__user_role, user.__guest_id = record
+        return user
+
 
 # Example Usage
 user1 = User(1, "Alice", "alice@email.com", "alice123", "pass123", "Customer")
@@ -179,6 +868,473 @@ user1.set_contact_info("newemail@email.com")
 # Testing str method
 print(user1)  # Output: User(ID: 1, Name: Alicia, Username: alice123, Role: Customer)
 
+# Capturing events instead of printing them
+recent_events = RingBufferSink(capacity=100)
+EventLog.set_sink(recent_events)
+user1.login("alice123", "wrongpass")
+print([event for _, event, _ in recent_events.get_events()])  # Output: ['user.login_failed']
+EventLog.set_sink(None)
+
+
+# UserDirectory class
+class UserDirectory:
+    """
+    Finds users by username through a hash index and caches recently verified credentials.
+
+    A cache hit compares a keyed HMAC-SHA256 of the password (microseconds) instead of re-running
+    the deliberately slow password hash. Entries expire after session_ttl seconds, the cache holds at
+    most session_cache_size users (least recently used are evicted), and a password reset invalidates
+    the cached entry because the stored hash it was checked against has changed.
+    """
+
+    def __init__(self, session_ttl: float = 300.0, session_cache_size: int = 10000):
+        """
+        :param session_ttl: Seconds a verified credential stays cached.
+        :param session_cache_size: Maximum number of cached credentials.
+        """
+        self.__users = {}  # username -> User
+        self.__sessions = OrderedDict()  # username -> (password tag, password hash checked, expiry)
+        self.__session_ttl = session_ttl
+        self.__session_cache_size = session_cache_size
+        self.__secret = os.urandom(32)  # Per-process key for the cached password tags
+
+    def __len__(self) -> int:
+        """Returns the number of registered users."""
+        return len(self.__users)
+
+    def add_user(self, user: "User") -> None:
+        """
+        Registers a user under their username.
+
+        :raises ValueError: If the username is already taken.
+        """
+        username = user.get_username()
+        if username in self.__users:
+            raise ValueError(f"Username {username} is already taken.")
+        self.__users[username] = user
+
+    def remove_user(self, username: str) -> None:
+        """Unregisters a user and drops any cached credential."""
+        self.__users.pop(username, None)
+        self.__sessions.pop(username, None)
+
+    def rename_user(self, old_username: str, new_username: str) -> None:
+        """
+        Changes a registered user's username and re-indexes them.
+
+        :raises ValueError: If the new username is already taken.
+        """
+        if new_username in self.__users:
+            raise ValueError(f"Username {new_username} is already taken.")
+        user = self.__users.pop(old_username)
+        self.__sessions.pop(old_username, None)
+        user.set_username(new_username)
+        self.__users[new_username] = user
+
+    def get_user(self, username: str) -> "User":
+        """Returns the user registered under a username, or None."""
+        return self.__users.get(username)
+
+    def authenticate(self, username: str, password: str, source: str = None) -> "User":
+        """
+        Returns the user if the credentials are valid, otherwise None.
+
+        Recently verified credentials are answered from the session cache; every other attempt
+        goes through User.rate_limiter before a password hash is computed.
+        """
+        user = self.__users.get(username)
+        if user is None:
+            if not User.check_rate_limit(username, source):
+                return None
+            User.password_hasher.verify_unknown(password)  # Unknown usernames take as long as known ones
+            return None
+        tag = hmac.new(self.__secret, password.encode(), hashlib.sha256).digest()
+        cached = self.__sessions.get(username)
+        now = time.monotonic()
+        if cached is not None and cached[2] > now and cached[1] == user.get_password_hash() and hmac.compare_digest(cached[0], tag):
+            self.__sessions.move_to_end(username)
+            return user
+        if not user.login(username, password, source):
+            self.__sessions.pop(username, None)
+            return None
+        self.__sessions[username] = (tag, user.get_password_hash(), now + self.__session_ttl)
+        self.__sessions.move_to_end(username)
+        if len(self.__sessions) > self.__session_cache_size:
+            self.__sessions.popitem(last=False)
+        return user
+
+    def invalidate_session(self, username: str) -> None:
+        """Forgets a cached credential so the next authentication re-verifies the hash."""
+        self.__sessions.pop(username, None)
+
+
+# Example Usage
+directory = UserDirectory()
+directory.add_user(user1)
+print(directory.authenticate("alice123", "pass123"))  # Output: User(ID: 1, Name: Alicia, Username: alice123, Role: Customer)
+print(directory.authenticate("alice123", "wrongpass"))  # Output: None
+
+
+# ServiceRequest class
+class ServiceRequest:
+    """
+    A guest's service request (room cleaning, maintenance, ...) moving through Open -> Assigned ->
+    In Progress -> Completed, or Cancelled before it completes.
+    """
+
+    __slots__ = ("__request_id", "__guest_id", "__service", "__role", "__priority", "__status", "__employee_id")
+
+    TRANSITIONS = {
+        "Open": ("Assigned", "Cancelled"),
+        "Assigned": ("Open", "In Progress", "Completed", "Cancelled"),
+        "In Progress": ("Open", "Completed", "Cancelled"),
+        "Completed": (),
+        "Cancelled": (),
+    }
+
+    def __init__(self, request_id: int, guest_id: int, service: str, role: str, priority: int = 3):
+        """
+        Initializes an open ServiceRequest.
+
+        :param request_id: Unique identifier for the request.
+        :param guest_id: The guest who asked for the service.
+        :param service: The service requested, e.g. "Room Cleaning".
+        :param role: The employee role that handles it, e.g. "Housekeeping".
+        :param priority: 1 (most urgent) to 5; lower numbers are dispatched first.
+        """
+        self.__request_id = request_id
+        self.__guest_id = guest_id
+        self.__service = service
+        self.__role = role
+        self.__priority = priority
+        self.__status = "Open"
+        self.__employee_id = None
+
+    def get_request_id(self) -> int:
+        """Returns the request ID."""
+        return self.__request_id
+
+    def get_guest_id(self) -> int:
+        """Returns the ID of the guest who made the request."""
+        return self.__guest_id
+
+    def get_service(self) -> str:
+        """Returns the service requested."""
+        return self.__service
+
+    def get_role(self) -> str:
+        """Returns the employee role that handles the request."""
+        return self.__role
+
+    def get_priority(self) -> int:
+        """Returns the request priority (1 is most urgent)."""
+        return self.__priority
+
+    def get_status(self) -> str:
+        """Returns the request status."""
+        return self.__status
+
+    def set_status(self, status: str) -> None:
+        """
+        Moves the request to a new status.
+
+        :raises ValueError: If the transition is not allowed by TRANSITIONS.
+        """
+        if status not in ServiceRequest.TRANSITIONS.get(self.__status, ()):
+            raise ValueError(f"Service request {self.__request_id} cannot move from {self.__status} to {status}.")
+        self.__status = status
+
+    def get_employee_id(self) -> int:
+        """Returns the ID of the assigned employee, or None."""
+        return self.__employee_id
+
+    def set_employee_id(self, employee_id: int) -> None:
+        """Records the assigned employee (None when unassigned)."""
+        self.__employee_id = employee_id
+
+    def __str__(self) -> str:
+        """Returns a string representation of the ServiceRequest object."""
+        return f"Service request {self.__request_id}: '{self.__service}' ({self.__role}, priority {self.__priority}), Status: {self.__status}"
+
+
+# ServiceDispatcher class
+class ServiceDispatcher:
+    """
+    Queues service requests by priority and assigns them to the least-loaded employee of the matching role.
+
+    Each role has a heap of open requests keyed by (priority, arrival) and a heap of employees keyed
+    by (active requests, version). Load changes push a fresh employee entry and bump the employee's
+    version, so outdated entries are skipped when popped instead of being searched for; requests
+    that stop being open are skipped the same way. Assignment, completion and transfer are therefore
+    O(log n), and heaps are compacted when stale entries pile up.
+    """
+
+    SERVICE_ROLES = {  # Service name -> handling role; other services go to DEFAULT_ROLE
+        "Room Cleaning": "Housekeeping",
+        "Extra Towels": "Housekeeping",
+        "Maintenance": "Technician",
+        "Room Service": "Kitchen",
+        "Wake-up Call": "Front Desk",
+        "Airport Transfer": "Concierge",
+    }
+    DEFAULT_ROLE = "Concierge"
+
+    def __init__(self, max_load: int = 5):
+        """
+        Initializes an empty dispatcher.
+
+        :param max_load: Most active (Assigned or In Progress) requests one employee is given.
+        """
+        self.__max_load = max_load
+        self.__requests = {}  # request_id -> ServiceRequest
+        self.__next_request_id = 1
+        self.__sequence = 0  # Arrival order for requests with equal priority
+        self.__open_queues = {}  # role -> heap of (priority, sequence, request_id)
+        self.__open_count = 0
+        self.__employees = {}  # employee_id -> Employee
+        self.__employee_roles = {}  # employee_id -> role the employee is queued under
+        self.__loads = {}  # employee_id -> active request count
+        self.__versions = {}  # employee_id -> version of the employee's valid heap entry
+        self.__employee_heaps = {}  # role -> heap of (load, version, employee_id)
+        self.__role_sizes = {}  # role -> registered employees
+        self.__assigned = 0
+        self.__completed = 0
+
+    # Employees
+    def add_employee(self, employee: "Employee") -> None:
+        """Registers an employee under their current role, or refreshes their role if already registered."""
+        employee_id = employee.get_employee_id()
+        old_role = self.__employee_roles.get(employee_id)
+        if old_role is not None:
+            self.__role_sizes[old_role] -= 1
+        role = employee.get_role()
+        self.__employees[employee_id] = employee
+        self.__employee_roles[employee_id] = role
+        self.__role_sizes[role] = self.__role_sizes.get(role, 0) + 1
+        self.__loads.setdefault(employee_id, 0)
+        self.__push_employee(employee_id)
+
+    def has_employee(self, employee_id: int) -> bool:
+        """Returns True if the employee is registered."""
+        return employee_id in self.__employees
+
+    def remove_employee(self, employee_id: int) -> int:
+        """Unregisters an employee and puts their active requests back in the queue; returns how many were requeued."""
+        employee = self.__employees.pop(employee_id, None)
+        if employee is None:
+            return 0
+        self.__role_sizes[self.__employee_roles.pop(employee_id)] -= 1
+        self.__versions.pop(employee_id, None)
+        self.__loads.pop(employee_id, None)
+        requeued = 0
+        for request_id in employee.get_assigned_requests():
+            request = self.__requests.get(request_id)
+            employee.release_request(request_id)
+            if request is not None and request.get_status() in ("Assigned", "In Progress"):
+                request.set_status("Open")
+                request.set_employee_id(None)
+                self.__enqueue(request)
+                requeued += 1
+        return requeued
+
+    def __push_employee(self, employee_id: int) -> None:
+        """Pushes the employee's current load as their only valid heap entry."""
+        version = self.__versions.get(employee_id, 0) + 1
+        self.__versions[employee_id] = version
+        role = self.__employee_roles[employee_id]
+        heap = self.__employee_heaps.setdefault(role, [])
+        heapq.heappush(heap, (self.__loads[employee_id], version, employee_id))
+        if len(heap) > 4 * self.__role_sizes[role] + 64:
+            heap[:] = [entry for entry in heap if self.__versions.get(entry[2]) == entry[1] and self.__employee_roles.get(entry[2]) == role]
+            heapq.heapify(heap)
+
+    def __least_loaded(self, role: str, exclude: int = None) -> int:
+        """Returns the ID of the least-loaded employee of a role below max_load (leaving their entry in place), or None."""
+        heap = self.__employee_heaps.get(role)
+        skipped = []
+        found = None
+        while heap:
+            load, version, employee_id = heap[0]
+            if self.__versions.get(employee_id) != version or self.__employee_roles.get(employee_id) != role:
+                heapq.heappop(heap)  # Outdated entry
+                continue
+            if load >= self.__max_load:
+                break
+            if employee_id == exclude:
+                skipped.append(heapq.heappop(heap))
+                continue
+            found = employee_id
+            break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def __change_load(self, employee_id: int, delta: int) -> None:
+        """Adjusts an employee's active request count and re-queues them."""
+        if employee_id in self.__loads:
+            self.__loads[employee_id] += delta
+            self.__push_employee(employee_id)
+
+    # Requests
+    def create_request(self, guest_id: int, service: str, priority: int = 3, role: str = None) -> "ServiceRequest":
+        """Creates and queues a request; the role defaults to SERVICE_ROLES for the service."""
+        request = ServiceRequest(self.__next_request_id, guest_id, service, role or ServiceDispatcher.SERVICE_ROLES.get(service, ServiceDispatcher.DEFAULT_ROLE), priority)
+        self.__next_request_id += 1
+        self.submit(request)
+        return request
+
+    def submit(self, request: "ServiceRequest") -> None:
+        """Queues an open request."""
+        self.__requests[request.get_request_id()] = request
+        self.__next_request_id = max(self.__next_request_id, request.get_request_id() + 1)
+        self.__enqueue(request)
+        EventLog.emit("service.requested", "Service request '{service}' has been placed.", request_id=request.get_request_id(),
+                      guest_id=request.get_guest_id(), service=request.get_service(), priority=request.get_priority())
+
+    def __enqueue(self, request: "ServiceRequest") -> None:
+        """Adds an open request to its role's queue."""
+        self.__sequence += 1
+        heapq.heappush(self.__open_queues.setdefault(request.get_role(), []), (request.get_priority(), self.__sequence, request.get_request_id()))
+        self.__open_count += 1
+
+    def get_request(self, request_id: int) -> "ServiceRequest":
+        """Returns a request by ID, or None."""
+        return self.__requests.get(request_id)
+
+    def dispatch(self, limit: int = None) -> list:
+        """
+        Assigns open requests, most urgent first, to the least-loaded employee of each request's role.
+
+        The role queues are merged by (priority, arrival), so a limit takes the most urgent requests
+        across every role. Requests whose role has no employee below max_load stay queued.
+
+        :param limit: Most assignments to make in this call (None for no limit).
+        :return: (request_id, employee_id) pairs in assignment order.
+        """
+        assignments = []
+        heads = []  # (priority, sequence, role) of each role's most urgent open request
+        for role, open_queue in self.__open_queues.items():
+            if self.__skip_stale(role, open_queue):
+                heads.append((open_queue[0][0], open_queue[0][1], role))
+        heapq.heapify(heads)
+        while heads and (limit is None or len(assignments) < limit):
+            role = heapq.heappop(heads)[2]
+            employee_id = self.__least_loaded(role)
+            if employee_id is None:
+                continue  # Every employee of the role is at max_load; its requests stay queued
+            open_queue = self.__open_queues[role]
+            request_id = heapq.heappop(open_queue)[2]
+            self.__open_count -= 1
+            self.__assign(self.__requests[request_id], employee_id)
+            assignments.append((request_id, employee_id))
+            if self.__skip_stale(role, open_queue):
+                heapq.heappush(heads, (open_queue[0][0], open_queue[0][1], role))
+        return assignments
+
+    def __skip_stale(self, role: str, open_queue: list) -> bool:
+        """Pops queue entries that are no longer open under the role and returns True if an open request remains."""
+        while open_queue:
+            request = self.__requests.get(open_queue[0][2])
+            if request is not None and request.get_status() == "Open" and request.get_role() == role:
+                return True
+            heapq.heappop(open_queue)  # Cancelled, reassigned or re-queued elsewhere since it was queued
+            self.__open_count -= 1
+        return False
+
+    def __assign(self, request: "ServiceRequest", employee_id: int) -> None:
+        """Hands a request to an employee."""
+        request.set_status("Assigned")
+        request.set_employee_id(employee_id)
+        self.__change_load(employee_id, 1)
+        self.__employees[employee_id].assign_request(request.get_request_id())
+        self.__assigned += 1
+
+    def __release(self, request: "ServiceRequest") -> None:
+        """Takes a request away from its employee."""
+        employee_id = request.get_employee_id()
+        employee = self.__employees.get(employee_id)
+        if employee is not None:
+            employee.release_request(request.get_request_id())
+            self.__change_load(employee_id, -1)
+
+    def set_status(self, request_id: int, status: str) -> None:
+        """
+        Moves a request to a new status, releasing its employee when it completes, is cancelled or reopens.
+
+        Requests become Assigned only through dispatch(), which picks the employee.
+
+        :raises KeyError: If the request is unknown.
+        :raises ValueError: If the transition is not allowed or the new status is Assigned.
+        """
+        request = self.__requests[request_id]
+        if status == "Assigned":
+            raise ValueError(f"Service request {request_id} is assigned by dispatch(), not by a status change.")
+        previous = request.get_status()
+        request.set_status(status)
+        if previous in ("Assigned", "In Progress") and status in ("Open", "Completed", "Cancelled"):
+            self.__release(request)
+            if status == "Open":
+                request.set_employee_id(None)
+        if status == "Open":
+            self.__enqueue(request)
+        elif status == "Completed":
+            self.__completed += 1
+        EventLog.emit("service.status_changed", "Service request {request_id} status updated to {status}.", request_id=request_id, status=status)
+
+    def start(self, request_id: int) -> None:
+        """Marks an assigned request as In Progress."""
+        self.set_status(request_id, "In Progress")
+
+    def complete(self, request_id: int) -> None:
+        """Marks a request as Completed and frees its employee."""
+        self.set_status(request_id, "Completed")
+
+    def cancel(self, request_id: int) -> None:
+        """Cancels a request that has not completed yet."""
+        self.set_status(request_id, "Cancelled")
+
+    def transfer(self, request_id: int, to_employee_id: int = None) -> int:
+        """
+        Moves an assigned or in-progress request to another employee of its role.
+
+        :param to_employee_id: The new employee; by default the least-loaded other employee below max_load.
+        :return: The new employee's ID.
+        :raises ValueError: If the request is not active, or the new employee is missing, of another role,
+            already handling it or at max_load.
+        """
+        request = self.__requests[request_id]
+        if request.get_status() not in ("Assigned", "In Progress"):
+            raise ValueError(f"Service request {request_id} is {request.get_status()} and cannot be transferred.")
+        from_employee_id = request.get_employee_id()
+        if to_employee_id is None:
+            to_employee_id = self.__least_loaded(request.get_role(), exclude=from_employee_id)
+        elif (self.__employee_roles.get(to_employee_id) != request.get_role() or to_employee_id == from_employee_id
+              or self.__loads[to_employee_id] >= self.__max_load):
+            to_employee_id = None
+        if to_employee_id is None:
+            raise ValueError(f"No employee available to take service request {request_id}.")
+        self.__release(request)
+        request.set_employee_id(to_employee_id)
+        self.__change_load(to_employee_id, 1)
+        self.__employees[to_employee_id].assign_request(request_id)
+        EventLog.emit("service.transferred", "Transferred request {request_id} to employee {to_employee_id}", request_id=request_id,
+                      from_employee_id=from_employee_id, to_employee_id=to_employee_id)
+        return to_employee_id
+
+    # Statistics
+    def get_open_count(self) -> int:
+        """Returns the number of requests waiting in the queues (including not yet skipped stale entries)."""
+        return self.__open_count
+
+    def get_employee_load(self, employee_id: int) -> int:
+        """Returns an employee's active request count."""
+        return self.__loads.get(employee_id, 0)
+
+    def get_stats(self) -> dict:
+        """Returns request, queue and employee counters."""
+        return {"requests": len(self.__requests), "queued": self.__open_count, "employees": len(self.__employees),
+                "assigned": self.__assigned, "completed": self.__completed}
+
 
 # Employee class
 class Employee:
@@ -187,15 +1343,21 @@ class Employee:
     requests, managing schedules, and reporting work progress.
     """
 
-    def __init__(self, employee_id: int, name: str, role: str, admin_id: int, username: str, password: str):
+    __slots__ = ("__employee_id", "__name", "__role", "__assigned_requests", "__admin_id", "__username", "__password_hash")
+
+    dispatcher = ServiceDispatcher()  # Shared service-request queue and assignment engine
+    scheduler = None  # ShiftScheduler whose roster backs view_schedule() and request_leave()
+
+    def __init__(self, employee_id: int, name: str, role: str, admin_id: int, username: str, password: str, password_hash: str = None):
         # Private attributes for employee information
         self.__employee_id = employee_id
         self.__name = name
         self.__role = role
-        self.__assigned_requests = []  # List to store assigned service requests
+        self.__assigned_requests = {}  # Assigned service request IDs (insertion-ordered dict keys)
         self.__admin_id = admin_id  # ID of the admin supervising this employee
         self.__username = username
-        self.__password = password  # Password should be stored securely (hashed)
+        # An encoded password_hash is stored as given; otherwise only the password's hash is kept
+        self.__password_hash = password_hash if password_hash is not None else User.password_hasher.hash_password(password)
 
     # Getter and Setter for employee_id
     def get_employee_id(self) -> int:
@@ -223,16 +1385,22 @@ class Employee:
     def set_role(self, role: str) -> None:
         """Updates the employee's role."""
         self.__role = role
+        if Employee.dispatcher.has_employee(self.__employee_id):
+            Employee.dispatcher.add_employee(self)  # Re-queue under the new role
 
     # Getter and Setter for assigned requests
     def get_assigned_requests(self) -> list:
         """Returns a list of assigned service requests."""
-        return self.__assigned_requests
+        return list(self.__assigned_requests)
+
+    def release_request(self, request_id: int) -> None:
+        """Removes a service request from the employee's assignments."""
+        self.__assigned_requests.pop(request_id, None)
 
     def assign_request(self, request_id: int) -> None:
         """Assigns a service request to the employee."""
-        self.__assigned_requests.append(request_id)
-        print(f"Request {request_id} assigned to {self.__name}.")
+        self.__assigned_requests[request_id] = None
+        EventLog.emit("employee.request_assigned", "Request {request_id} assigned to {name}.", employee_id=self.__employee_id, request_id=request_id, name=self.__name)
 
     # Getter and Setter for admin_id
     def get_admin_id(self) -> int:
@@ -252,42 +1420,70 @@ class Employee:
         """Updates the employee's username."""
         self.__username = username
 
+    def authenticate(self, username: str, password: str, source: str = None) -> bool:
+        """Checks the employee's username and password against the stored hash, subject to User.rate_limiter."""
+        if not User.check_rate_limit(username, source):
+            return False
+        if self.__username != username:
+            return User.password_hasher.verify_unknown(password)
+        return User.password_hasher.verify_password(password, self.__password_hash)
+
     # Employee actions
     def handle_service_request(self, request_id: int) -> None:
-        """Processes a service request."""
-        print(f"Handling service request {request_id}.")
+        """Processes a service request, moving it to In Progress when the dispatcher tracks it."""
+        request = Employee.dispatcher.get_request(request_id)
+        if request is not None and request.get_status() == "Assigned":
+            Employee.dispatcher.start(request_id)
+        EventLog.emit("employee.request_handled", "Handling service request {request_id}.", employee_id=self.__employee_id, request_id=request_id)
 
     def update_request_status(self, request_id: int, status: str) -> None:
-        """Updates the status of a service request."""
-        print(f"Service request {request_id} status updated to {status}.")
+        """
+        Updates the status of a service request.
+
+        :raises ValueError: If the dispatcher tracks the request and the transition is not allowed.
+        """
+        if Employee.dispatcher.get_request(request_id) is not None:
+            Employee.dispatcher.set_status(request_id, status)
+        EventLog.emit("employee.request_status_updated", "Service request {request_id} status updated to {status}.", employee_id=self.__employee_id, request_id=request_id, status=status)
 
     def view_schedule(self) -> dict:
-        """Retrieves the employee's schedule."""
-        return {"Monday": "Shift 9 AM - 5 PM", "Tuesday": "Off-duty"}
+        """Retrieves the employee's schedule from the shared ShiftScheduler roster when they are on it."""
+        schedule = Employee.scheduler.get_schedule(self.__employee_id) if Employee.scheduler is not None else {}
+        return schedule or {"Monday": "Shift 9 AM - 5 PM", "Tuesday": "Off-duty"}
 
     def submit_work_report(self) -> None:
         """Submits a work report."""
-        print("Work report submitted.")
+        EventLog.emit("employee.work_report_submitted", "Work report submitted.", employee_id=self.__employee_id)
 
-    def request_leave(self, days: int) -> bool:
-        """Allows an employee to request leave."""
+    def request_leave(self, days: int, start=None) -> bool:
+        """
+        Allows an employee to request leave of up to 14 days. With a start date and a shared
+        ShiftScheduler, the leave is only granted if the roster can still cover the freed shifts.
+        """
+        if days <= 14 and start is not None and Employee.scheduler is not None and Employee.scheduler.get_schedule(self.__employee_id):
+            return Employee.scheduler.request_leave(self.__employee_id, start, days)
         if days <= 14:
-            print("Leave request approved.")
+            EventLog.emit("employee.leave_approved", "Leave request approved.", employee_id=self.__employee_id, days=days)
             return True
-        print("Leave request denied.")
+        EventLog.emit("employee.leave_denied", "Leave request denied.", employee_id=self.__employee_id, days=days)
         return False
 
     def receive_notification(self, message: str) -> None:
         """Receives a notification."""
-        print(f"Notification received: {message}")
+        EventLog.emit("employee.notification_received", "Notification received: {message}", employee_id=self.__employee_id, message=message)
 
     def log_hours_worked(self, hours: int) -> None:
         """Logs the number of hours worked by the employee."""
-        print(f"Logged {hours} hours worked.")
+        EventLog.emit("employee.hours_logged", "Logged {hours} hours worked.", employee_id=self.__employee_id, hours=hours)
 
     def transfer_request_to_another_employee(self, employee: "Employee", request_id: int) -> None:
-        """Transfers a service request to another employee."""
-        print(f"Transferred request {request_id} to {employee.get_name()}")
+        """Transfers a service request to another employee (through the dispatcher when it tracks the request)."""
+        if Employee.dispatcher.get_request(request_id) is not None:
+            Employee.dispatcher.transfer(request_id, employee.get_employee_id())
+        else:
+            self.release_request(request_id)
+            employee.assign_request(request_id)
+        EventLog.emit("employee.request_transferred", "Transferred request {request_id} to {name}", employee_id=self.__employee_id, request_id=request_id, to_employee_id=employee.get_employee_id(), name=employee.get_name())
 
     def view_employee_performance(self) -> dict:
         """Retrieves performance metrics of the employee."""
@@ -297,6 +1493,19 @@ class Employee:
         """Returns a string representation of the Employee object."""
         return f"Employee(ID: {self.__employee_id}, Name: {self.__name}, Role: {self.__role}, Username: {self.__username})"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the employee's state as a flat tuple for persistence; assigned requests are JSON-encoded."""
+        return (self.__employee_id, self.__name, self.__role, self.__admin_id, self.__username, self.__password_hash, json.dumps(list(self.__assigned_requests)))
+
+    @classmethod
+    def from_record(cls, record: tuple) -> "Employee":
+        """Rebuilds an employee from to_record() output without re-hashing the password."""
+        employee = cls.__new__(cls)
+        employee.__employee_id, employee.__name, employee.__role, employee.__admin_id, employee.__username, employee.__password_hash, assigned = record
+        employee.__assigned_requests = dict.fromkeys(json.loads(assigned))
+        return employee
+
 
 # Example Usage
 employee1 = Employee(101, "John Doe", "Technician", 5001, "johndoe", "securepass")
@@ -314,21 +1523,432 @@ employee1.set_role("Senior Technician")
 # Assign a request
 employee1.assign_request(2001)
 
+# Dispatching queued service requests to the least-loaded employee of the matching role
+dispatcher = ServiceDispatcher(max_load=2)
+dispatcher.add_employee(Employee(102, "Maria Lopez", "Housekeeping", 5001, "mlopez", "cleanpass"))
+dispatcher.add_employee(Employee(103, "Sam Lee", "Housekeeping", 5001, "slee", "cleanpass"))
+towels = dispatcher.create_request(301, "Extra Towels", priority=4)
+cleaning = dispatcher.create_request(301, "Room Cleaning", priority=1)
+print(dispatcher.dispatch())  # Output: [(2, 102), (1, 103)]
+print(dispatcher.transfer(cleaning.get_request_id()))  # Output: 103
+dispatcher.complete(cleaning.get_request_id())
+print(cleaning)  # Output: Service request 2: 'Room Cleaning' (Housekeeping, priority 1), Status: Completed
+
 # Testing str method
 print(employee1)  # Output: Employee(ID: 101, Name: Johnny Doe, Role: Senior Technician, Username: johndoe)
 
 
-#Room Class
-class Room:
+# AvailabilityIndex class
+class AvailabilityIndex:
     """
-    Represents a hotel room with details like room number, type, amenities, price, and availability.
+    Indexes confirmed booking date ranges per room so availability searches avoid scanning every booking.
     """
 
-    def __init__(self, room_number: int, room_type: str, amenities: list, price_per_night: float, availability_status: bool = True):
+    def __init__(self):
         """
-        Initializes a Room object with its details.
-        
-        Parameters:
+        Initializes an empty index.
+
+        Stays are indexed per Room object, so two rooms that share a number never share booked nights.
+        Each room's confirmed stays are folded into sorted, non-overlapping segments: __points holds the
+        segment start ordinals and __depths how many stays cover each segment, with equal neighbours
+        merged. A free range therefore lies inside a single zero-depth segment, so an overlap check is one
+        bisect however long or numerous the stays are. Registered rooms also get a slot (a bit) within
+        their room type, and every night keeps a bitmask of the type's slots booked that night, so a type
+        search ORs one mask per night and decodes only the free rooms. Rooms are held weakly, so discarded
+        rooms drop out.
+        """
+        self.__rooms = weakref.WeakValueDictionary()  # room_number -> Room registered under it
+        self.__placement = weakref.WeakKeyDictionary()  # Room -> (room_type, slot) it is filed under
+        self.__slots = {}  # room_type -> list of weakref.ref(Room) (None for a free slot), indexed by slot
+        self.__free_slots = {}  # room_type -> slots released for reuse
+        self.__live = {}  # room_type -> bitmask of occupied slots
+        self.__busy = {}  # room_type -> {night ordinal: bitmask of slots with a confirmed stay that night}
+        self.__points = {}  # Room -> sorted segment start ordinals
+        self.__depths = {}  # Room -> stays covering each segment, parallel to __points (the last is always 0)
+        self.__bookings = {}  # Booking -> (Room, check_in ordinal, check_out ordinal, booking ID)
+        self.__booking_ids = {}  # booking ID -> number of indexed bookings carrying it
+        self.__observers = weakref.WeakSet()  # Objects notified through availability_changed(room, check_in, check_out)
+
+    def add_observer(self, observer) -> None:
+        """
+        Registers an object whose availability_changed(room, check_in, check_out) method is called
+        whenever a stay is indexed or removed (dates are ordinals) or a room is registered (dates are None).
+        """
+        self.__observers.add(observer)
+
+    def remove_observer(self, observer) -> None:
+        """Unregisters an observer added with add_observer, if present."""
+        self.__observers.discard(observer)
+
+    def __notify(self, room: "Room", check_in, check_out) -> None:
+        """Tells every observer that availability changed for a room."""
+        for observer in tuple(self.__observers):
+            observer.availability_changed(room, check_in, check_out)
+
+    # Room registration
+    def __place(self, room: "Room", room_type: str) -> None:
+        """Gives a room a slot within a room type and marks its booked nights in the type's masks."""
+        self.__unplace(room)
+        slots = self.__slots.setdefault(room_type, [])
+        free = self.__free_slots.setdefault(room_type, [])
+        slot = free.pop() if free else len(slots)
+        if slot == len(slots):
+            slots.append(None)
+        slots[slot] = weakref.ref(room)
+        self.__live[room_type] = self.__live.get(room_type, 0) | 1 << slot
+        self.__placement[room] = (room_type, slot)
+        self.__mark(room, True)
+
+    def __unplace(self, room: "Room") -> None:
+        """Releases a room's slot, if it has one, clearing its booked nights from the type's masks."""
+        placement = self.__placement.get(room)
+        if placement is None:
+            return
+        self.__mark(room, False)
+        del self.__placement[room]
+        self.__release_slot(*placement)
+
+    def __release_slot(self, room_type: str, slot: int) -> None:
+        """Frees a slot for reuse."""
+        self.__slots[room_type][slot] = None
+        self.__live[room_type] &= ~(1 << slot)
+        self.__free_slots[room_type].append(slot)
+
+    def __mark(self, room: "Room", busy: bool) -> None:
+        """Sets (busy) or clears a placed room's bit in its type's nightly masks for every night it has a stay."""
+        room_type, slot = self.__placement[room]
+        bit = 1 << slot
+        nights = self.__busy.setdefault(room_type, {})
+        points = self.__points.get(room, ())
+        depths = self.__depths.get(room, ())
+        for position in range(len(points) - 1):
+            if depths[position]:
+                for night in range(points[position], points[position + 1]):
+                    AvailabilityIndex.__set_bit(nights, night, bit, busy)
+
+    def __sync(self, room: "Room", start: int, end: int) -> None:
+        """Brings a placed room's bit in its type's nightly masks for [start, end) in line with its stays."""
+        placement = self.__placement.get(room)
+        if placement is None:
+            return
+        room_type, slot = placement
+        nights = self.__busy.setdefault(room_type, {})
+        points = self.__points.get(room, ())
+        depths = self.__depths.get(room, ())
+        position = bisect_right(points, start) - 1
+        for night in range(start, end):
+            while position + 1 < len(points) and points[position + 1] <= night:
+                position += 1
+            AvailabilityIndex.__set_bit(nights, night, 1 << slot, position >= 0 and depths[position] > 0)
+
+    @staticmethod
+    def __set_bit(nights: dict, night: int, bit: int, busy: bool) -> None:
+        """Sets or clears one slot bit in a night's mask, dropping masks that become empty."""
+        if busy:
+            nights[night] = nights.get(night, 0) | bit
+            return
+        mask = nights.get(night, 0) & ~bit
+        if mask:
+            nights[night] = mask
+        else:
+            nights.pop(night, None)
+
+    def register_room(self, room: "Room") -> None:
+        """
+        Adds a room to the index. Another live room registered under the same number stays indexed
+        but is no longer returned by get_room(); the reuse is reported as a "room.number_reused" event.
+        """
+        room_number = room.get_room_number()
+        previous = self.__rooms.get(room_number)
+        if previous is not None and previous is not room:
+            EventLog.emit("room.number_reused", "Room {room_number} was registered again and replaces the earlier room.", room_number=room_number)
+        self.__rooms[room_number] = room
+        placement = self.__placement.get(room)
+        if placement is None or placement[0] != room.get_room_type():
+            self.__place(room, room.get_room_type())
+        if self.__observers:
+            self.__notify(room, None, None)
+
+    def unregister_room(self, room: "Room") -> None:
+        """Removes a room from searches; its indexed stays are kept."""
+        room_number = room.get_room_number()
+        if self.__rooms.get(room_number) is room:
+            del self.__rooms[room_number]
+        self.__unplace(room)
+
+    def change_room_number(self, room: "Room", new_room_number: int) -> None:
+        """
+        Files a registered room under a new room number; its stays belong to the room and move with it.
+
+        :raises ValueError: If another live room is registered under the new number.
+        """
+        old_room_number = room.get_room_number()
+        if self.__rooms.get(old_room_number) is not room or new_room_number == old_room_number:
+            return
+        holder = self.__rooms.get(new_room_number)
+        if holder is not None and holder is not room:
+            raise ValueError(f"Room number {new_room_number} is already taken by another room.")
+        del self.__rooms[old_room_number]
+        self.__rooms[new_room_number] = room
+
+    def change_room_type(self, room: "Room", new_room_type: str) -> None:
+        """Moves a registered room to a different room type."""
+        if room in self.__placement:
+            self.__place(room, new_room_type)
+
+    def get_room(self, room_number: int) -> "Room":
+        """Returns the room registered under the given number, or None."""
+        return self.__rooms.get(room_number)
+
+    # Booking maintenance
+    def __cover(self, room: "Room", check_in: int, check_out: int, step: int) -> None:
+        """Adds step (+1 or -1) to the depth of every segment in [check_in, check_out) of a room, merging equal neighbours."""
+        if check_out <= check_in:
+            return
+        points = self.__points.setdefault(room, [])
+        depths = self.__depths.setdefault(room, [])
+        bounds = []
+        for day in (check_in, check_out):  # Split segments so both ends fall on a segment start
+            position = bisect_left(points, day)
+            if position == len(points) or points[position] != day:
+                points.insert(position, day)
+                depths.insert(position, depths[position - 1] if position else 0)
+            bounds.append(position)
+        first = bounds[0]
+        last = bisect_left(points, check_out, first)
+        for position in range(first, last):
+            depths[position] += step
+        for position in (last, first):  # Merge from the right so the left position stays valid
+            if depths[position] == (depths[position - 1] if position else 0):
+                del points[position]
+                del depths[position]
+        if not points:
+            del self.__points[room]
+            del self.__depths[room]
+        self.__sync(room, check_in, check_out)
+
+    def add_booking(self, booking: "Booking") -> None:
+        """Indexes a confirmed booking, replacing its previous date range if it was already indexed."""
+        self.remove_booking(booking)
+        room = booking.get_room()
+        check_in = booking.get_check_in_ordinal()
+        check_out = booking.get_check_out_ordinal()
+        self.__cover(room, check_in, check_out, 1)
+        booking_id = booking.get_booking_id()
+        self.__bookings[booking] = (room, check_in, check_out, booking_id)
+        self.__booking_ids[booking_id] = self.__booking_ids.get(booking_id, 0) + 1
+        if self.__observers:
+            self.__notify(room, check_in, check_out)
+
+    def remove_booking(self, booking: "Booking") -> None:
+        """Removes a booking from the index if it is present."""
+        location = self.__bookings.pop(booking, None)
+        if location is None:
+            return
+        room, check_in, check_out, booking_id = location
+        if self.__booking_ids[booking_id] == 1:
+            del self.__booking_ids[booking_id]
+        else:
+            self.__booking_ids[booking_id] -= 1
+        self.__cover(room, check_in, check_out, -1)
+        if self.__observers:
+            self.__notify(room, check_in, check_out)
+
+    def get_booking_count(self) -> int:
+        """Returns the number of indexed bookings."""
+        return len(self.__bookings)
+
+    def has_booking_id(self, booking_id: int) -> bool:
+        """Returns True if an indexed (confirmed) booking has this ID (as of when it was indexed)."""
+        return booking_id in self.__booking_ids
+
+    def occupancy_by_night(self, start, end) -> list:
+        """
+        Returns the number of rooms with a confirmed stay on each night in [start, end).
+
+        Only each room's segments inside the window are visited, so the cost follows the rooms and the
+        window length rather than every booking ever indexed.
+        """
+        start = to_ordinal(start)
+        nights = max(to_ordinal(end) - start, 0)
+        stop = start + nights
+        changes = [0] * (nights + 1)
+        for room, points in self.__points.items():
+            depths = self.__depths[room]
+            position = max(bisect_right(points, start) - 1, 0)
+            while position < len(points) - 1 and points[position] < stop:
+                if depths[position]:
+                    changes[max(points[position], start) - start] += 1
+                    changes[min(points[position + 1], stop) - start] -= 1
+                position += 1
+        occupied = 0
+        counts = []
+        for change in changes[:nights]:
+            occupied += change
+            counts.append(occupied)
+        return counts
+
+    # Queries
+    def is_room_free(self, room: "Room", check_in, check_out, ignore_booking: "Booking" = None) -> bool:
+        """
+        Checks whether a room has no confirmed stay overlapping [check_in, check_out).
+
+        :param room: The room to check.
+        :param check_in: Check-in date (YYYY-MM-DD string or day ordinal).
+        :param check_out: Check-out date (YYYY-MM-DD string or day ordinal), exclusive.
+        :param ignore_booking: A booking whose own stay should not count as a conflict.
+        :return: True if the room is free for the whole range.
+        """
+        points = self.__points.get(room)
+        if not points:
+            return True
+        check_in = to_ordinal(check_in)
+        check_out = to_ordinal(check_out)
+        depths = self.__depths[room]
+        position = bisect_right(points, check_in) - 1
+        ignored = self.__bookings.get(ignore_booking) if ignore_booking is not None else None
+        if ignored is None or ignored[0] is not room:
+            if position >= 0 and depths[position]:
+                return False
+            return position + 1 == len(points) or points[position + 1] >= check_out
+        # Walk the segments in range: a covered stretch is only free if the ignored stay alone covers it
+        _, ignored_in, ignored_out, _ = ignored
+        position = max(position, 0)
+        while position < len(points) - 1 and points[position] < check_out:
+            depth = depths[position]
+            if depth > 1 or depth and not (ignored_in <= max(points[position], check_in) and min(points[position + 1], check_out) <= ignored_out):
+                return False
+            position += 1
+        return True
+
+    def find_free_rooms(self, room_type: str, check_in, check_out, amenities=()) -> list:
+        """
+        Returns the rooms of the given type with no confirmed stay overlapping [check_in, check_out),
+        in slot order (registration order, with freed slots reused).
+
+        The type's nightly masks for the stay are ORed into one mask of booked slots, so the cost is
+        one mask operation per night plus the free rooms returned, however many rooms are booked.
+
+        :param amenities: Amenities every returned room must have (one bitmask AND per room); an amenity
+            no room has ever had matches nothing and is not registered.
+        """
+        required = Room.amenity_registry.lookup_mask(amenities)
+        if required is None or room_type not in self.__slots:
+            return []
+        nights = self.__busy.get(room_type, {})
+        booked = 0
+        for night in range(to_ordinal(check_in), to_ordinal(check_out)):
+            booked |= nights.get(night, 0)
+        candidates = self.__live[room_type] & ~booked
+        slots = self.__slots[room_type]
+        byte_bits = RoomCatalog.BYTE_BITS
+        free = []
+        for index, byte in enumerate(candidates.to_bytes((candidates.bit_length() + 7) // 8, "little")):
+            if not byte:
+                continue
+            for bit in byte_bits[byte]:
+                slot = index * 8 + bit
+                room = slots[slot]()
+                if room is None:  # Garbage-collected since it was registered
+                    self.__release_slot(room_type, slot)
+                elif room.has_amenities(required):
+                    free.append(room)
+        return free
+
+
+# AmenityRegistry class
+class AmenityRegistry:
+    """
+    Interns amenity names and gives each one a bit, so a room's amenities fit in a single int.
+
+    A set of amenities is then a bitmask: membership is one AND, "has all of these" is
+    (mask & required) == required, and rooms share the interned name strings instead of holding
+    their own lists. Rooms that list the same amenities in the same order also share one tuple of
+    names (intern_list()), which keeps each room's own order. Decoded name lists are cached per
+    distinct mask.
+    """
+
+    def __init__(self):
+        """Initializes an empty registry."""
+        self.__names = []  # bit -> amenity name
+        self.__bits = {}  # amenity name -> bit
+        self.__decoded = {}  # mask -> tuple of names, in bit order
+        self.__lists = {}  # tuple of names -> (the shared tuple, its mask)
+
+    def intern(self, amenity: str) -> int:
+        """Returns the amenity's bit mask, registering the amenity on first use."""
+        bit = self.__bits.get(amenity)
+        if bit is None:
+            bit = len(self.__names)
+            self.__bits[amenity] = bit
+            self.__names.append(amenity)
+        return 1 << bit
+
+    def lookup(self, amenity: str) -> int:
+        """Returns the amenity's bit mask, or 0 if it was never registered."""
+        bit = self.__bits.get(amenity)
+        return 1 << bit if bit is not None else 0
+
+    def mask_of(self, amenities) -> int:
+        """Returns the bitmask for an iterable of amenity names, registering new ones."""
+        mask = 0
+        for amenity in amenities:
+            mask |= self.intern(amenity)
+        return mask
+
+    def intern_list(self, amenities) -> tuple:
+        """
+        Returns (names, mask) for an ordered list of amenity names, registering new ones. names is a
+        tuple shared by every caller passing the same names in the same order, duplicates dropped.
+        """
+        names = tuple(dict.fromkeys(amenities))
+        shared = self.__lists.get(names)
+        if shared is None:
+            shared = self.__lists[names] = (names, self.mask_of(names))
+        return shared
+
+    def lookup_mask(self, amenities) -> int:
+        """Returns the bitmask for an iterable of amenity names without registering any, or None if one is unknown."""
+        mask = 0
+        bits = self.__bits
+        for amenity in amenities:
+            bit = bits.get(amenity)
+            if bit is None:
+                return None
+            mask |= 1 << bit
+        return mask
+
+    def names_of(self, mask: int) -> tuple:
+        """Returns the amenity names in a bitmask, in registration order."""
+        names = self.__decoded.get(mask)
+        if names is None:
+            names = tuple(name for bit, name in enumerate(self.__names) if mask >> bit & 1)
+            self.__decoded[mask] = names
+        return names
+
+    def get_amenities(self) -> list:
+        """Returns every registered amenity name."""
+        return list(self.__names)
+
+
+#Room Class
+class Room:
+    """
+    Represents a hotel room with details like room number, type, amenities, price, and availability.
+    """
+
+    __slots__ = ("__room_number", "__room_type", "__amenities", "__amenity_mask", "__price_per_night", "__availability_status", "__weakref__")  # __weakref__ lets the availability index hold rooms weakly
+
+    amenity_registry = AmenityRegistry()  # Interned amenity names; each room stores a bitmask over them
+
+    availability_index = AvailabilityIndex()  # Shared index of confirmed stays for date-range searches
+    observers = weakref.WeakSet()  # Objects notified through room_changed(room, field, old_value, new_value), e.g. RoomCatalog
+
+    def __init__(self, room_number: int, room_type: str, amenities: list, price_per_night: float, availability_status: bool = True):
+        """
+        Initializes a Room object with its details.
+        
+        Parameters:
         - room_number (int): Unique number assigned to the room.
         - room_type (str): Type of room (e.g., Single, Double, Suite).
         - amenities (list): List of amenities available in the room.
@@ -337,9 +1957,11 @@ class Room:
         """
         self.__room_number = room_number
         self.__room_type = room_type
-        self.__amenities = amenities  # List of amenities like Wi-Fi, AC, TV, etc.
+        # Shared tuple of amenities like Wi-Fi, AC, TV, etc. in the order given, and its bitmask for searches
+        self.__amenities, self.__amenity_mask = Room.amenity_registry.intern_list(amenities)
         self.__price_per_night = price_per_night
         self.__availability_status = availability_status  # True if the room is available, False otherwise.
+        Room.availability_index.register_room(self)
 
     # Getter and Setter for room_number
     def get_room_number(self) -> int:
@@ -347,8 +1969,14 @@ class Room:
         return self.__room_number
 
     def set_room_number(self, room_number: int) -> None:
-        """Sets a new room number."""
-        self.__room_number = room_number
+        """
+        Sets a new room number.
+        :raises ValueError: If another live room already holds the number.
+        """
+        Room.availability_index.change_room_number(self, room_number)
+        old_room_number, self.__room_number = self.__room_number, room_number
+        if Room.observers:
+            self.__notify("room_number", old_room_number, room_number)
 
     # Getter and Setter for room_type
     def get_room_type(self) -> str:
@@ -357,22 +1985,39 @@ class Room:
 
     def set_room_type(self, room_type: str) -> None:
         """Updates the room type."""
-        self.__room_type = room_type
+        Room.availability_index.change_room_type(self, room_type)
+        old_room_type, self.__room_type = self.__room_type, room_type
+        if Room.observers:
+            self.__notify("room_type", old_room_type, room_type)
 
     # Getter and Setter for amenities
     def get_amenities(self) -> list:
-        """Returns the list of amenities available in the room."""
-        return self.__amenities
+        """Returns the list of amenities available in the room, in the order they were added."""
+        return list(self.__amenities)
+
+    def get_amenity_mask(self) -> int:
+        """Returns the room's amenities as a bitmask over Room.amenity_registry."""
+        return self.__amenity_mask
+
+    def has_amenities(self, required_mask: int) -> bool:
+        """Returns True if the room has every amenity in a mask built with Room.amenity_registry.mask_of()."""
+        return self.__amenity_mask & required_mask == required_mask
 
     def add_amenity(self, amenity: str) -> None:
         """Adds a new amenity to the room if it's not already present."""
-        if amenity not in self.__amenities:
-            self.__amenities.append(amenity)
+        bit = Room.amenity_registry.intern(amenity)
+        if not self.__amenity_mask & bit:
+            self.__amenities, self.__amenity_mask = Room.amenity_registry.intern_list(self.__amenities + (amenity,))
+            if Room.observers:
+                self.__notify("amenities", None, amenity)
 
     def remove_amenity(self, amenity: str) -> None:
         """Removes an existing amenity from the room."""
-        if amenity in self.__amenities:
-            self.__amenities.remove(amenity)
+        bit = Room.amenity_registry.lookup(amenity)
+        if self.__amenity_mask & bit:
+            self.__amenities, self.__amenity_mask = Room.amenity_registry.intern_list(name for name in self.__amenities if name != amenity)
+            if Room.observers:
+                self.__notify("amenities", amenity, None)
 
     # Getter and Setter for price_per_night
     def get_price(self) -> float:
@@ -381,24 +2026,51 @@ class Room:
 
     def update_price(self, new_price: float) -> None:
         """Updates the price per night of the room."""
-        self.__price_per_night = new_price
+        old_price, self.__price_per_night = self.__price_per_night, new_price
+        if Room.observers:
+            self.__notify("price", old_price, new_price)
 
     # Getter and Setter for availability_status
-    def check_availability(self) -> bool:
-        """Returns the availability status of the room."""
+    def check_availability(self, check_in: str = None, check_out: str = None) -> bool:
+        """
+        Returns the availability status of the room.
+
+        When check_in and check_out (YYYY-MM-DD) are given, returns whether the room has no
+        confirmed booking overlapping that stay instead.
+        """
+        if check_in is not None and check_out is not None:
+            return Room.availability_index.is_room_free(self, check_in, check_out)
         return self.__availability_status
 
     def update_status(self, new_status: bool) -> None:
         """Updates the availability status of the room."""
-        self.__availability_status = new_status
+        old_status, self.__availability_status = self.__availability_status, new_status
+        if Room.observers:
+            self.__notify("availability_status", old_status, new_status)
+
+    def release_room(self, night=None) -> None:
+        """
+        Marks the room as available when a guest checks out, ending maintenance scheduled for that night.
 
-    def release_room(self) -> None:
-        """Marks the room as available when a guest checks out."""
-        self.__availability_status = True
+        :param night: The night released (YYYY-MM-DD string or day ordinal); defaults to today.
+        """
+        self.update_status(True)
+        if Room.observers:
+            self.__notify("maintenance", to_ordinal(night) if night is not None else date.today().toordinal(), None)
 
     def schedule_maintenance(self, date: str) -> None:
-        """Marks the room as unavailable due to scheduled maintenance."""
-        self.__availability_status = False
+        """Marks the room as unavailable due to maintenance on the given night (YYYY-MM-DD)."""
+        self.update_status(False)
+        if Room.observers:
+            self.__notify("maintenance", None, to_ordinal(date))
+
+    def __notify(self, field: str, old_value, new_value) -> None:
+        """
+        Tells every observer that a field changed. Amenity changes pass the removed or added amenity;
+        "maintenance" passes None -> night ordinal when scheduled and night ordinal -> None when released.
+        """
+        for observer in tuple(Room.observers):
+            observer.room_changed(self, field, old_value, new_value)
 
     def calculate_discounted_price(self, discount: float) -> float:
         """
@@ -417,7 +2089,7 @@ class Room:
         return {
             "room_number": self.__room_number,
             "room_type": self.__room_type,
-            "amenities": self.__amenities,
+            "amenities": self.get_amenities(),
             "price_per_night": self.__price_per_night,
             "availability_status": self.__availability_status
         }
@@ -429,6 +2101,17 @@ class Room:
         availability = "Available" if self.__availability_status else "Occupied"
         return f"Room {self.__room_number}: {self.__room_type}, Price: ${self.__price_per_night}/night, Status: {availability}"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the room's state as a flat tuple for persistence; amenities are JSON-encoded."""
+        return (self.__room_number, self.__room_type, json.dumps(self.get_amenities()), self.__price_per_night, self.__availability_status)
+
+    @classmethod
+    def from_record(cls, record: tuple) -> "Room":
+        """Rebuilds a room from to_record() output."""
+        room_number, room_type, amenities, price_per_night, availability_status = record
+        return cls(room_number, room_type, json.loads(amenities), price_per_night, bool(availability_status))
+
 
 # Example Usage
 room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
@@ -437,6 +2120,7 @@ room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
 print(room1.get_room_number())  # Output: 101
 print(room1.get_room_type())  # Output: Suite
 print(room1.get_amenities())  # Output: ['Wi-Fi', 'TV', 'Mini-Bar']
+print(room1.has_amenities(Room.amenity_registry.mask_of(["Wi-Fi", "TV"])))  # Output: True
 print(room1.get_price())  # Output: 150.0
 print(room1.check_availability())  # Output: True
 
@@ -450,14 +2134,609 @@ room1.update_status(False)  # Mark room as occupied
 # Printing Updated Room Info
 print(room1)  # Output: Room 202: Deluxe Suite, Price: $200.0/night, Status: Occupied
 
+
+# RoomCatalog class
+class RoomCatalog:
+    """
+    A collection of Room objects indexed by type, price and amenity for multi-attribute searches.
+
+    Every room gets a dense slot number. Room types, amenities and the available flag are kept as
+    bitsets over slots (Python ints), prices as a sorted list with parallel slots, so a query such
+    as "available Suites up to $300 with Jacuzzi and Wi-Fi" is a few integer ANDs plus one bisected
+    price range. The catalog observes Room changes (Room.observers) to keep its indexes current.
+    """
+
+    BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))  # Set bit positions per byte value
+
+    def __init__(self, rooms=()):
+        """Initializes the catalog, optionally with an iterable of rooms."""
+        self.__rooms = []  # slot -> Room, None for free slots
+        self.__room_slots = {}  # Room -> slot
+        self.__free_slots = []
+        self.__all_bits = 0
+        self.__type_bits = {}  # room_type -> bitset of slots
+        self.__amenity_bits = {}  # amenity -> bitset of slots
+        self.__available_bits = 0
+        self.__prices = []  # Sorted prices
+        self.__price_slots = []  # Slots parallel to __prices
+        self.__bulk_pricing = False  # Set while set_type_price updates rooms, which re-indexes prices once itself
+        Room.observers.add(self)
+        self.add_rooms(rooms)
+
+    def __len__(self) -> int:
+        """Returns the number of rooms in the catalog."""
+        return len(self.__room_slots)
+
+    def __contains__(self, room: "Room") -> bool:
+        """Returns True if the room is in the catalog."""
+        return room in self.__room_slots
+
+    def __iter__(self):
+        """Iterates over the rooms in slot order."""
+        return (room for room in self.__rooms if room is not None)
+
+    # Bitset helpers
+    @staticmethod
+    def __to_bits(slots) -> int:
+        """Builds a bitset from slot numbers in one pass."""
+        slots = list(slots)
+        if not slots:
+            return 0
+        buffer = bytearray(max(slots) // 8 + 1)
+        for slot in slots:
+            buffer[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(buffer, "little")
+
+    @staticmethod
+    def __from_bits(bits: int) -> list:
+        """Returns the slot numbers set in a bitset, in ascending order."""
+        slots = []
+        byte_bits = RoomCatalog.BYTE_BITS
+        for index, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, "little")):
+            if byte:
+                base = index * 8
+                slots.extend(base + bit for bit in byte_bits[byte])
+        return slots
+
+    # Adding and removing rooms
+    def add_rooms(self, rooms) -> int:
+        """Adds rooms (ignoring ones already present) and returns how many were added."""
+        added = []
+        for room in rooms:
+            if room in self.__room_slots:
+                continue
+            slot = self.__free_slots.pop() if self.__free_slots else len(self.__rooms)
+            if slot == len(self.__rooms):
+                self.__rooms.append(room)
+            else:
+                self.__rooms[slot] = room
+            self.__room_slots[room] = slot
+            added.append((slot, room))
+        if not added:
+            return 0
+        by_type = {}
+        by_amenity = {}
+        available = []
+        for slot, room in added:
+            by_type.setdefault(room.get_room_type(), []).append(slot)
+            for amenity in room.get_amenities():
+                by_amenity.setdefault(amenity, []).append(slot)
+            if room.check_availability():
+                available.append(slot)
+        self.__all_bits |= RoomCatalog.__to_bits(slot for slot, _ in added)
+        for room_type, slots in by_type.items():
+            self.__type_bits[room_type] = self.__type_bits.get(room_type, 0) | RoomCatalog.__to_bits(slots)
+        for amenity, slots in by_amenity.items():
+            self.__amenity_bits[amenity] = self.__amenity_bits.get(amenity, 0) | RoomCatalog.__to_bits(slots)
+        self.__available_bits |= RoomCatalog.__to_bits(available)
+        if len(added) == 1:
+            self.__insert_price(added[0][1].get_price(), added[0][0])
+        else:
+            pairs = sorted(zip(self.__prices + [room.get_price() for _, room in added], self.__price_slots + [slot for slot, _ in added]))
+            self.__prices = [price for price, _ in pairs]
+            self.__price_slots = [slot for _, slot in pairs]
+        return len(added)
+
+    def add_room(self, room: "Room") -> bool:
+        """Adds a room; returns False if it was already in the catalog."""
+        return self.add_rooms((room,)) == 1
+
+    def remove_room(self, room: "Room") -> bool:
+        """Removes a room; returns False if it was not in the catalog."""
+        slot = self.__room_slots.pop(room, None)
+        if slot is None:
+            return False
+        clear = ~(1 << slot)
+        self.__all_bits &= clear
+        self.__available_bits &= clear
+        self.__type_bits[room.get_room_type()] &= clear
+        for amenity in room.get_amenities():
+            self.__amenity_bits[amenity] &= clear
+        self.__remove_price(room.get_price(), slot)
+        self.__rooms[slot] = None
+        self.__free_slots.append(slot)
+        return True
+
+    # Price index maintenance
+    def __insert_price(self, price: float, slot: int) -> None:
+        """Inserts a slot into the sorted price index."""
+        position = bisect_right(self.__prices, price)
+        self.__prices.insert(position, price)
+        self.__price_slots.insert(position, slot)
+
+    def __remove_price(self, price: float, slot: int) -> None:
+        """Removes a slot from the sorted price index."""
+        for position in range(bisect_left(self.__prices, price), bisect_right(self.__prices, price)):
+            if self.__price_slots[position] == slot:
+                del self.__prices[position]
+                del self.__price_slots[position]
+                return
+
+    def room_changed(self, room: "Room", field: str, old_value, new_value) -> None:
+        """Keeps the indexes current when a cataloged room changes (called through Room.observers)."""
+        slot = self.__room_slots.get(room)
+        if slot is None:
+            return
+        bit = 1 << slot
+        if field == "room_type":
+            self.__type_bits[old_value] &= ~bit
+            self.__type_bits[new_value] = self.__type_bits.get(new_value, 0) | bit
+        elif field == "amenities":
+            if old_value is not None:
+                self.__amenity_bits[old_value] &= ~bit
+            if new_value is not None:
+                self.__amenity_bits[new_value] = self.__amenity_bits.get(new_value, 0) | bit
+        elif field == "availability_status":
+            self.__available_bits = self.__available_bits | bit if new_value else self.__available_bits & ~bit
+        elif field == "price" and not self.__bulk_pricing:
+            self.__remove_price(old_value, slot)
+            self.__insert_price(new_value, slot)
+
+    def detach(self) -> None:
+        """Stops observing Room changes, e.g. before the catalog is discarded; its indexes stop tracking room updates."""
+        Room.observers.discard(self)
+
+    # Queries
+    def find_rooms(self, room_type: str = None, min_price: float = None, max_price: float = None, amenities=(),
+                   available: bool = False, check_in=None, check_out=None) -> list:
+        """
+        Returns the rooms matching every given criterion, in catalog order.
+
+        :param room_type: Only rooms of this type.
+        :param min_price: Lowest nightly price (inclusive).
+        :param max_price: Highest nightly price (inclusive).
+        :param amenities: Amenities every room must have.
+        :param available: Only rooms whose availability status is True.
+        :param check_in: With check_out, only rooms with no confirmed stay overlapping the dates.
+        :param check_out: Check-out date (YYYY-MM-DD string or day ordinal), exclusive.
+        """
+        bits = self.__all_bits
+        if room_type is not None:
+            bits &= self.__type_bits.get(room_type, 0)
+        for amenity in amenities:
+            bits &= self.__amenity_bits.get(amenity, 0)
+        if available:
+            bits &= self.__available_bits
+        rooms = None
+        if bits and (min_price is not None or max_price is not None):
+            first = bisect_left(self.__prices, min_price) if min_price is not None else 0
+            last = bisect_right(self.__prices, max_price) if max_price is not None else len(self.__prices)
+            if bin(bits).count("1") < last - first:
+                # Fewer candidates than rooms in the price band: check their prices directly
+                low = min_price if min_price is not None else float("-inf")
+                high = max_price if max_price is not None else float("inf")
+                rooms = [room for room in map(self.__rooms.__getitem__, RoomCatalog.__from_bits(bits)) if low <= room.get_price() <= high]
+            else:
+                bits &= RoomCatalog.__to_bits(self.__price_slots[first:last])
+        if rooms is None:
+            rooms = [self.__rooms[slot] for slot in RoomCatalog.__from_bits(bits)]
+        if check_in is not None and check_out is not None:
+            check_in, check_out = to_ordinal(check_in), to_ordinal(check_out)
+            index = Room.availability_index
+            rooms = [room for room in rooms if index.is_room_free(room, check_in, check_out)]
+        return rooms
+
+    def count_by_type(self) -> dict:
+        """Returns the number of rooms per room type."""
+        return {room_type: bin(bits).count("1") for room_type, bits in self.__type_bits.items() if bits}
+
+    def get_price_range(self, room_type: str = None) -> tuple:
+        """Returns the (lowest, highest) nightly price, optionally for one room type; (None, None) if there are no rooms."""
+        if room_type is None:
+            return (self.__prices[0], self.__prices[-1]) if self.__prices else (None, None)
+        prices = [self.__rooms[slot].get_price() for slot in RoomCatalog.__from_bits(self.__type_bits.get(room_type, 0))]
+        return (min(prices), max(prices)) if prices else (None, None)
+
+    # Bulk updates
+    def set_type_price(self, room_type: str, new_price: float) -> int:
+        """
+        Sets the nightly price of every cataloged room of a type and returns how many rooms changed.
+
+        Rooms are updated without per-room index maintenance and the price index is rebuilt in a
+        single pass afterwards.
+        """
+        slots = RoomCatalog.__from_bits(self.__type_bits.get(room_type, 0))
+        if not slots:
+            return 0
+        self.__bulk_pricing = True
+        try:
+            for slot in slots:
+                self.__rooms[slot].update_price(new_price)
+        finally:
+            self.__bulk_pricing = False
+        changed = set(slots)
+        kept = [(price, slot) for price, slot in zip(self.__prices, self.__price_slots) if slot not in changed]
+        position = bisect_right(kept, (new_price, float("inf")))
+        kept[position:position] = [(new_price, slot) for slot in slots]
+        self.__prices = [price for price, _ in kept]
+        self.__price_slots = [slot for _, slot in kept]
+        return len(slots)
+
+
+# Example Usage
+catalog = RoomCatalog([
+    Room(701, "Junior Suite", ["Wi-Fi", "Jacuzzi"], 280.0),
+    Room(702, "Junior Suite", ["Wi-Fi"], 260.0),
+    Room(703, "Junior Suite", ["Wi-Fi", "Jacuzzi"], 340.0),
+    Room(704, "Double", ["Wi-Fi", "Jacuzzi"], 180.0),
+])
+print([room.get_room_number() for room in catalog.find_rooms("Junior Suite", max_price=300.0, amenities=("Jacuzzi", "Wi-Fi"), available=True)])  # Output: [701]
+print(catalog.set_type_price("Junior Suite", 250.0))  # Output: 3
+print([room.get_room_number() for room in catalog.find_rooms("Junior Suite", max_price=300.0, amenities=("Jacuzzi", "Wi-Fi"), available=True)])  # Output: [701, 703]
+catalog.detach()
+
+
+# PricingEngine class
+class PricingEngine:
+    """
+    Turns a room's base price into nightly rates using seasonal rules and an occupancy forecast.
+
+    Rates are precomputed into one table per room type, base price and calendar year (an array of
+    nightly rates) and reused by every quote until a rule, forecast or room price changes; the engine
+    observes Room.update_price (and with it Admin.change_room_prices) through Room.observers. Room
+    types with no rules skip the tables entirely and quote nights * price, exactly as
+    BulkPricing.total_costs does.
+    """
+
+    OCCUPANCY_BANDS = ((0.9, 1.25), (0.75, 1.1))  # (minimum forecast occupancy, rate multiplier), highest band first
+
+    def __init__(self, max_tables: int = 4096):
+        """
+        Initializes an engine without rules.
+
+        :param max_tables: Cached rate tables kept before the cache is cleared.
+        """
+        self.__seasonal_rules = []  # (first night ordinal, end ordinal exclusive, multiplier, room_type or None for all)
+        self.__occupancy = {}  # room_type -> {night ordinal: forecast occupancy 0-1}
+        self.__ruled_types = set()  # Room types with at least one rule or forecast
+        self.__rules_for_all = False  # True once a seasonal rule applies to every room type
+        self.__tables = {}  # room_type -> {(base_price, year): array of nightly rates}
+        self.__table_count = 0
+        self.__max_tables = max_tables
+        self.__builds = 0
+        self.__hits = 0
+        Room.observers.add(self)
+
+    # Rules
+    def add_seasonal_rule(self, start, end, multiplier: float, room_type: str = None) -> None:
+        """
+        Multiplies nightly rates from start up to (not including) end.
+
+        :param start: First night (YYYY-MM-DD string or day ordinal).
+        :param end: Night after the last one affected.
+        :param multiplier: Rate factor, e.g. 1.3 for high season or 0.8 for low season.
+        :param room_type: Only this room type; None applies the rule to every type.
+        """
+        self.__seasonal_rules.append((to_ordinal(start), to_ordinal(end), multiplier, room_type))
+        if room_type is None:
+            self.__rules_for_all = True
+        else:
+            self.__ruled_types.add(room_type)
+        self.invalidate(room_type)
+
+    def set_occupancy_forecast(self, room_type: str, start, occupancies) -> None:
+        """
+        Records forecast occupancy (0-1) for consecutive nights starting at start.
+
+        Nights at or above an OCCUPANCY_BANDS threshold get that band's multiplier on top of seasonal rules.
+        """
+        forecast = self.__occupancy.setdefault(room_type, {})
+        for night, occupancy in enumerate(occupancies, to_ordinal(start)):
+            forecast[night] = occupancy
+        self.__ruled_types.add(room_type)
+        self.invalidate(room_type)
+
+    def clear_rules(self) -> None:
+        """Removes every seasonal rule and forecast."""
+        self.__seasonal_rules.clear()
+        self.__occupancy.clear()
+        self.__ruled_types.clear()
+        self.__rules_for_all = False
+        self.invalidate()
+
+    def has_rules(self, room_type: str) -> bool:
+        """Returns True if any rule or forecast affects the room type."""
+        return self.__rules_for_all or room_type in self.__ruled_types
+
+    # Rate tables
+    def invalidate(self, room_type: str = None) -> None:
+        """Drops the cached rate tables of one room type, or of every type."""
+        if room_type is None:
+            self.__tables.clear()
+            self.__table_count = 0
+        else:
+            self.__table_count -= len(self.__tables.pop(room_type, ()))
+
+    def room_changed(self, room: "Room", field: str, old_value, new_value) -> None:
+        """Invalidates the room type's tables when a room price changes (called through Room.observers)."""
+        if field == "price" and self.has_rules(room.get_room_type()):
+            self.invalidate(room.get_room_type())
+
+    def detach(self) -> None:
+        """Stops observing Room changes, e.g. before the engine is discarded; price changes no longer invalidate its tables."""
+        Room.observers.discard(self)
+
+    def rate_table(self, room_type: str, base_price: float, year: int) -> array:
+        """Returns the nightly rates of a room type and base price for every night of a calendar year."""
+        tables = self.__tables.setdefault(room_type, {})
+        table = tables.get((base_price, year))
+        if table is not None:
+            self.__hits += 1
+            return table
+        first = date(year, 1, 1).toordinal()
+        days = date(year + 1, 1, 1).toordinal() - first
+        table = array("d", [base_price]) * days
+        for start, end, multiplier, rule_type in self.__seasonal_rules:
+            if rule_type is not None and rule_type != room_type:
+                continue
+            for night in range(max(start, first) - first, min(end, first + days) - first):
+                table[night] *= multiplier
+        for night, occupancy in self.__occupancy.get(room_type, {}).items():
+            if first <= night < first + days:
+                for threshold, multiplier in PricingEngine.OCCUPANCY_BANDS:
+                    if occupancy >= threshold:
+                        table[night - first] *= multiplier
+                        break
+        if self.__table_count >= self.__max_tables:
+            self.invalidate()
+            tables = self.__tables.setdefault(room_type, {})
+        tables[(base_price, year)] = table
+        self.__table_count += 1
+        self.__builds += 1
+        return table
+
+    def nightly_rates(self, room_type: str, base_price: float, check_in, check_out) -> list:
+        """Returns the rate for each night in [check_in, check_out)."""
+        check_in = to_ordinal(check_in)
+        check_out = to_ordinal(check_out)
+        if not self.has_rules(room_type):
+            return [base_price] * max(check_out - check_in, 0)
+        rates = []
+        night = check_in
+        while night < check_out:
+            year = date.fromordinal(night).year
+            first = date(year, 1, 1).toordinal()
+            stop = min(check_out, date(year + 1, 1, 1).toordinal())
+            rates.extend(self.rate_table(room_type, base_price, year)[night - first:stop - first])
+            night = stop
+        return rates
+
+    def quote(self, room_type: str, base_price: float, check_in, check_out) -> float:
+        """Returns the total for a stay: nights * base_price without rules, otherwise the sum of the nightly rates."""
+        if not self.has_rules(room_type):
+            return (to_ordinal(check_out) - to_ordinal(check_in)) * base_price
+        return sum(self.nightly_rates(room_type, base_price, check_in, check_out))
+
+    def get_stats(self) -> dict:
+        """Returns the cached table count, table builds and table cache hits."""
+        return {"tables": self.__table_count, "builds": self.__builds, "hits": self.__hits}
+
+
+# Example Usage
+pricing = PricingEngine()
+print(pricing.quote("Suite", 200.0, "2025-12-20", "2025-12-23"))  # Output: 600.0
+pricing.add_seasonal_rule("2025-12-22", "2026-01-02", 1.5, "Suite")
+pricing.set_occupancy_forecast("Suite", "2025-12-20", [0.95])
+print(pricing.nightly_rates("Suite", 200.0, "2025-12-20", "2025-12-23"))  # Output: [250.0, 200.0, 300.0]
+pricing.detach()
+
  
+# LoyaltyLedger class
+class LoyaltyLedger:
+    """
+    Records every loyalty points movement (join bonus, accrual, redemption, adjustment, and the
+    opening balance of a guest loaded from storage) per guest.
+
+    Guests get a dense slot on first use; balances live in a typed array indexed by slot, so
+    reading or updating a balance is O(1). Entries are stored column by column (slot, signed
+    points, kind, and the index of the same guest's previous entry), which gives each guest a
+    compact linked history without a per-guest list. Balances can be recomputed from the entries
+    in one vectorized pass (NumPy when installed) to detect and repair drift.
+    """
+
+    KINDS = ("join_bonus", "accrual", "redemption", "adjustment", "opening")
+    POINTS_PER_DOLLAR = 0.1  # 1 point per $10 spent
+
+    def __init__(self):
+        """Initializes an empty ledger."""
+        self.__guest_slots = {}  # guest_id -> slot
+        self.__guest_ids = array("q")  # slot -> guest_id
+        self.__balances = array("q")  # slot -> current balance
+        self.__last_entry = array("q")  # slot -> index of the guest's newest entry, -1 if none
+        self.__entry_slots = array("q")
+        self.__entry_points = array("q")  # Signed: redemptions are negative
+        self.__entry_kinds = array("b")  # Index into KINDS
+        self.__entry_previous = array("q")  # Index of the same guest's previous entry, -1 if none
+        self.__accrued_payments = set()  # Payment IDs already turned into points
+
+    def __slot(self, guest_id: int) -> int:
+        """Returns the guest's slot, assigning one on first use."""
+        slot = self.__guest_slots.get(guest_id)
+        if slot is None:
+            slot = len(self.__guest_ids)
+            self.__guest_slots[guest_id] = slot
+            self.__guest_ids.append(guest_id)
+            self.__balances.append(0)
+            self.__last_entry.append(-1)
+        return slot
+
+    def __append_entry(self, slot: int, points: int, kind: str) -> None:
+        """Appends one entry and links it into the guest's history."""
+        self.__entry_previous.append(self.__last_entry[slot])
+        self.__last_entry[slot] = len(self.__entry_slots)
+        self.__entry_slots.append(slot)
+        self.__entry_points.append(points)
+        self.__entry_kinds.append(LoyaltyLedger.KINDS.index(kind))
+
+    # Balances
+    def get_balance(self, guest_id: int) -> int:
+        """Returns the guest's current points balance (0 for unknown guests)."""
+        slot = self.__guest_slots.get(guest_id)
+        return self.__balances[slot] if slot is not None else 0
+
+    def record(self, guest_id: int, points: int, kind: str) -> int:
+        """
+        Records a points movement and returns the new balance.
+
+        :param points: Signed number of points (negative for redemptions).
+        :param kind: One of KINDS.
+        """
+        slot = self.__slot(guest_id)
+        self.__append_entry(slot, points, kind)
+        self.__balances[slot] += points
+        return self.__balances[slot]
+
+    def set_balance(self, guest_id: int, points: int) -> int:
+        """Records an adjustment so the guest's balance equals points."""
+        difference = points - self.get_balance(guest_id)
+        if difference:
+            return self.record(guest_id, difference, "adjustment")
+        return points
+
+    def open_balance(self, guest_id: int, points: int) -> int:
+        """
+        Records a saved balance as the guest's "opening" entry if the ledger does not know the guest
+        yet, and returns the guest's balance. A known guest is left alone, so loading the same guests
+        again neither adds entries nor overwrites newer balances with saved ones.
+        """
+        if guest_id in self.__guest_slots:
+            return self.get_balance(guest_id)
+        return self.record(guest_id, points, "opening") if points else self.__balances[self.__slot(guest_id)]
+
+    @staticmethod
+    def points_for(amount_spent: float) -> int:
+        """Returns the points earned for an amount spent."""
+        return int(amount_spent * LoyaltyLedger.POINTS_PER_DOLLAR)
+
+    def accrue_payments(self, payments) -> int:
+        """
+        Accrues points for a batch of completed payments.
+
+        Payments that are not Completed, have no booking, or were already accrued are skipped, so
+        the same batch can safely be fed in again. Emits one "loyalty.earned" event per guest.
+
+        :return: Number of payments accrued.
+        """
+        accrued = self.__accrued_payments
+        slots = []
+        amounts = []
+        for payment in payments:
+            booking = payment.get_booking()
+            payment_id = payment.get_payment_id()
+            if payment.get_payment_status() != "Completed" or booking is None or payment_id in accrued:
+                continue
+            accrued.add(payment_id)
+            slots.append(self.__slot(booking.get_guest().get_guest_id()))
+            amounts.append(payment.get_amount())
+        if not slots:
+            return 0
+        accrual = LoyaltyLedger.KINDS.index("accrual")
+        first_entry = len(self.__entry_slots)
+        last_entry = self.__last_entry
+        previous = self.__entry_previous
+        if np is not None:
+            points = np.trunc(np.array(amounts) * LoyaltyLedger.POINTS_PER_DOLLAR).astype(np.int64)
+            self.__entry_points.frombytes(points.tobytes())
+            np.add.at(np.frombuffer(self.__balances, dtype=np.int64), np.array(slots, dtype=np.int64), points)
+            points = points.tolist()
+        else:
+            points = [LoyaltyLedger.points_for(amount) for amount in amounts]
+            self.__entry_points.extend(points)
+            balances = self.__balances
+            for slot, earned in zip(slots, points):
+                balances[slot] += earned
+        for entry, slot in enumerate(slots, first_entry):
+            previous.append(last_entry[slot])
+            last_entry[slot] = entry
+        self.__entry_slots.extend(slots)
+        self.__entry_kinds.extend([accrual] * len(slots))
+        if EventLog.sink is not None:
+            earned_by_slot = {}
+            for slot, earned in zip(slots, points):
+                earned_by_slot[slot] = earned_by_slot.get(slot, 0) + earned
+            for slot, earned in earned_by_slot.items():
+                EventLog.emit("loyalty.earned", "You earned {points} loyalty points! Total: {total} points.",
+                              guest_id=self.__guest_ids[slot], points=earned, total=self.__balances[slot])
+        return len(slots)
+
+    def recompute_balances(self) -> int:
+        """
+        Rebuilds every balance from the entries in one pass and returns how many balances changed.
+        """
+        guests = len(self.__guest_ids)
+        if np is not None:
+            totals = np.zeros(guests, dtype=np.int64)
+            if self.__entry_slots:
+                # bincount sums in float64, which is exact while a guest's total stays below 2**53 points
+                totals = np.rint(np.bincount(np.frombuffer(self.__entry_slots, dtype=np.int64),
+                                             weights=np.frombuffer(self.__entry_points, dtype=np.int64), minlength=guests)).astype(np.int64)
+            current = np.frombuffer(self.__balances, dtype=np.int64)
+            changed = int(np.count_nonzero(current != totals))
+            current[:] = totals
+            return changed
+        totals = [0] * guests
+        for slot, points in zip(self.__entry_slots, self.__entry_points):
+            totals[slot] += points
+        changed = sum(1 for before, after in zip(self.__balances, totals) if before != after)
+        self.__balances = array("q", totals)
+        return changed
+
+    # History
+    def get_history(self, guest_id: int, limit: int = None) -> list:
+        """Returns the guest's entries as (kind, points) tuples, newest first."""
+        slot = self.__guest_slots.get(guest_id)
+        history = []
+        entry = self.__last_entry[slot] if slot is not None else -1
+        while entry >= 0 and (limit is None or len(history) < limit):
+            history.append((LoyaltyLedger.KINDS[self.__entry_kinds[entry]], self.__entry_points[entry]))
+            entry = self.__entry_previous[entry]
+        return history
+
+    def get_entry_count(self) -> int:
+        """Returns the number of recorded entries."""
+        return len(self.__entry_slots)
+
+    def get_guest_count(self) -> int:
+        """Returns the number of guests with a balance slot."""
+        return len(self.__guest_ids)
+
+    def get_memory_usage(self) -> int:
+        """Returns the bytes held by the balance and entry arrays (excluding the guest-to-slot dict)."""
+        columns = (self.__guest_ids, self.__balances, self.__last_entry, self.__entry_slots, self.__entry_points, self.__entry_kinds, self.__entry_previous)
+        return sum(column.buffer_info()[1] * column.itemsize for column in columns)
+
+
  # guest class
 class Guest:
     """
     Represents a guest with personal details and loyalty program status.
     """
 
-    def __init__(self, guest_id: int, name: str, contact_info: str, loyalty_status: bool = False):
+    __slots__ = ("__guest_id", "__name", "__contact_info", "__loyalty_status", "__reservation_history", "__ledger")
+
+    loyalty_ledger = LoyaltyLedger()  # The hotel's ledger, used by guests created without their own
+
+    def __init__(self, guest_id: int, name: str, contact_info: str, loyalty_status: bool = False, ledger: "LoyaltyLedger" = None):
         """
         Initializes a Guest object.
         
@@ -466,13 +2745,15 @@ class Guest:
         - name (str): Guest's full name.
         - contact_info (str): Guest's contact details.
         - loyalty_status (bool): Whether the guest is enrolled in the loyalty program.
+        - ledger (LoyaltyLedger): Ledger holding the guest's points; defaults to Guest.loyalty_ledger.
+          Guest IDs are only unique within one ledger, so each hotel should use its own.
         """
         self.__guest_id = guest_id
         self.__name = name
         self.__contact_info = contact_info
         self.__loyalty_status = loyalty_status
-        self.__loyalty_points = 0  # Start with 0 points
-        self.__reservation_history = []  # List of booking IDs
+        self.__ledger = ledger if ledger is not None else Guest.loyalty_ledger
+        self.__reservation_history = {}  # booking_id -> Booking (None if only the ID is known), in booking order
 
     # Getter and Setter for guest_id
     def get_guest_id(self) -> int:
@@ -510,43 +2791,79 @@ class Guest:
         """Updates the guest's loyalty program enrollment status."""
         self.__loyalty_status = status
 
-    # Getter for reservation history
+    def get_ledger(self) -> "LoyaltyLedger":
+        """Returns the ledger holding the guest's loyalty points."""
+        return self.__ledger
+
+    # Getters for reservation history
     def get_reservation_history(self) -> list:
-        """Returns the guest's reservation history."""
-        return self.__reservation_history
+        """Returns the booking IDs in the guest's reservation history, oldest first."""
+        return list(self.__reservation_history)
+
+    def has_reservation(self, booking_id: int) -> bool:
+        """Returns True if the booking is in the guest's reservation history."""
+        return booking_id in self.__reservation_history
+
+    def get_reservation(self, booking_id: int) -> "Booking":
+        """Returns the Booking for a reservation (None if unknown or only its ID was recorded)."""
+        return self.__reservation_history.get(booking_id)
+
+    def get_reservation_count(self) -> int:
+        """Returns the number of reservations in the history."""
+        return len(self.__reservation_history)
+
+    def iter_reservation_pages(self, page_size: int = 50, newest_first: bool = True):
+        """
+        Lazily yields the reservation history in pages of (booking_id, Booking) pairs.
+
+        Only the requested pages are materialized, so large corporate histories can be browsed
+        without copying them.
+        """
+        booking_ids = reversed(self.__reservation_history) if newest_first else iter(self.__reservation_history)
+        history = self.__reservation_history
+        page = []
+        for booking_id in booking_ids:
+            page.append((booking_id, history[booking_id]))
+            if len(page) == page_size:
+                yield page
+                page = []
+        if page:
+            yield page
 
     def create_account(self, name: str, contact_info: str) -> None:
         """Creates a guest account."""
         self.__name = name
         self.__contact_info = contact_info
-        print("Account created successfully.")
+        EventLog.emit("guest.account_created", "Account created successfully.", guest_id=self.__guest_id)
 
     def update_profile(self, new_name: str, new_contact: str) -> None:
         """Updates guest profile details."""
         self.__name = new_name
         self.__contact_info = new_contact
-        print("Profile updated successfully.")
+        EventLog.emit("guest.profile_updated", "Profile updated successfully.", guest_id=self.__guest_id)
 
     def join_loyalty_program(self) -> None:
         """Enrolls the guest in the loyalty program."""
         if not self.__loyalty_status:
             self.__loyalty_status = True
-            self.__loyalty_points = 50  # Give initial bonus points
-            print("Joined loyalty program successfully. Earned 50 points!")
+            points = self.__ledger.record(self.__guest_id, 50, "join_bonus")  # Give initial bonus points
+            EventLog.emit("guest.loyalty_joined", "Joined loyalty program successfully. Earned {points} points!", guest_id=self.__guest_id, points=points)
         else:
-            print("Already enrolled in the loyalty program.")
+            EventLog.emit("guest.loyalty_already_enrolled", "Already enrolled in the loyalty program.", guest_id=self.__guest_id)
 
-    def request_service(self, service: str) -> str:
-        """Requests an additional service for the stay."""
-        return f"Service request '{service}' has been placed."
+    def request_service(self, service: str, priority: int = 3) -> "ServiceRequest":
+        """Requests an additional service for the stay; the request is queued in Employee.dispatcher."""
+        return Employee.dispatcher.create_request(self.__guest_id, service, priority)
 
     def cancel_booking(self, booking_id: int) -> None:
         """Cancels a booking and removes it from the reservation history."""
         if booking_id in self.__reservation_history:
-            self.__reservation_history.remove(booking_id)
-            print(f"Booking {booking_id} has been canceled.")
+            booking = self.__reservation_history.pop(booking_id)
+            if booking is not None and booking.get_status() != "Cancelled":
+                booking.cancel_booking()
+            EventLog.emit("guest.booking_cancelled", "Booking {booking_id} has been canceled.", guest_id=self.__guest_id, booking_id=booking_id)
         else:
-            print(f"Booking {booking_id} not found.")
+            EventLog.emit("guest.booking_not_found", "Booking {booking_id} not found.", guest_id=self.__guest_id, booking_id=booking_id)
 
     def give_feedback(self, rating: int, comments: str) -> str:
         """Allows the guest to give feedback on their stay."""
@@ -554,7 +2871,11 @@ class Guest:
 
     def view_loyalty_points(self) -> int:
         """Returns the number of loyalty points the guest has."""
-        return self.__loyalty_points
+        return self.__ledger.get_balance(self.__guest_id)
+
+    def get_loyalty_history(self, limit: int = None) -> list:
+        """Returns the guest's loyalty entries as (kind, points) tuples, newest first."""
+        return self.__ledger.get_history(self.__guest_id, limit)
 
     def earn_loyalty_points(self, amount_spent: float) -> None:
         """
@@ -562,37 +2883,62 @@ class Guest:
         
         - Earn 1 point per $10 spent.
         """
-        points_earned = int(amount_spent / 10)
-        self.__loyalty_points += points_earned
-        print(f"You earned {points_earned} loyalty points! Total: {self.__loyalty_points} points.")
+        points_earned = LoyaltyLedger.points_for(amount_spent)
+        total = self.__ledger.record(self.__guest_id, points_earned, "accrual")
+        EventLog.emit("loyalty.earned", "You earned {points} loyalty points! Total: {total} points.", guest_id=self.__guest_id, points=points_earned, total=total)
 
     def redeem_loyalty_points(self, points: int) -> bool:
         """Redeems loyalty points if the guest has enough."""
-        if points > self.__loyalty_points:
-            print("Not enough loyalty points.")
+        if points > self.__ledger.get_balance(self.__guest_id):
+            EventLog.emit("loyalty.redeem_rejected", "Not enough loyalty points.", guest_id=self.__guest_id, points=points)
             return False
-        self.__loyalty_points -= points
-        print(f"{points} loyalty points redeemed successfully. Remaining: {self.__loyalty_points} points.")
+        total = self.__ledger.record(self.__guest_id, -points, "redemption")
+        EventLog.emit("loyalty.redeemed", "{points} loyalty points redeemed successfully. Remaining: {total} points.", guest_id=self.__guest_id, points=points, total=total)
         return True
 
-    def add_reservation(self, booking_id: int) -> None:
-        """Adds a booking ID to the guest's reservation history."""
-        self.__reservation_history.append(booking_id)
+    def add_reservation(self, booking_id: int, booking: "Booking" = None) -> None:
+        """Adds a booking to the guest's reservation history (Booking objects register themselves)."""
+        if booking is not None or booking_id not in self.__reservation_history:
+            self.__reservation_history[booking_id] = booking
+
+    def remove_reservation(self, booking_id: int) -> None:
+        """Removes a booking from the reservation history without cancelling it."""
+        self.__reservation_history.pop(booking_id, None)
 
     def view_invoice(self, booking_id: int) -> str:
         """Displays invoice details for a given booking."""
-        if booking_id in self.__reservation_history:
+        if booking_id not in self.__reservation_history:
+            return f"No invoice found for booking {booking_id}."
+        booking = self.__reservation_history[booking_id]
+        if booking is None:
             return f"Invoice for booking {booking_id} is available."
-        return f"No invoice found for booking {booking_id}."
+        room = booking.get_room()
+        return (f"Invoice for booking {booking_id}: Room {room.get_room_number()} ({room.get_room_type()}), "
+                f"{booking.get_check_in_date()} to {booking.get_check_out_date()}, {booking.get_num_nights()} nights x ${room.get_price()}, "
+                f"Total: ${booking.calculate_total_cost()}, Status: {booking.get_status()}")
 
     def __str__(self) -> str:
         """Returns a string representation of the Guest object."""
         loyalty = "Enrolled" if self.__loyalty_status else "Not Enrolled"
         return f"Guest(ID: {self.__guest_id}, Name: {self.__name}, Contact: {self.__contact_info}, Loyalty: {loyalty})"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the guest's state as a flat tuple for persistence (reservations are stored with the bookings)."""
+        return (self.__guest_id, self.__name, self.__contact_info, self.__loyalty_status, self.__ledger.get_balance(self.__guest_id))
+
+    @classmethod
+    def from_record(cls, record: tuple, ledger: "LoyaltyLedger" = None) -> "Guest":
+        """Rebuilds a guest from to_record() output; the saved points open its balance if the ledger does not know the guest yet."""
+        guest_id, name, contact_info, loyalty_status, loyalty_points = record
+        guest = cls(guest_id, name, contact_info, bool(loyalty_status), ledger)
+        guest.__ledger.open_balance(guest_id, loyalty_points)
+        return guest
 
-# Example Usage
-guest1 = Guest(301, "Alice Smith", "alice@email.com")
+
+# Example Usage (with a ledger of its own, so the demo's points stay out of Guest.loyalty_ledger)
+example_ledger = LoyaltyLedger()
+guest1 = Guest(301, "Alice Smith", "alice@email.com", ledger=example_ledger)
 
 # Testing Getter Methods
 print(guest1.get_name())  # Output: Alice Smith
@@ -607,6 +2953,8 @@ guest1.join_loyalty_program()
 
 # Adding a reservation
 guest1.add_reservation(5001)
+print(guest1.has_reservation(5001))  # Output: True
+print(next(guest1.iter_reservation_pages(page_size=10)))  # Output: [(5001, None)]
 
 # Printing Updated Guest Info
 print(guest1)  # Output: Guest(ID: 301, Name: Alice Johnson, Contact: newalice@email.com, Loyalty: Enrolled)
@@ -617,6 +2965,11 @@ class Booking:
     Represents a hotel booking with guest details, room assignment, and booking status.
     """
 
+    __slots__ = ("__booking_id", "__guest", "__room", "__check_in", "__check_out", "__num_nights", "__status", "__special_requests", "__discount")
+
+    pricing_engine = PricingEngine()  # Nightly rates for calculate_total_cost
+    observers = weakref.WeakSet()  # Objects notified through booking_changed(booking) when status, dates, room or discount change, e.g. OccupancyMetrics
+
     def __init__(self, booking_id: int, guest: "Guest", room: "Room", check_in_date: str, check_out_date: str, status: str = "Pending"):
         """
         Initializes a Booking instance.
@@ -627,144 +2980,1245 @@ class Booking:
         :param check_in_date: The check-in date in YYYY-MM-DD format.
         :param check_out_date: The check-out date in YYYY-MM-DD format.
         :param status: The booking status (e.g., Pending, Confirmed, Cancelled).
+        :raises ValueError: If a date is malformed or check-out is not after check-in.
         """
         self.__booking_id = booking_id
         self.__guest = guest
         self.__room = room
-        self.__check_in_date = check_in_date
-        self.__check_out_date = check_out_date
+        self.__set_stay_dates(check_in_date, check_out_date)
         self.__status = status
         self.__special_requests = []
+        self.__discount = 0.0  # Percentage taken off the room price, set by apply_discount
+        guest.add_reservation(booking_id, self)
+        if status == "Confirmed":
+            self.__sync_availability()
+        EventLog.emit("booking.created", "Booking {booking_id} created.", booking_id=booking_id, guest_id=guest.get_guest_id(), room_number=room.get_room_number(),
+                      check_in=self.__check_in, check_out=self.__check_out, status=status)
+
+    # Getter and Setter for booking_id
+    def get_booking_id(self) -> int:
+        """Returns the booking ID."""
+        return self.__booking_id
+
+    def set_booking_id(self, booking_id: int) -> None:
+        """Updates the booking ID."""
+        self.__booking_id = booking_id
+
+    # Getters for guest, room and stay dates
+    def get_guest(self) -> "Guest":
+        """Returns the guest associated with the booking."""
+        return self.__guest
+
+    def get_room(self) -> "Room":
+        """Returns the room assigned to the booking."""
+        return self.__room
+
+    def get_check_in_date(self) -> str:
+        """Returns the check-in date in YYYY-MM-DD format."""
+        return date.fromordinal(self.__check_in).isoformat()
+
+    def get_check_out_date(self) -> str:
+        """Returns the check-out date in YYYY-MM-DD format."""
+        return date.fromordinal(self.__check_out).isoformat()
+
+    def get_check_in_ordinal(self) -> int:
+        """Returns the check-in date as a day ordinal."""
+        return self.__check_in
+
+    def get_check_out_ordinal(self) -> int:
+        """Returns the check-out date as a day ordinal."""
+        return self.__check_out
+
+    def get_num_nights(self) -> int:
+        """Returns the number of nights in the stay."""
+        return self.__num_nights
+
+    def __set_stay_dates(self, check_in_date, check_out_date) -> None:
+        """
+        Parses and validates the stay dates once, storing them as day ordinals.
+
+        :raises ValueError: If a date is malformed or check-out is not after check-in.
+        """
+        check_in = to_ordinal(check_in_date)
+        check_out = to_ordinal(check_out_date)
+        if check_out <= check_in:
+            raise ValueError(f"Check-out date must be after check-in date (got {check_in_date} to {check_out_date}).")
+        self.__check_in = check_in
+        self.__check_out = check_out
+        self.__num_nights = check_out - check_in
+
+    # Getter and Setter for status
+    def get_status(self) -> str:
+        """Returns the current booking status."""
+        return self.__status
+
+    def set_status(self, status: str) -> None:
+        """Updates the booking status."""
+        self.__status = status
+        self.__sync_availability()
+
+    def __sync_availability(self) -> None:
+        """Keeps the shared availability index in line with the booking's status, room and dates."""
+        if self.__status == "Confirmed":
+            Room.availability_index.add_booking(self)
+        else:
+            Room.availability_index.remove_booking(self)
+        if Booking.observers:
+            self.__notify()
+
+    def __notify(self) -> None:
+        """Tells every observer that the booking changed."""
+        for observer in tuple(Booking.observers):
+            observer.booking_changed(self)
+
+    # Getter and Setter for special_requests
+    def get_special_requests(self) -> list:
+        """Returns the list of special requests made for the booking."""
+        return self.__special_requests
+
+    def add_special_request(self, request: str) -> None:
+        """Adds a special request for the booking."""
+        self.__special_requests.append(request)
+        EventLog.emit("booking.special_request_added", "Special request added: {request}", booking_id=self.__booking_id, request=request)
+
+    def confirm_booking(self) -> None:
+        """Confirms the booking by updating its status."""
+        self.__status = "Confirmed"
+        self.__sync_availability()
+        EventLog.emit("booking.confirmed", "Booking {booking_id} confirmed.", booking_id=self.__booking_id)
+
+    def cancel_booking(self) -> None:
+        """Cancels the booking by updating its status."""
+        self.__status = "Cancelled"
+        self.__sync_availability()
+        EventLog.emit("booking.cancelled", "Booking {booking_id} cancelled.", booking_id=self.__booking_id)
+
+    def modify_booking(self, new_dates: tuple) -> None:
+        """
+        Modifies the booking dates.
+
+        :param new_dates: A tuple containing (new_check_in_date, new_check_out_date).
+        """
+        self.__set_stay_dates(*new_dates)
+        self.__sync_availability()
+        EventLog.emit("booking.modified", "Booking {booking_id} modified to new dates: {new_dates}", booking_id=self.__booking_id, new_dates=new_dates, check_in=self.__check_in, check_out=self.__check_out)
+
+    def calculate_total_cost(self) -> float:
+        """
+        Calculates the total cost of the booking from the nightly rates of Booking.pricing_engine.
+
+        Without pricing rules for the room type this is nights * (discounted) room price.
+
+        :return: The total cost of the stay.
+        """
+        room = self.__room
+        price = room.calculate_discounted_price(self.__discount) if self.__discount else room.get_price()
+        engine = Booking.pricing_engine
+        if not engine.has_rules(room.get_room_type()):
+            return self.__num_nights * price
+        return engine.quote(room.get_room_type(), price, self.__check_in, self.__check_out)
+
+    def get_nightly_rates(self) -> list:
+        """Returns the rate of each night of the stay, in order; they sum to calculate_total_cost()."""
+        room = self.__room
+        price = room.calculate_discounted_price(self.__discount) if self.__discount else room.get_price()
+        return Booking.pricing_engine.nightly_rates(room.get_room_type(), price, self.__check_in, self.__check_out)
+
+    def get_discount(self) -> float:
+        """Returns the discount percentage applied to the room price."""
+        return self.__discount
+
+    def apply_discount(self, discount: float) -> None:
+        """
+        Applies a discount to the room price for this booking.
+
+        :param discount: The discount percentage (0-100).
+        """
+        self.__discount = discount
+        if Booking.observers:
+            self.__notify()
+        new_price = self.__room.calculate_discounted_price(discount)
+        EventLog.emit("booking.discount_applied", "Discount applied. New room price: {price}", booking_id=self.__booking_id, discount=discount, price=new_price)
+
+    def extend_booking(self, extra_days: int) -> None:
+        """
+        Extends the booking by a given number of days.
+
+        :param extra_days: The number of additional days to extend the booking.
+        """
+        self.__set_stay_dates(self.__check_in, self.__check_out + extra_days)
+        self.__sync_availability()
+        EventLog.emit("booking.extended", "Booking {booking_id} extended for {extra_days} extra days.", booking_id=self.__booking_id, extra_days=extra_days, check_out=self.__check_out)
+
+    def assign_room(self, room: "Room") -> None:
+        """
+        Assigns a new room to the booking.
+
+        :param room: The new Room object.
+        """
+        self.__room = room
+        self.__sync_availability()
+        EventLog.emit("booking.room_assigned", "Booking {booking_id} assigned to Room {room_number}", booking_id=self.__booking_id, room_number=room.get_room_number())
+
+    def change_guest_details(self, new_guest: "Guest") -> None:
+        """
+        Updates the guest details associated with the booking.
+
+        :param new_guest: The new Guest object.
+        """
+        self.__guest.remove_reservation(self.__booking_id)
+        self.__guest = new_guest
+        new_guest.add_reservation(self.__booking_id, self)
+        EventLog.emit("booking.guest_changed", "Guest details updated for Booking {booking_id}", booking_id=self.__booking_id, guest_id=new_guest.get_guest_id())
+
+    def notify_guest(self) -> None:
+        """Sends a notification to the guest about their booking."""
+        EventLog.emit("booking.guest_notified", "Notification sent to Guest {guest_name} for Booking {booking_id}", booking_id=self.__booking_id, guest_name=self.__guest.get_name())
+
+    def generate_booking_summary(self) -> str:
+        """Generates a summary of the booking details."""
+        return f"Booking {self.__booking_id}: Guest {self.__guest.get_name()}, Room {self.__room.get_room_number()}, Status: {self.__status}"
+
+    def __str__(self) -> str:
+        """Returns a string representation of the Booking object."""
+        return f"Booking ID: {self.__booking_id}, Guest: {self.__guest.get_name()}, Room: {self.__room.get_room_number()}, Status: {self.__status}"
+
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the booking as a flat tuple for persistence: IDs instead of objects, day ordinals, JSON requests."""
+        return (self.__booking_id, self.__guest.get_guest_id(), self.__room.get_room_number(), self.__check_in, self.__check_out, self.__status,
+                json.dumps(self.__special_requests), self.__discount)
+
+    @classmethod
+    def from_record(cls, record: tuple, guest: "Guest", room: "Room") -> "Booking":
+        """Rebuilds a booking from to_record() output and its already loaded guest and room."""
+        booking_id, _, _, check_in, check_out, status, special_requests, discount = record
+        booking = cls(booking_id, guest, room, check_in, check_out, status)
+        booking.__special_requests = json.loads(special_requests)
+        booking.__discount = discount
+        return booking
+
+
+# Example Usage
+guest1 = Guest(301, "Alice Smith", "alice@email.com")
+room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+
+booking1 = Booking(1001, guest1, room1, "2025-07-01", "2025-07-05")
+
+# Testing Getter Methods
+print(booking1.get_booking_id())  # Output: 1001
+print(booking1.get_status())  # Output: Pending
+print(booking1.get_special_requests())  # Output: []
+
+# Testing Setter Methods
+booking1.set_status("Confirmed")
+booking1.add_special_request("Extra towels")
+
+# Confirm Booking
+booking1.confirm_booking()
+
+# Testing total cost calculation
+print(f"Total Cost: ${booking1.calculate_total_cost()}")  # Output: Total Cost: $600.0
+
+# Printing Updated Booking Info
+print(booking1)  # Output: Booking ID: 1001, Guest: Alice Smith, Room: 101, Status: Confirmed
+print(guest1.view_invoice(1001))  # Output: Invoice for booking 1001: Room 101 (Suite), 2025-07-01 to 2025-07-05, 4 nights x $150.0, Total: $600.0, Status: Confirmed
+
+# Checking date-range availability against confirmed bookings
+print(room1.check_availability("2025-07-03", "2025-07-08"))  # Output: False
+print(room1.check_availability("2025-07-05", "2025-07-08"))  # Output: True
+print([room.get_room_number() for room in Room.availability_index.find_free_rooms("Suite", "2025-07-02", "2025-07-04")])  # Output: []
+
+# Stays spanning a month boundary are costed by night count
+long_stay = Booking(1002, guest1, Room(103, "Double", ["Wi-Fi"], 100.0), "2025-07-28", "2025-08-02")
+long_stay.extend_booking(3)
+print(long_stay.get_check_out_date(), long_stay.calculate_total_cost())  # Output: 2025-08-05 800.0
+
+
+# OccupancyMetrics class
+class OccupancyMetrics:
+    """
+    Per-night occupancy, ADR and RevPAR kept current as bookings and rooms change.
+
+    Confirmed bookings on tracked rooms add one room sold and that night's rate (get_nightly_rates(),
+    so seasonal and weekend pricing land on the nights they apply to) to every night of the stay;
+    any change reported through
+    Booking.observers first takes back the booking's previous contribution. Rooms available on a
+    night are the tracked rooms minus those scheduled for maintenance that night (Room.observers).
+    A room price change recounts that room's confirmed bookings. Pricing rule changes are not
+    observed; call refresh() after changing Booking.pricing_engine's rules so revenue follows them.
+    Reads are O(1) per night and O(days) for a range.
+    """
+
+    def __init__(self, rooms=(), bookings=()):
+        """
+        :param rooms: Rooms making up the inventory.
+        :param bookings: Existing bookings to count (only confirmed ones on tracked rooms are).
+        """
+        self.__rooms = set()
+        self.__sold = {}  # night ordinal -> rooms sold
+        self.__revenue = {}  # night ordinal -> room revenue
+        self.__out_of_order = {}  # night ordinal -> rooms under maintenance
+        self.__maintenance = {}  # room -> set of maintenance night ordinals
+        self.__bookings = {}  # booking -> (room, check_in, nightly rates) currently counted
+        self.__room_bookings = {}  # room -> set of bookings counted on it
+        for room in rooms:
+            self.add_room(room)
+        for booking in bookings:
+            self.booking_changed(booking)
+        Room.observers.add(self)
+        Booking.observers.add(self)
+
+    # Inventory
+    def add_room(self, room: "Room") -> None:
+        """Adds a room to the inventory."""
+        self.__rooms.add(room)
+
+    def remove_room(self, room: "Room") -> bool:
+        """Removes a room, its maintenance nights and its bookings' contributions; returns False if it was not tracked."""
+        if room not in self.__rooms:
+            return False
+        for night in self.__maintenance.pop(room, ()):
+            self.__out_of_order[night] -= 1
+        for booking in list(self.__room_bookings.get(room, ())):
+            self.__remove(booking)
+        self.__rooms.discard(room)
+        return True
+
+    def room_changed(self, room: "Room", field: str, old_value, new_value) -> None:
+        """Tracks maintenance nights and recounts bookings on price changes of inventory rooms (called through Room.observers)."""
+        if room not in self.__rooms:
+            return
+        if field == "price":
+            self.refresh(room)
+        elif field == "maintenance":
+            nights = self.__maintenance.setdefault(room, set())
+            if new_value is not None and new_value not in nights:
+                nights.add(new_value)
+                self.__out_of_order[new_value] = self.__out_of_order.get(new_value, 0) + 1
+            elif new_value is None and old_value in nights:
+                nights.discard(old_value)
+                self.__out_of_order[old_value] -= 1
+
+    def detach(self) -> None:
+        """Stops observing Room and Booking changes, e.g. before the metrics are discarded; they stop updating."""
+        Room.observers.discard(self)
+        Booking.observers.discard(self)
+
+    # Bookings
+    def refresh(self, room: "Room" = None) -> None:
+        """Recounts the confirmed bookings on one room, or on every room, at their current nightly rates."""
+        for booking in list(self.__room_bookings.get(room, ()) if room is not None else self.__bookings):
+            self.booking_changed(booking)
+
+    def booking_changed(self, booking: "Booking") -> None:
+        """Replaces a booking's contribution with its current one (called through Booking.observers)."""
+        self.__remove(booking)
+        if booking.get_status() != "Confirmed" or booking.get_room() not in self.__rooms:
+            return
+        room = booking.get_room()
+        check_in = booking.get_check_in_ordinal()
+        rates = booking.get_nightly_rates()
+        sold, revenue = self.__sold, self.__revenue
+        for night, rate in enumerate(rates, check_in):
+            sold[night] = sold.get(night, 0) + 1
+            revenue[night] = revenue.get(night, 0.0) + rate
+        self.__bookings[booking] = (room, check_in, rates)
+        self.__room_bookings.setdefault(room, set()).add(booking)
+
+    def __remove(self, booking: "Booking") -> None:
+        """Takes back a booking's counted contribution, if any."""
+        counted = self.__bookings.pop(booking, None)
+        if counted is None:
+            return
+        room, check_in, rates = counted
+        self.__room_bookings[room].discard(booking)
+        sold, revenue = self.__sold, self.__revenue
+        for night, rate in enumerate(rates, check_in):
+            sold[night] -= 1
+            revenue[night] -= rate
+
+    # Dashboard reads
+    def get_night(self, night) -> dict:
+        """Returns rooms available and sold, occupancy, ADR and RevPAR for one night (date or ordinal)."""
+        night = to_ordinal(night)
+        return self.__metrics(len(self.__rooms) - self.__out_of_order.get(night, 0), self.__sold.get(night, 0), self.__revenue.get(night, 0.0))
+
+    def get_range(self, start, end) -> dict:
+        """Returns the same metrics for the nights in [start, end), counting room-nights."""
+        available = sold = 0
+        revenue = 0.0
+        rooms = len(self.__rooms)
+        for night in range(to_ordinal(start), to_ordinal(end)):
+            available += rooms - self.__out_of_order.get(night, 0)
+            sold += self.__sold.get(night, 0)
+            revenue += self.__revenue.get(night, 0.0)
+        return self.__metrics(available, sold, revenue)
+
+    @staticmethod
+    def __metrics(available: int, sold: int, revenue: float) -> dict:
+        """Derives occupancy (sold / available), ADR (revenue / sold) and RevPAR (revenue / available)."""
+        return {
+            "rooms_available": available,
+            "rooms_sold": sold,
+            "occupancy": round(sold / available, 4) if available else 0.0,
+            "adr": round(revenue / sold, 2) if sold else 0.0,
+            "revpar": round(revenue / available, 2) if available else 0.0,
+        }
+
+
+# Example Usage
+metrics = OccupancyMetrics([room1, long_stay.get_room()], [booking1, long_stay])
+print(metrics.get_night("2025-07-02"))  # Output: {'rooms_available': 2, 'rooms_sold': 1, 'occupancy': 0.5, 'adr': 150.0, 'revpar': 75.0}
+long_stay.confirm_booking()
+room1.schedule_maintenance("2025-07-30")
+print(metrics.get_range("2025-07-28", "2025-08-01"))  # Output: {'rooms_available': 7, 'rooms_sold': 4, 'occupancy': 0.5714, 'adr': 100.0, 'revpar': 57.14}
+long_stay.cancel_booking()
+room1.release_room("2025-07-30")
+print(metrics.get_range("2025-07-28", "2025-08-01"))  # Output: {'rooms_available': 8, 'rooms_sold': 0, 'occupancy': 0.0, 'adr': 0.0, 'revpar': 0.0}
+metrics.detach()
+
+
+# ShiftScheduler class
+class ShiftScheduler:
+    """
+    Builds multi-week shift rosters that cover staffing demand derived from forecast occupancy.
+
+    Demand per role, day and shift is a minimum crew plus one person per ROLE_DEMAND occupied rooms,
+    scaled by SHIFT_WEIGHTS, with occupancy taken from confirmed bookings in the AvailabilityIndex.
+    Each employee works at most one shift a day and max_shifts_per_week shifts a week, never a
+    Morning right after a Night, and never on leave. solve() fills slots greedily (least-worked
+    eligible employee first) and then runs a local search that moves shifts from over-staffed slots
+    into short ones. Leave requests are checked against coverage incrementally: the affected shifts
+    are reassigned locally and the leave is refused if any of them cannot be covered.
+    """
+
+    SHIFTS = (("Morning", "7 AM - 3 PM"), ("Evening", "3 PM - 11 PM"), ("Night", "11 PM - 7 AM"))
+    SHIFT_WEIGHTS = (1.0, 0.7, 0.3)  # Share of a role's daytime demand needed on each shift
+    ROLE_DEMAND = {  # role -> (minimum per shift, occupied rooms per staff member)
+        "Housekeeping": (1, 12.0),
+        "Front Desk": (1, 40.0),
+        "Kitchen": (1, 30.0),
+        "Technician": (1, 80.0),
+        "Concierge": (0, 100.0),
+    }
+    OFF, MORNING, NIGHT = -1, 0, 2
+
+    def __init__(self, employees, start, weeks: int = 4, index: "AvailabilityIndex" = None, max_shifts_per_week: int = 5):
+        """
+        :param employees: Employee objects to schedule; roles missing from ROLE_DEMAND are never rostered.
+        :param start: First day of the roster (YYYY-MM-DD string or day ordinal).
+        :param weeks: Roster length in weeks.
+        :param index: Source of confirmed bookings (default: Room.availability_index).
+        :param max_shifts_per_week: Most shifts per employee per 7-day week.
+        """
+        self.__start = to_ordinal(start)
+        self.__days = weeks * 7
+        self.__index = index if index is not None else Room.availability_index
+        self.__max_shifts = max_shifts_per_week
+        self.__employees = {employee.get_employee_id(): employee for employee in employees}
+        self.__by_role = {}  # role -> list of employee IDs
+        for employee_id, employee in self.__employees.items():
+            self.__by_role.setdefault(employee.get_role(), []).append(employee_id)
+        self.__roster = {employee_id: [ShiftScheduler.OFF] * self.__days for employee_id in self.__employees}
+        self.__week_counts = {employee_id: [0] * weeks for employee_id in self.__employees}
+        self.__totals = dict.fromkeys(self.__employees, 0)
+        self.__leave = {employee_id: set() for employee_id in self.__employees}
+        self.__staffed = {}  # (role, day, shift) -> set of employee IDs
+        self.__required = {}  # (role, day, shift) -> staff needed
+        self.__journal = None  # (assigned, employee_id, role, day, shift) moves, recorded while a leave request is checked
+
+    # Demand
+    def forecast_demand(self) -> dict:
+        """Recomputes required staff per (role, day, shift) from confirmed bookings and returns it."""
+        occupancy = self.__index.occupancy_by_night(self.__start, self.__start + self.__days)
+        self.__required = {}
+        for role in self.__by_role:
+            if role not in ShiftScheduler.ROLE_DEMAND:
+                continue
+            minimum, rooms_per_staff = ShiftScheduler.ROLE_DEMAND[role]
+            for day, occupied in enumerate(occupancy):
+                for shift, weight in enumerate(ShiftScheduler.SHIFT_WEIGHTS):
+                    self.__required[(role, day, shift)] = max(minimum, math.ceil(occupied * weight / rooms_per_staff))
+        return self.__required
+
+    # Roster maintenance
+    def __can_work(self, employee_id: int, day: int, shift: int) -> bool:
+        """Checks the one-shift-a-day, weekly limit, rest and leave rules."""
+        roster = self.__roster[employee_id]
+        if roster[day] != ShiftScheduler.OFF or day in self.__leave[employee_id] or self.__week_counts[employee_id][day // 7] >= self.__max_shifts:
+            return False
+        if shift == ShiftScheduler.MORNING and day > 0 and roster[day - 1] == ShiftScheduler.NIGHT:
+            return False
+        if shift == ShiftScheduler.NIGHT and day + 1 < self.__days and roster[day + 1] == ShiftScheduler.MORNING:
+            return False
+        return True
+
+    def __assign(self, employee_id: int, role: str, day: int, shift: int) -> None:
+        """Puts an employee on a shift."""
+        self.__roster[employee_id][day] = shift
+        self.__week_counts[employee_id][day // 7] += 1
+        self.__totals[employee_id] += 1
+        self.__staffed.setdefault((role, day, shift), set()).add(employee_id)
+        if self.__journal is not None:
+            self.__journal.append((True, employee_id, role, day, shift))
+
+    def __unassign(self, employee_id: int, role: str, day: int) -> int:
+        """Takes an employee off their shift on a day and returns the shift."""
+        shift = self.__roster[employee_id][day]
+        self.__roster[employee_id][day] = ShiftScheduler.OFF
+        self.__week_counts[employee_id][day // 7] -= 1
+        self.__totals[employee_id] -= 1
+        self.__staffed[(role, day, shift)].discard(employee_id)
+        if self.__journal is not None:
+            self.__journal.append((False, employee_id, role, day, shift))
+        return shift
+
+    def __shortfall(self, slot: tuple) -> int:
+        """Returns how many more people a slot needs (negative when over-staffed)."""
+        return self.__required.get(slot, 0) - len(self.__staffed.get(slot, ()))
+
+    def __fill(self, role: str, day: int, shift: int, needed: int) -> int:
+        """Assigns up to needed eligible employees, least-worked first; returns how many were assigned."""
+        assigned = 0
+        for employee_id in sorted(self.__by_role.get(role, ()), key=self.__totals.__getitem__):
+            if assigned == needed:
+                break
+            if self.__can_work(employee_id, day, shift):
+                self.__assign(employee_id, role, day, shift)
+                assigned += 1
+        return assigned
+
+    def __repair(self, role: str, day: int, shift: int) -> bool:
+        """
+        Tries to add one person to a short slot by moving someone off an over-staffed slot of the
+        same role, first on the same day, then from another day of the same week.
+        """
+        week_start = day // 7 * 7
+        donor_days = [day] + [other for other in range(week_start, min(week_start + 7, self.__days)) if other != day]
+        for donor_day in donor_days:
+            for donor_shift in range(len(ShiftScheduler.SHIFTS)):
+                donor_slot = (role, donor_day, donor_shift)
+                if (donor_day, donor_shift) == (day, shift) or self.__shortfall(donor_slot) >= 0:
+                    continue
+                for employee_id in list(self.__staffed.get(donor_slot, ())):
+                    self.__unassign(employee_id, role, donor_day)
+                    if self.__can_work(employee_id, day, shift):
+                        self.__assign(employee_id, role, day, shift)
+                        return True
+                    self.__assign(employee_id, role, donor_day, donor_shift)
+        return False
+
+    def solve(self, max_passes: int = 5) -> dict:
+        """
+        Builds the roster from scratch: demand forecast, greedy fill, then local-search repairs.
+
+        :param max_passes: Local-search passes over the remaining short slots.
+        :return: {"required": total staff-shifts needed, "covered": staff-shifts filled, "shortfall": still missing}.
+        """
+        for employee_id in self.__roster:
+            self.__roster[employee_id] = [ShiftScheduler.OFF] * self.__days
+            self.__week_counts[employee_id] = [0] * (self.__days // 7)
+            self.__totals[employee_id] = 0
+        self.__staffed = {}
+        self.forecast_demand()
+        # Busiest slots first so scarce staff go where demand is highest
+        for role, day, shift in sorted(self.__required, key=lambda slot: -self.__required[slot]):
+            self.__fill(role, day, shift, self.__required[(role, day, shift)])
+        for _ in range(max_passes):
+            short = [slot for slot in self.__required if self.__shortfall(slot) > 0]
+            if not short:
+                break
+            improved = False
+            for role, day, shift in short:
+                while self.__shortfall((role, day, shift)) > 0 and self.__repair(role, day, shift):
+                    improved = True
+            if not improved:
+                break
+        return self.get_coverage()
+
+    # Queries
+    def get_coverage(self) -> dict:
+        """Returns total required and covered staff-shifts and the remaining shortfall."""
+        required = sum(self.__required.values())
+        shortfall = sum(max(self.__shortfall(slot), 0) for slot in self.__required)
+        return {"required": required, "covered": required - shortfall, "shortfall": shortfall}
+
+    def get_slot(self, role: str, day, shift: int) -> tuple:
+        """Returns (assigned, required) for a role on a day (date or ordinal) and shift index."""
+        slot = (role, to_ordinal(day) - self.__start, shift)
+        return len(self.__staffed.get(slot, ())), self.__required.get(slot, 0)
+
+    def get_schedule(self, employee_id: int) -> dict:
+        """Returns the employee's roster as {YYYY-MM-DD: "Shift 7 AM - 3 PM" or "Off-duty"/"On leave"}."""
+        roster = self.__roster.get(employee_id)
+        if roster is None:
+            return {}
+        schedule = {}
+        for day, shift in enumerate(roster):
+            if shift != ShiftScheduler.OFF:
+                label = f"{ShiftScheduler.SHIFTS[shift][0]} shift {ShiftScheduler.SHIFTS[shift][1]}"
+            else:
+                label = "On leave" if day in self.__leave[employee_id] else "Off-duty"
+            schedule[date.fromordinal(self.__start + day).isoformat()] = label
+        return schedule
+
+    def request_leave(self, employee_id: int, start, days: int) -> bool:
+        """
+        Grants leave if every shift it frees can still be covered; otherwise nothing changes.
+
+        Only the employee's own shifts in the leave period are reconsidered: each is dropped if the
+        slot is over-staffed, or handed to an eligible colleague (directly or through a same-week
+        move from an over-staffed slot), so the check costs a few slots rather than a re-solve.
+        """
+        if employee_id not in self.__roster:
+            return False
+        role = self.__employees[employee_id].get_role()
+        first = to_ordinal(start) - self.__start
+        leave_days = set(range(max(first, 0), min(first + days, self.__days)))
+        self.__journal = []
+        self.__leave[employee_id] |= leave_days  # Keeps the employee from being moved back in
+        granted = True
+        for day in sorted(leave_days):
+            shift = self.__roster[employee_id][day]
+            if shift == ShiftScheduler.OFF:
+                continue
+            self.__unassign(employee_id, role, day)
+            if self.__shortfall((role, day, shift)) > 0 and not (self.__fill(role, day, shift, 1) or self.__repair(role, day, shift)):
+                granted = False
+                break
+        journal, self.__journal = self.__journal, None
+        if not granted:
+            self.__leave[employee_id] -= leave_days
+            for assigned, other_id, other_role, day, shift in reversed(journal):
+                if assigned:
+                    self.__unassign(other_id, other_role, day)
+                else:
+                    self.__assign(other_id, other_role, day, shift)
+            EventLog.emit("employee.leave_denied", "Leave request denied.", employee_id=employee_id, days=days)
+            return False
+        EventLog.emit("employee.leave_approved", "Leave request approved.", employee_id=employee_id, days=days)
+        return True
+
+
+# Example Usage
+# Five housekeepers covering a week in which booking1 keeps one room occupied for four nights
+housekeepers = [Employee(110 + number, f"Housekeeper {number}", "Housekeeping", 5001, f"hk{number}", "cleanpass") for number in range(5)]
+scheduler = ShiftScheduler(housekeepers, "2025-07-01", weeks=1)
+print(scheduler.solve())  # Output: {'required': 21, 'covered': 21, 'shortfall': 0}
+print(scheduler.get_slot("Housekeeping", "2025-07-02", 0))  # Output: (1, 1)
+print(scheduler.request_leave(housekeepers[1].get_employee_id(), "2025-07-03", 2))  # Output: True
+print(scheduler.request_leave(housekeepers[2].get_employee_id(), "2025-07-03", 3))  # Output: False
+print(scheduler.get_coverage())  # Output: {'required': 21, 'covered': 21, 'shortfall': 0}
+print(list(scheduler.get_schedule(housekeepers[1].get_employee_id()).values())[2:4])  # Output: ['On leave', 'On leave']
+
+
+# QuoteCache class
+class QuoteCache:
+    """
+    Caches availability-and-price searches ("room type, dates, guests") with LRU eviction and a TTL.
+
+    A search returns the free rooms of a type for the stay with their total cost. Entries are
+    invalidated precisely: a stay indexed or removed in the AvailabilityIndex (booking confirm,
+    cancel, modify, extend, room reassignment) drops only the cached searches of that room type
+    whose dates overlap it, and a room price, status, type or number change drops that room type's
+    searches. Pricing rule changes are not observed; they show up once entries reach their TTL, or
+    call clear().
+    """
+
+    def __init__(self, capacity: int = 10000, ttl: float = 60.0, index: "AvailabilityIndex" = None, clock=time.monotonic):
+        """
+        :param capacity: Maximum cached searches; the least recently used one is evicted beyond this.
+        :param ttl: Seconds a cached search stays valid.
+        :param index: The availability index searched and observed (default: Room.availability_index).
+        :param clock: Time source, replaceable for testing.
+        """
+        self.__capacity = capacity
+        self.__ttl = ttl
+        self.__index = index if index is not None else Room.availability_index
+        self.__clock = clock
+        self.__entries = OrderedDict()  # (room_type, check_in, check_out) -> (expires_at, results), LRU first
+        self.__keys_by_type = {}  # room_type -> set of cached keys
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+        self.__invalidations = 0
+        self.__index.add_observer(self)
+        Room.observers.add(self)
+
+    def __len__(self) -> int:
+        """Returns the number of cached searches."""
+        return len(self.__entries)
+
+    def search(self, room_type: str, check_in, check_out, guests: int = 1) -> tuple:
+        """
+        Returns ((room_number, total_cost), ...) for the available rooms of a type, from the cache when possible.
+
+        :param check_in: Check-in date (YYYY-MM-DD string or day ordinal).
+        :param check_out: Check-out date (YYYY-MM-DD string or day ordinal).
+        :param guests: Party size. Rates are per room and rooms carry no capacity, so it does not change
+                       the results and is left out of the cache key; searches differing only in party
+                       size share one entry.
+        """
+        key = (room_type, to_ordinal(check_in), to_ordinal(check_out))
+        entry = self.__entries.get(key)
+        now = self.__clock()
+        if entry is not None:
+            if entry[0] > now:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry[1]
+            self.__discard(key)
+            self.__expirations += 1
+        self.__misses += 1
+        results = self.compute(room_type, key[1], key[2])
+        self.__entries[key] = (now + self.__ttl, results)
+        self.__keys_by_type.setdefault(room_type, set()).add(key)
+        if len(self.__entries) > self.__capacity:
+            self.__discard(next(iter(self.__entries)))
+            self.__evictions += 1
+        return results
+
+    def compute(self, room_type: str, check_in: int, check_out: int) -> tuple:
+        """
+        Runs a search without the cache: rooms in service and free for the stay, priced by Booking.pricing_engine.
+        Rooms of a type usually share a base price, so each distinct price is quoted once per search.
+        """
+        engine = Booking.pricing_engine
+        totals = {}  # base price -> total cost of the stay
+        results = []
+        for room in self.__index.find_free_rooms(room_type, check_in, check_out):
+            if room.check_availability():
+                price = room.get_price()
+                total = totals.get(price)
+                if total is None:
+                    total = totals[price] = engine.quote(room_type, price, check_in, check_out)
+                results.append((room.get_room_number(), total))
+        return tuple(results)
+
+    def __discard(self, key: tuple) -> None:
+        """Removes one cached search."""
+        del self.__entries[key]
+        keys = self.__keys_by_type[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.__keys_by_type[key[0]]
+
+    # Invalidation
+    def invalidate_room_type(self, room_type: str, check_in: int = None, check_out: int = None) -> int:
+        """Drops the cached searches of a room type, only those overlapping [check_in, check_out) when dates are given."""
+        keys = self.__keys_by_type.get(room_type)
+        if not keys:
+            return 0
+        if check_in is None:
+            stale = list(keys)
+        else:
+            stale = [key for key in keys if key[1] < check_out and key[2] > check_in]
+        for key in stale:
+            self.__discard(key)
+        self.__invalidations += len(stale)
+        return len(stale)
+
+    def availability_changed(self, room: "Room", check_in, check_out) -> None:
+        """Invalidates searches affected by a stay change (called by the AvailabilityIndex)."""
+        self.invalidate_room_type(room.get_room_type(), check_in, check_out)
+
+    def room_changed(self, room: "Room", field: str, old_value, new_value) -> None:
+        """Invalidates a room type's searches when one of its rooms changes (called through Room.observers)."""
+        if field == "room_type":
+            self.invalidate_room_type(old_value)
+            self.invalidate_room_type(new_value)
+        elif field in ("price", "availability_status", "room_number"):
+            self.invalidate_room_type(room.get_room_type())
+
+    def clear(self) -> None:
+        """Drops every cached search."""
+        self.__entries.clear()
+        self.__keys_by_type.clear()
+
+    def detach(self) -> None:
+        """Stops observing the availability index and rooms, e.g. before the cache is discarded, and drops every cached search."""
+        self.__index.remove_observer(self)
+        Room.observers.discard(self)
+        self.clear()
+
+    def get_stats(self) -> dict:
+        """Returns the cache size and hit, miss, eviction, expiration and invalidation counters."""
+        lookups = self.__hits + self.__misses
+        return {
+            "size": len(self.__entries),
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "hit_rate": self.__hits / lookups if lookups else 0.0,
+            "evictions": self.__evictions,
+            "expirations": self.__expirations,
+            "invalidations": self.__invalidations,
+        }
 
-    # Getter and Setter for booking_id
-    def get_booking_id(self) -> int:
-        """Returns the booking ID."""
-        return self.__booking_id
 
-    def set_booking_id(self, booking_id: int) -> None:
-        """Updates the booking ID."""
-        self.__booking_id = booking_id
+# Example Usage
+quotes = QuoteCache(capacity=100, ttl=30.0)
+quote_room = Room(910, "Family", ["Wi-Fi"], 175.0)
+print(quotes.search("Family", "2025-10-01", "2025-10-03", guests=4))  # Output: ((910, 350.0),)
+print(quotes.search("Family", "2025-10-01", "2025-10-03", guests=4))  # Output: ((910, 350.0),) from the cache
+Booking(1007, guest1, quote_room, "2025-10-02", "2025-10-04", "Confirmed")  # Overlapping stay invalidates the cached search
+print(quotes.search("Family", "2025-10-01", "2025-10-03", guests=4))  # Output: ()
+print(quotes.get_stats()["hits"], quotes.get_stats()["invalidations"])  # Output: 1 1
+quotes.detach()
+
+
+# BookingLedger class
+class BookingLedger:
+    """
+    Stores many bookings column by column in typed arrays instead of as individual Booking objects.
 
-    # Getter and Setter for status
-    def get_status(self) -> str:
-        """Returns the current booking status."""
-        return self.__status
+    Each booking costs a fixed 49 bytes (six 8-byte columns plus a 1-byte status code). Rows are read
+    through lightweight BookingLedgerRow views, and occupancy, revenue and status queries run over
+    whole columns (with NumPy when it is installed).
+    """
 
-    def set_status(self, status: str) -> None:
-        """Updates the booking status."""
-        self.__status = status
+    STATUSES = ("Pending", "Confirmed", "Cancelled")  # Status codes 0, 1, 2; other statuses get the next free codes
+    MAX_STATUSES = 256  # Status codes are stored in one unsigned byte
+    COLUMNS = ("booking_id", "guest_id", "room_number", "check_in", "check_out", "status", "amount")
+
+    def __init__(self):
+        """Initializes an empty ledger."""
+        self.__columns = {
+            "booking_id": array("q"),
+            "guest_id": array("q"),
+            "room_number": array("q"),
+            "check_in": array("q"),  # Day ordinals
+            "check_out": array("q"),
+            "status": array("B"),  # Index into __status_names
+            "amount": array("d"),
+        }
+        self.__status_names = list(BookingLedger.STATUSES)
+        self.__status_codes = {name: code for code, name in enumerate(self.__status_names)}
 
-    # Getter and Setter for special_requests
-    def get_special_requests(self) -> list:
-        """Returns the list of special requests made for the booking."""
-        return self.__special_requests
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self.__columns["booking_id"])
 
-    def add_special_request(self, request: str) -> None:
-        """Adds a special request for the booking."""
-        self.__special_requests.append(request)
-        print(f"Special request added: {request}")
+    def __getitem__(self, row: int) -> "BookingLedgerRow":
+        """Returns a view of a row with Booking-style getters."""
+        if not -len(self) <= row < len(self):
+            raise IndexError("BookingLedger row out of range.")
+        return BookingLedgerRow(self, row % len(self))
 
-    def confirm_booking(self) -> None:
-        """Confirms the booking by updating its status."""
-        self.__status = "Confirmed"
-        print(f"Booking {self.__booking_id} confirmed.")
+    def __iter__(self):
+        """Iterates over views of every row."""
+        return (BookingLedgerRow(self, row) for row in range(len(self)))
 
-    def cancel_booking(self) -> None:
-        """Cancels the booking by updating its status."""
-        self.__status = "Cancelled"
-        print(f"Booking {self.__booking_id} cancelled.")
+    def get_column(self, name: str) -> array:
+        """Returns the typed array backing a column (see COLUMNS)."""
+        return self.__columns[name]
 
-    def modify_booking(self, new_dates: tuple) -> None:
+    def status_code(self, status: str) -> int:
         """
-        Modifies the booking dates.
+        Returns the code stored for a status name, assigning a new code to unseen statuses.
 
-        :param new_dates: A tuple containing (new_check_in_date, new_check_out_date).
+        :raises ValueError: If the ledger already holds MAX_STATUSES distinct statuses.
         """
-        self.__check_in_date, self.__check_out_date = new_dates
-        print(f"Booking {self.__booking_id} modified to new dates: {new_dates}")
-
-    def calculate_total_cost(self) -> float:
+        code = self.__status_codes.get(status)
+        if code is None:
+            code = len(self.__status_names)
+            if code >= BookingLedger.MAX_STATUSES:
+                raise ValueError(f"BookingLedger supports at most {BookingLedger.MAX_STATUSES} distinct statuses.")
+            self.__status_names.append(status)
+            self.__status_codes[status] = code
+        return code
+
+    def status_name(self, code: int) -> str:
+        """Returns the status name for a stored code."""
+        return self.__status_names[code]
+
+    # Adding rows
+    def append(self, booking_id: int, guest_id: int, room_number: int, check_in, check_out, status: str = "Pending", amount: float = 0.0) -> int:
         """
-        Calculates the total cost of the booking based on room price and duration.
+        Adds a booking row and returns its index.
 
-        :return: The total cost of the stay.
+        :param check_in: Check-in date (YYYY-MM-DD string or day ordinal).
+        :param check_out: Check-out date (YYYY-MM-DD string or day ordinal).
+        :param amount: The booking's total cost.
         """
-        num_nights = int(self.__check_out_date.split('-')[2]) - int(self.__check_in_date.split('-')[2])
-        return num_nights * self.__room.get_price()
+        columns = self.__columns
+        columns["booking_id"].append(booking_id)
+        columns["guest_id"].append(guest_id)
+        columns["room_number"].append(room_number)
+        columns["check_in"].append(to_ordinal(check_in))
+        columns["check_out"].append(to_ordinal(check_out))
+        columns["status"].append(self.status_code(status))
+        columns["amount"].append(amount)
+        return len(self) - 1
+
+    def add_booking(self, booking: "Booking") -> int:
+        """Copies a Booking object into a new row, using its total cost as the amount."""
+        return self.append(
+            booking.get_booking_id(),
+            booking.get_guest().get_guest_id(),
+            booking.get_room().get_room_number(),
+            booking.get_check_in_ordinal(),
+            booking.get_check_out_ordinal(),
+            booking.get_status(),
+            booking.calculate_total_cost(),
+        )
+
+    def add_bookings(self, bookings) -> None:
+        """Copies many Booking objects into new rows."""
+        for booking in bookings:
+            self.add_booking(booking)
+
+    def get_memory_usage(self) -> int:
+        """Returns the bytes held by the column buffers."""
+        return sum(column.buffer_info()[1] * column.itemsize for column in self.__columns.values())
+
+    # Bulk queries
+    def status_counts(self) -> dict:
+        """Returns the number of rows per status name."""
+        statuses = self.__columns["status"]
+        if np is not None and statuses:
+            counts = np.bincount(np.frombuffer(statuses, dtype=np.uint8), minlength=len(self.__status_names)).tolist()
+        else:
+            counts = [statuses.count(code) for code in range(len(self.__status_names))]
+        return {name: count for name, count in zip(self.__status_names, counts) if count}
 
-    def apply_discount(self, discount: float) -> None:
+    def occupancy_by_night(self, start, end, status: str = "Confirmed") -> list:
         """
-        Applies a discount to the room price.
+        Counts rooms occupied on each night in [start, end).
 
-        :param discount: The discount percentage (0-100).
+        :param start: First night (YYYY-MM-DD string or day ordinal).
+        :param end: Night after the last one counted.
+        :param status: Only rows with this status are counted.
+        :return: One count per night, starting with the night of start.
         """
-        new_price = self.__room.calculate_discounted_price(discount)
-        print(f"Discount applied. New room price: {new_price}")
-
-    def extend_booking(self, extra_days: int) -> None:
+        start = to_ordinal(start)
+        nights = max(to_ordinal(end) - start, 0)
+        code = self.__status_codes.get(status)
+        if code is None or nights == 0:
+            return [0] * nights
+        columns = self.__columns
+        if np is not None and columns["status"]:
+            selected = np.frombuffer(columns["status"], dtype=np.uint8) == code
+            first = np.clip(np.frombuffer(columns["check_in"], dtype=np.int64)[selected], start, start + nights) - start
+            last = np.clip(np.frombuffer(columns["check_out"], dtype=np.int64)[selected], start, start + nights) - start
+            changes = np.bincount(first, minlength=nights + 1) - np.bincount(last, minlength=nights + 1)
+            return np.cumsum(changes)[:nights].tolist()
+        changes = [0] * (nights + 1)
+        stop = start + nights
+        for row_status, check_in, check_out in zip(columns["status"], columns["check_in"], columns["check_out"]):
+            if row_status == code and check_in < stop and check_out > start:
+                changes[max(check_in, start) - start] += 1
+                changes[min(check_out, stop) - start] -= 1
+        occupied = 0
+        counts = []
+        for change in changes[:nights]:
+            occupied += change
+            counts.append(occupied)
+        return counts
+
+    def revenue_by_room_number(self, status: str = "Confirmed") -> dict:
+        """Returns the summed amount per room number for rows with the given status."""
+        code = self.__status_codes.get(status)
+        if code is None:
+            return {}
+        columns = self.__columns
+        if np is not None and columns["status"]:
+            selected = np.frombuffer(columns["status"], dtype=np.uint8) == code
+            numbers, positions = np.unique(np.frombuffer(columns["room_number"], dtype=np.int64)[selected], return_inverse=True)
+            totals = np.bincount(positions, weights=np.frombuffer(columns["amount"], dtype=np.float64)[selected], minlength=len(numbers))
+            return dict(zip(numbers.tolist(), totals.tolist()))
+        revenue = {}
+        for row_status, room_number, amount in zip(columns["status"], columns["room_number"], columns["amount"]):
+            if row_status == code:
+                revenue[room_number] = revenue.get(room_number, 0.0) + amount
+        return revenue
+
+    def revenue_by_room_type(self, room_types: dict = None, status: str = "Confirmed") -> dict:
         """
-        Extends the booking by a given number of days.
+        Returns the summed amount per room type for rows with the given status.
 
-        :param extra_days: The number of additional days to extend the booking.
+        :param room_types: Maps room numbers to room types; by default types are looked up in
+                           Room.availability_index, and unknown rooms are reported as "Unknown".
         """
-        new_checkout_day = int(self.__check_out_date.split('-')[2]) + extra_days
-        self.__check_out_date = f"{self.__check_out_date[:8]}{new_checkout_day}"
-        print(f"Booking {self.__booking_id} extended for {extra_days} extra days.")
+        revenue = {}
+        for room_number, amount in self.revenue_by_room_number(status).items():
+            if room_types is not None:
+                room_type = room_types.get(room_number, "Unknown")
+            else:
+                room = Room.availability_index.get_room(room_number)
+                room_type = room.get_room_type() if room is not None else "Unknown"
+            revenue[room_type] = revenue.get(room_type, 0.0) + amount
+        return revenue
+
+
+class BookingLedgerRow:
+    """
+    A read/write view of one BookingLedger row with Booking-style getters for the stored columns.
 
-    def assign_room(self, room: "Room") -> None:
-        """
-        Assigns a new room to the booking.
+    Only IDs are stored, so the guest is available as get_guest_id(); get_room() resolves the room
+    number through Room.availability_index.
+    """
 
-        :param room: The new Room object.
-        """
-        self.__room = room
-        print(f"Booking {self.__booking_id} assigned to Room {room.get_room_info()['room_number']}")
+    __slots__ = ("__ledger", "__row")
 
-    def change_guest_details(self, new_guest: "Guest") -> None:
+    def __init__(self, ledger: "BookingLedger", row: int):
         """
-        Updates the guest details associated with the booking.
-
-        :param new_guest: The new Guest object.
+        :param ledger: The ledger holding the row.
+        :param row: The row index.
         """
-        self.__guest = new_guest
-        print(f"Guest details updated for Booking {self.__booking_id}")
+        self.__ledger = ledger
+        self.__row = row
 
-    def notify_guest(self) -> None:
-        """Sends a notification to the guest about their booking."""
-        print(f"Notification sent to Guest {self.__guest.get_name()} for Booking {self.__booking_id}")
+    def get_booking_id(self) -> int:
+        """Returns the booking ID."""
+        return self.__ledger.get_column("booking_id")[self.__row]
+
+    def get_guest_id(self) -> int:
+        """Returns the guest ID."""
+        return self.__ledger.get_column("guest_id")[self.__row]
+
+    def get_room_number(self) -> int:
+        """Returns the room number."""
+        return self.__ledger.get_column("room_number")[self.__row]
+
+    def get_room(self) -> "Room":
+        """Returns the Room registered under the row's room number, or None if no such room is registered."""
+        return Room.availability_index.get_room(self.get_room_number())
+
+    def get_check_in_ordinal(self) -> int:
+        """Returns the check-in date as a day ordinal."""
+        return self.__ledger.get_column("check_in")[self.__row]
+
+    def get_check_out_ordinal(self) -> int:
+        """Returns the check-out date as a day ordinal."""
+        return self.__ledger.get_column("check_out")[self.__row]
+
+    def get_check_in_date(self) -> str:
+        """Returns the check-in date in YYYY-MM-DD format."""
+        return date.fromordinal(self.get_check_in_ordinal()).isoformat()
+
+    def get_check_out_date(self) -> str:
+        """Returns the check-out date in YYYY-MM-DD format."""
+        return date.fromordinal(self.get_check_out_ordinal()).isoformat()
+
+    def get_num_nights(self) -> int:
+        """Returns the number of nights in the stay."""
+        return self.get_check_out_ordinal() - self.get_check_in_ordinal()
+
+    def get_status(self) -> str:
+        """Returns the booking status."""
+        return self.__ledger.status_name(self.__ledger.get_column("status")[self.__row])
+
+    def set_status(self, status: str) -> None:
+        """Updates the booking status."""
+        self.__ledger.get_column("status")[self.__row] = self.__ledger.status_code(status)
+
+    def calculate_total_cost(self) -> float:
+        """Returns the stored total cost of the booking."""
+        return self.__ledger.get_column("amount")[self.__row]
 
     def generate_booking_summary(self) -> str:
         """Generates a summary of the booking details."""
-        return f"Booking {self.__booking_id}: Guest {self.__guest.get_name()}, Room {self.__room.get_room_number()}, Status: {self.__status}"
+        return f"Booking {self.get_booking_id()}: Guest {self.get_guest_id()}, Room {self.get_room_number()}, Status: {self.get_status()}"
 
     def __str__(self) -> str:
-        """Returns a string representation of the Booking object."""
-        return f"Booking ID: {self.__booking_id}, Guest: {self.__guest.get_name()}, Room: {self.__room.get_room_number()}, Status: {self.__status}"
+        """Returns a string representation of the row."""
+        return f"Booking ID: {self.get_booking_id()}, Guest: {self.get_guest_id()}, Room: {self.get_room_number()}, Status: {self.get_status()}"
 
 
 # Example Usage
-guest1 = Guest(301, "Alice Smith", "alice@email.com")
-room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+ledger = BookingLedger()
+ledger.add_booking(booking1)
+ledger.append(1003, 302, 104, "2025-07-03", "2025-07-06", "Confirmed", 450.0)
+print(ledger[1])  # Output: Booking ID: 1003, Guest: 302, Room: 104, Status: Confirmed
+print(ledger.occupancy_by_night("2025-07-01", "2025-07-07"))  # Output: [1, 1, 2, 2, 1, 0]
+print(ledger.status_counts())  # Output: {'Confirmed': 2}
 
-booking1 = Booking(1001, guest1, room1, "2025-07-01", "2025-07-05")
 
-# Testing Getter Methods
-print(booking1.get_booking_id())  # Output: 1001
-print(booking1.get_status())  # Output: Pending
-print(booking1.get_special_requests())  # Output: []
+# BookingService class
+class BookingService:
+    """
+    Processes reservation, modification and cancellation commands concurrently under asyncio
+    without ever double-booking a room.
+
+    Each command locks only the rooms it touches (an asyncio.Lock per room number, shared by every
+    service on the same event loop), re-checks availability in the shared AvailabilityIndex while
+    holding the lock, awaits the optional on_commit hook (e.g. persistence or a payment hold) and
+    only then applies the change. Commands for different rooms never wait on each other, so
+    throughput grows with the number of rooms.
+    """
 
-# Testing Setter Methods
-booking1.set_status("Confirmed")
-booking1.add_special_request("Extra towels")
+    next_booking_id = 1  # Next ID reserve() hands out, shared by every service so their bookings never collide
+    room_locks = weakref.WeakKeyDictionary()  # Event loop -> {room_number: asyncio.Lock}, shared by every service on it
 
-# Confirm Booking
-booking1.confirm_booking()
+    def __init__(self, on_commit=None):
+        """
+        :param on_commit: Optional coroutine function called as on_commit(action, booking) under the
+                          room locks before a change is applied; raising aborts the command and, for
+                          reserve(), drops the new booking again.
+        """
+        self.__on_commit = on_commit
+        self.__bookings = {}  # booking_id -> Booking handled by this service
+        self.__stats = {"accepted": 0, "rejected": 0}
 
-# Testing total cost calculation
-print(f"Total Cost: ${booking1.calculate_total_cost()}")  # Output: Total Cost: $600.0
+    @staticmethod
+    def __lock_for(room_number: int) -> asyncio.Lock:
+        """Returns the running event loop's lock for a room, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        locks = BookingService.room_locks.get(loop)
+        if locks is None:
+            locks = BookingService.room_locks[loop] = {}
+        lock = locks.get(room_number)
+        if lock is None:
+            lock = locks[room_number] = asyncio.Lock()
+        return lock
+
+    async def __acquire_rooms(self, booking: "Booking", *extra_rooms: "Room") -> list:
+        """
+        Locks the booking's current room plus extra_rooms in room-number order (so commands never
+        deadlock), retrying if the booking was moved to another room while waiting.
+        """
+        while True:
+            room_number = booking.get_room().get_room_number()
+            numbers = sorted({room_number, *(room.get_room_number() for room in extra_rooms)})
+            locks = [BookingService.__lock_for(number) for number in numbers]
+            for lock in locks:
+                await lock.acquire()
+            if booking.get_room().get_room_number() == room_number:
+                return locks
+            BookingService.__release(locks)
 
-# Printing Updated Booking Info
-print(booking1)  # Output: Booking ID: 1001, Guest: Alice Smith, Room: 101, Status: Confirmed
+    @staticmethod
+    def __release(locks: list) -> None:
+        """Releases locks in reverse acquisition order."""
+        for lock in reversed(locks):
+            lock.release()
+
+    async def __commit(self, action: str, booking: "Booking") -> None:
+        """Awaits the on_commit hook, if any."""
+        if self.__on_commit is not None:
+            await self.__on_commit(action, booking)
+
+    def __record(self, accepted: bool) -> bool:
+        """Counts a command outcome and returns it."""
+        self.__stats["accepted" if accepted else "rejected"] += 1
+        return accepted
+
+    @staticmethod
+    def __allocate_booking_id(guest: "Guest") -> int:
+        """
+        Takes the next shared booking ID, skipping IDs of confirmed bookings in Room.availability_index
+        (however they were created) and IDs already in the guest's reservation history.
+        """
+        booking_id = BookingService.next_booking_id
+        while Room.availability_index.has_booking_id(booking_id) or guest.has_reservation(booking_id):
+            booking_id += 1
+        BookingService.next_booking_id = booking_id + 1
+        return booking_id
+
+    def adopt_booking(self, booking: "Booking") -> None:
+        """Lets the service manage an existing booking and moves the shared ID allocator past its ID."""
+        self.__bookings[booking.get_booking_id()] = booking
+        BookingService.next_booking_id = max(BookingService.next_booking_id, booking.get_booking_id() + 1)
+
+    def get_booking(self, booking_id: int) -> "Booking":
+        """Returns a booking created or adopted by this service, or None."""
+        return self.__bookings.get(booking_id)
+
+    def get_stats(self) -> dict:
+        """Returns how many commands were accepted and rejected."""
+        return dict(self.__stats)
+
+    async def reserve(self, guest: "Guest", room: "Room", check_in_date: str, check_out_date: str) -> "Booking":
+        """
+        Creates and confirms a booking if the room is free for the stay.
+
+        :return: The confirmed Booking, or None if the room is taken for any of the nights.
+        """
+        lock = BookingService.__lock_for(room.get_room_number())
+        async with lock:
+            if not Room.availability_index.is_room_free(room, check_in_date, check_out_date):
+                self.__record(False)
+                return None
+            booking = Booking(BookingService.__allocate_booking_id(guest), guest, room, check_in_date, check_out_date)
+            try:
+                await self.__commit("reserve", booking)
+            except BaseException:  # Including cancellation: no orphan Pending booking stays in the guest's history
+                guest.remove_reservation(booking.get_booking_id())
+                raise
+            booking.confirm_booking()
+            self.__bookings[booking.get_booking_id()] = booking
+            self.__record(True)
+            return booking
+
+    async def modify(self, booking_id: int, new_dates: tuple) -> bool:
+        """Moves a booking to new (check_in, check_out) dates if its room is free for them."""
+        booking = self.__bookings[booking_id]
+        locks = await self.__acquire_rooms(booking)
+        try:
+            if booking.get_status() != "Confirmed" or not Room.availability_index.is_room_free(booking.get_room(), *new_dates, ignore_booking=booking):
+                return self.__record(False)
+            await self.__commit("modify", booking)
+            booking.modify_booking(new_dates)
+            return self.__record(True)
+        finally:
+            BookingService.__release(locks)
+
+    async def extend(self, booking_id: int, extra_days: int) -> bool:
+        """Extends a booking if its room is free for the extra nights."""
+        booking = self.__bookings[booking_id]
+        locks = await self.__acquire_rooms(booking)
+        try:
+            check_out = booking.get_check_out_ordinal()
+            if booking.get_status() != "Confirmed" or not Room.availability_index.is_room_free(booking.get_room(), check_out, check_out + extra_days, ignore_booking=booking):
+                return self.__record(False)
+            await self.__commit("extend", booking)
+            booking.extend_booking(extra_days)
+            return self.__record(True)
+        finally:
+            BookingService.__release(locks)
+
+    async def assign_room(self, booking_id: int, room: "Room") -> bool:
+        """Moves a booking to another room if that room is free for the whole stay."""
+        booking = self.__bookings[booking_id]
+        locks = await self.__acquire_rooms(booking, room)
+        try:
+            stay = (booking.get_check_in_ordinal(), booking.get_check_out_ordinal())
+            if booking.get_status() != "Confirmed" or not Room.availability_index.is_room_free(room, *stay, ignore_booking=booking):
+                return self.__record(False)
+            await self.__commit("assign_room", booking)
+            booking.assign_room(room)
+            return self.__record(True)
+        finally:
+            BookingService.__release(locks)
+
+    async def cancel(self, booking_id: int) -> bool:
+        """Cancels a confirmed booking, freeing its nights."""
+        booking = self.__bookings[booking_id]
+        locks = await self.__acquire_rooms(booking)
+        try:
+            if booking.get_status() != "Confirmed":
+                return self.__record(False)
+            await self.__commit("cancel", booking)
+            booking.cancel_booking()
+            return self.__record(True)
+        finally:
+            BookingService.__release(locks)
+
+
+# Example Usage
+async def reserve_twice():
+    service = BookingService()
+    room = Room(107, "Single", ["Wi-Fi"], 90.0)
+    results = await asyncio.gather(
+        service.reserve(Guest(302, "Bob", "bob@email.com"), room, "2025-08-10", "2025-08-12"),
+        service.reserve(Guest(303, "Carol", "carol@email.com"), room, "2025-08-11", "2025-08-13"),
+    )
+    print([booking is not None for booking in results], service.get_stats())  # Output: [True, False] {'accepted': 1, 'rejected': 1}
+
+if __name__ == "__main__":  # asyncio.run() cannot start inside an already running event loop, e.g. when imported from async code
+    asyncio.run(reserve_twice())
 
 
 #Payment Class 
@@ -773,6 +4227,10 @@ class Payment:
     Handles payment processing, invoices, refunds, and validation.
     """
 
+    __slots__ = ("__payment_id", "__booking", "__amount", "__payment_method", "__status", "__splits")
+
+    coupon_multipliers = {"DISCOUNT10": 0.9}  # Valid coupon codes and the factor they apply to the amount
+
     def __init__(self, payment_id: int, booking: "Booking", amount: float, payment_method: str, status: str = "Pending"):
         """
         Initializes a Payment instance.
@@ -788,6 +4246,7 @@ class Payment:
         self.__amount = amount
         self.__payment_method = payment_method
         self.__status = status
+        self.__splits = None  # ((method, amount), ...) once split_payment() succeeds
 
     # Getter and Setter for payment_id
     def get_payment_id(self) -> int:
@@ -798,6 +4257,11 @@ class Payment:
         """Updates the payment ID."""
         self.__payment_id = payment_id
 
+    # Getter for booking
+    def get_booking(self) -> "Booking":
+        """Returns the booking the payment belongs to (None if it has none)."""
+        return self.__booking
+
     # Getter and Setter for amount
     def get_amount(self) -> float:
         """Returns the payment amount."""
@@ -815,6 +4279,24 @@ class Payment:
     def set_payment_method(self, payment_method: str) -> None:
         """Updates the payment method."""
         self.__payment_method = payment_method
+        self.__splits = None
+
+    def get_splits(self) -> tuple:
+        """
+        Returns ((method, amount), ...) for the payment: one pair per split method, scaled to the
+        current amount if VAT or a coupon was applied after the split, or a single pair if unsplit.
+        """
+        if self.__splits is None:
+            return ((self.__payment_method, self.__amount),)
+        return Payment.scale_splits(self.__splits, self.__amount)
+
+    @staticmethod
+    def scale_splits(splits, amount: float):
+        """Scales (method, amount) splits proportionally so they add up to amount."""
+        total = sum(split for _, split in splits)
+        if not total or total == amount:
+            return splits
+        return tuple((method, split * amount / total) for method, split in splits)
 
     # Getter and Setter for status
     def get_payment_status(self) -> str:
@@ -829,9 +4311,10 @@ class Payment:
         """Processes the payment if it's still pending."""
         if self.__status == "Pending":
             self.__status = "Completed"
-            print("Payment processed successfully.")
+            EventLog.emit("payment.processed", "Payment processed successfully.", payment_id=self.__payment_id, amount=self.__amount,
+                          booking_id=self.__booking.get_booking_id() if self.__booking is not None else None)
             return True
-        print("Payment failed or already processed.")
+        EventLog.emit("payment.process_rejected", "Payment failed or already processed.", payment_id=self.__payment_id, status=self.__status)
         return False
 
     def generate_invoice(self) -> str:
@@ -842,20 +4325,21 @@ class Payment:
         """Refunds the payment if it was completed."""
         if self.__status == "Completed":
             self.__status = "Refunded"
-            print("Payment refunded successfully.")
+            EventLog.emit("payment.refunded", "Payment refunded successfully.", payment_id=self.__payment_id, amount=self.__amount)
 
     def apply_vat(self, vat: float) -> None:
         """Applies VAT to the payment amount."""
         self.__amount += self.__amount * (vat / 100)
-        print(f"VAT applied. New amount: {self.__amount}")
+        EventLog.emit("payment.vat_applied", "VAT applied. New amount: {amount}", payment_id=self.__payment_id, vat=vat, amount=self.__amount)
 
     def split_payment(self, methods: list[str], amounts: list[float]) -> None:
         """Splits the payment across multiple methods if the total matches."""
         if sum(amounts) == self.__amount:
             self.__payment_method = ", ".join(methods)
-            print(f"Payment successfully split across methods: {methods}")
+            self.__splits = tuple(zip(methods, amounts))
+            EventLog.emit("payment.split", "Payment successfully split across methods: {methods}", payment_id=self.__payment_id, methods=methods, amounts=amounts)
         else:
-            print("Error: Split payment amounts do not match the total amount.")
+            EventLog.emit("payment.split_rejected", "Error: Split payment amounts do not match the total amount.", payment_id=self.__payment_id, amounts=amounts)
 
     def validate_payment_details(self) -> bool:
         """Validates payment details (amount must be positive and a payment method must be provided)."""
@@ -863,21 +4347,21 @@ class Payment:
 
     def send_payment_receipt(self) -> None:
         """Sends a payment receipt."""
-        print(f"Receipt sent for Payment ID {self.__payment_id}")
+        EventLog.emit("payment.receipt_sent", "Receipt sent for Payment ID {payment_id}", payment_id=self.__payment_id)
 
     def apply_coupon(self, coupon_code: str) -> bool:
         """Applies a coupon discount if valid."""
-        if coupon_code == "DISCOUNT10":
-            self.__amount *= 0.9
-            print("Coupon applied successfully.")
+        if coupon_code in Payment.coupon_multipliers:
+            self.__amount *= Payment.coupon_multipliers[coupon_code]
+            EventLog.emit("payment.coupon_applied", "Coupon applied successfully.", payment_id=self.__payment_id, coupon_code=coupon_code, amount=self.__amount)
             return True
-        print("Invalid coupon code.")
+        EventLog.emit("payment.coupon_rejected", "Invalid coupon code.", payment_id=self.__payment_id, coupon_code=coupon_code)
         return False
 
     def record_failed_transaction(self) -> None:
         """Records a failed transaction."""
         self.__status = "Failed"
-        print("Payment failed and recorded.")
+        EventLog.emit("payment.failed", "Payment failed and recorded.", payment_id=self.__payment_id)
 
     def verify_card_details(self, card_number: str) -> bool:
         """Verifies if a card number is valid (must be 16 digits and numeric)."""
@@ -887,6 +4371,22 @@ class Payment:
         """Returns a string representation of the Payment object."""
         return f"Payment ID: {self.__payment_id}, Amount: ${self.__amount}, Method: {self.__payment_method}, Status: {self.__status}"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the payment as a flat tuple for persistence, referencing its booking by ID; splits are JSON-encoded."""
+        booking_id = self.__booking.get_booking_id() if self.__booking is not None else None
+        splits = json.dumps(self.__splits) if self.__splits is not None else None
+        return (self.__payment_id, booking_id, self.__amount, self.__payment_method, self.__status, splits)
+
+    @classmethod
+    def from_record(cls, record: tuple, booking: "Booking") -> "Payment":
+        """Rebuilds a payment from to_record() output and its already loaded booking."""
+        payment_id, _, amount, payment_method, status, splits = record
+        payment = cls(payment_id, booking, amount, payment_method, status)
+        if splits is not None:
+            payment.__splits = tuple((method, split) for method, split in json.loads(splits))
+        return payment
+
 
 # Example Usage
 booking1 = Booking(1001, Guest(301, "Alice Smith", "alice@email.com"), Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0), "2025-07-01", "2025-07-05")
@@ -911,23 +4411,416 @@ payment1.apply_vat(10)  # Adds 10% VAT
 # Printing Updated Payment Info
 print(payment1)  # Output: Payment ID: 5001, Amount: $715.0, Method: Credit Card, Status: Completed
 
+# Accruing loyalty points for a batch of completed payments
+print(example_ledger.accrue_payments([payment1]))  # Output: 1
+print(example_ledger.get_history(301, limit=2))  # Output: [('accrual', 71), ('join_bonus', 50)]
+
+
+# FinancialReport class
+class FinancialReport:
+    """
+    One-pass revenue aggregation over a stream of payment records.
+
+    Records are (amount, status, splits, day, room_type) tuples, where splits is ((method, amount), ...)
+    and day is the booking's check-in ordinal (payments carry no date of their own). They can come from
+    Payment objects through payment_records() or straight from HotelRepository.iter_payments(); either
+    way they are consumed one at a time, so memory depends only on the number of distinct days, room
+    types and methods, not on the number of payments.
+    """
+
+    REVENUE_STATUS = "Completed"
+    REFUND_STATUS = "Refunded"
+    FAILED_STATUS = "Failed"
+
+    def __init__(self):
+        """Starts an empty report."""
+        self.__payments = 0
+        self.__revenue = 0.0
+        self.__by_day = {}  # day ordinal -> revenue
+        self.__by_room_type = {}
+        self.__by_method = {}
+        self.__refunds = 0
+        self.__refund_total = 0.0
+        self.__failed = 0
+
+    @staticmethod
+    def payment_records(payments):
+        """Yields the report record for each Payment object."""
+        for payment in payments:
+            booking = payment.get_booking()
+            if booking is not None:
+                yield payment.get_amount(), payment.get_payment_status(), payment.get_splits(), booking.get_check_in_ordinal(), booking.get_room().get_room_type()
+            else:
+                yield payment.get_amount(), payment.get_payment_status(), payment.get_splits(), None, None
+
+    def consume(self, records) -> "FinancialReport":
+        """Aggregates a stream of records into the report and returns the report."""
+        by_day, by_room_type, by_method = self.__by_day, self.__by_room_type, self.__by_method
+        payments = revenue = refund_total = 0
+        refunds = failed = 0
+        for amount, status, splits, day, room_type in records:
+            payments += 1
+            if status == FinancialReport.REVENUE_STATUS:
+                revenue += amount
+                by_day[day] = by_day.get(day, 0.0) + amount
+                by_room_type[room_type] = by_room_type.get(room_type, 0.0) + amount
+                for method, split in splits:
+                    by_method[method] = by_method.get(method, 0.0) + split
+            elif status == FinancialReport.REFUND_STATUS:
+                refunds += 1
+                refund_total += amount
+            elif status == FinancialReport.FAILED_STATUS:
+                failed += 1
+        self.__payments += payments
+        self.__revenue += revenue
+        self.__refunds += refunds
+        self.__refund_total += refund_total
+        self.__failed += failed
+        return self
+
+    def get_report(self) -> dict:
+        """Returns the totals, revenue by day (YYYY-MM-DD), room type and method, refunds and the failure rate."""
+        return {
+            "payments": self.__payments,
+            "revenue": round(self.__revenue, 2),
+            "revenue_by_day": {date.fromordinal(day).isoformat(): round(self.__by_day[day], 2) for day in sorted(filter(None, self.__by_day))},
+            "revenue_by_room_type": {room_type: round(total, 2) for room_type, total in self.__by_room_type.items()},
+            "revenue_by_method": {method: round(total, 2) for method, total in self.__by_method.items()},
+            "refunds": self.__refunds,
+            "refund_total": round(self.__refund_total, 2),
+            "failed": self.__failed,
+            "failure_rate": self.__failed / self.__payments if self.__payments else 0.0,
+        }
+
+
+# Example Usage
+split = Payment(5002, booking1, 600.0, "Credit Card", "Completed")
+split.split_payment(["Credit Card", "PayPal"], [400.0, 200.0])
+refunded = Payment(5003, booking1, 300.0, "PayPal", "Refunded")
+failed = Payment(5004, booking1, 300.0, "Credit Card", "Failed")
+report = FinancialReport().consume(FinancialReport.payment_records([payment1, split, refunded, failed])).get_report()
+print(report["revenue"], report["revenue_by_day"], report["revenue_by_method"])  # Output: 1315.0 {'2025-07-01': 1315.0} {'Credit Card': 1115.0, 'PayPal': 200.0}
+print(report["refund_total"], report["failure_rate"])  # Output: 300.0 0.25
+
+
+# BulkPricing class
+class BulkPricing:
+    """
+    Prices many rooms, bookings and payments in one pass.
+
+    Every result matches the scalar methods exactly: the same floating-point operations are applied
+    in the same order as Room.calculate_discounted_price, Booking.calculate_total_cost,
+    Payment.apply_vat and Payment.apply_coupon. Inputs may be lists or NumPy arrays; when NumPy is
+    installed the work is vectorized and NumPy arrays are returned, otherwise lists are returned.
+    """
+
+    @staticmethod
+    def discounted_prices(prices, discounts):
+        """Applies Room.calculate_discounted_price to each (price, discount percentage) pair."""
+        if np is not None:
+            prices = np.asarray(prices, dtype=np.float64)
+            return prices * (1 - np.asarray(discounts, dtype=np.float64) / 100)
+        return [price * (1 - discount / 100) for price, discount in zip(prices, discounts)]
+
+    @staticmethod
+    def coupon_multipliers(coupons):
+        """Maps coupon codes to the factor Payment.apply_coupon would apply (1.0 for invalid codes)."""
+        if np is not None:
+            codes, positions = np.unique(np.asarray(coupons, dtype=object).astype(str), return_inverse=True)
+            factors = np.array([Payment.coupon_multipliers.get(code, 1.0) for code in codes], dtype=np.float64)
+            return factors[positions]
+        return [Payment.coupon_multipliers.get(code, 1.0) for code in coupons]
+
+    @staticmethod
+    def total_costs(prices, nights, discounts=None, vat_rates=None, coupons=None):
+        """
+        Calculates payable totals for many stays.
+
+        Row i equals: nights[i] * Room.calculate_discounted_price(discounts[i]), then
+        Payment.apply_vat(vat_rates[i]), then Payment.apply_coupon(coupons[i]).
+        With only prices and nights this is Booking.calculate_total_cost.
+
+        :param prices: Room prices per night.
+        :param nights: Night counts per stay.
+        :param discounts: Optional discount percentages (0-100) per stay.
+        :param vat_rates: Optional VAT percentages per stay.
+        :param coupons: Optional coupon codes per stay (None or "" for no coupon).
+        :return: The totals, as a NumPy array when NumPy is available, otherwise a list.
+        """
+        if discounts is not None:
+            prices = BulkPricing.discounted_prices(prices, discounts)
+        multipliers = BulkPricing.coupon_multipliers(coupons) if coupons is not None else None
+        if np is not None:
+            totals = np.asarray(nights) * np.asarray(prices, dtype=np.float64)
+            if vat_rates is not None:
+                totals = totals + totals * (np.asarray(vat_rates, dtype=np.float64) / 100)
+            if multipliers is not None:
+                totals = totals * multipliers
+            return totals
+        totals = [night_count * price for night_count, price in zip(nights, prices)]
+        if vat_rates is not None:
+            totals = [total + total * (vat / 100) for total, vat in zip(totals, vat_rates)]
+        if multipliers is not None:
+            totals = [total * factor for total, factor in zip(totals, multipliers)]
+        return totals
+
+
+# Example Usage
+print(BulkPricing.discounted_prices([150.0, 300.0], [10, 0]))  # Output: [135.0, 300.0]
+print(BulkPricing.total_costs([150.0, 300.0], [4, 2], [0, 10], [10, 5], ["DISCOUNT10", None]))  # Output: [594.0, 567.0]
+
+
+# PaymentGateway classes
+class GatewayError(Exception):
+    """
+    Raised by a payment gateway for a transient failure (timeout, unavailable); the batch may be retried.
+    """
+
+
+class PaymentGateway(ABC):
+    """
+    Interface for payment gateways used by PaymentPipeline.
+    """
+
+    @abstractmethod
+    def submit_batch(self, charges: list) -> list:
+        """
+        Charges a batch of payments.
+
+        :param charges: (idempotency_key, amount, payment_method) tuples.
+        :return: One bool per charge: True if approved, False if declined.
+        :raises GatewayError: On a transient failure affecting the whole batch.
+        """
+
+
+class FakePaymentGateway(PaymentGateway):
+    """
+    Local stand-in gateway with configurable latency, declines and transient failures, for offline
+    benchmarking. Like a real gateway it honours idempotency keys: re-submitting a key returns the
+    original decision instead of charging again.
+    """
+
+    def __init__(self, latency: float = 0.02, per_charge_latency: float = 0.0002, failure_rate: float = 0.0, decline_rate: float = 0.0, seed: int = None):
+        """
+        :param latency: Seconds per batch round trip.
+        :param per_charge_latency: Additional seconds per charge in the batch.
+        :param failure_rate: Probability that a batch raises GatewayError.
+        :param decline_rate: Probability that a single charge is declined.
+        :param seed: Seed for reproducible failures and declines.
+        """
+        self.__latency = latency
+        self.__per_charge_latency = per_charge_latency
+        self.__failure_rate = failure_rate
+        self.__decline_rate = decline_rate
+        self.__random = random.Random(seed)
+        self.__decisions = {}  # idempotency key -> approved
+        self.__lock = threading.Lock()
+        self.__charged = 0
+
+    def submit_batch(self, charges: list) -> list:
+        """Sleeps for the simulated round trip, then approves or declines each charge."""
+        time.sleep(self.__latency + self.__per_charge_latency * len(charges))
+        with self.__lock:
+            if self.__random.random() < self.__failure_rate:
+                raise GatewayError("Gateway timed out.")
+            results = []
+            for key, _, _ in charges:
+                if key not in self.__decisions:
+                    self.__decisions[key] = self.__random.random() >= self.__decline_rate
+                    self.__charged += 1
+                results.append(self.__decisions[key])
+            return results
+
+    def get_charge_count(self) -> int:
+        """Returns how many distinct charges were made (duplicates by idempotency key excluded)."""
+        return self.__charged
+
+
+# PaymentPipeline class
+class PaymentPipeline:
+    """
+    Settles payments in batches through a PaymentGateway on a bounded thread pool.
+
+    submit() validates a payment, applies VAT and a coupon, and queues it; full batches go to the
+    worker pool. When max_pending_batches batches are in flight, submit() blocks (backpressure).
+    Transient gateway errors are retried with exponential backoff; payments still failing afterwards,
+    declined, or invalid are marked with record_failed_transaction. Idempotency keys (default
+    "payment-<id>") make re-submitting a key a no-op, and a payment already in flight under any key is
+    not queued twice. A failed payment can be retried under a new key; VAT and coupons are only applied
+    the first time this pipeline submits a payment. submit(), flush() and close() are meant to be
+    called from a single producer thread.
+    """
+
+    def __init__(self, gateway: "PaymentGateway", batch_size: int = 100, max_workers: int = 8, max_pending_batches: int = 16, max_retries: int = 3, retry_delay: float = 0.01):
+        """
+        :param gateway: Where batches are submitted.
+        :param batch_size: Payments per gateway call.
+        :param max_workers: Threads submitting batches concurrently.
+        :param max_pending_batches: Batches allowed in flight before submit() blocks.
+        :param max_retries: Retries per batch after a GatewayError.
+        :param retry_delay: Initial retry delay in seconds, doubled on each retry.
+        """
+        self.__gateway = gateway
+        self.__batch_size = batch_size
+        self.__max_retries = max_retries
+        self.__retry_delay = retry_delay
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PaymentPipeline")
+        self.__batch_slots = threading.BoundedSemaphore(max_pending_batches)
+        self.__lock = threading.Lock()
+        self.__batch = []  # (key, payment, submitted_at) waiting for the next dispatch
+        self.__futures = []
+        self.__results = {}  # idempotency key -> "Pending", "Completed" or "Failed"
+        self.__in_flight = {}  # payment ID -> idempotency key, from submit() until settlement
+        self.__adjusted = set()  # IDs of payments whose VAT and coupon were already applied
+        self.__latencies = []  # seconds from submit() to settlement, per payment
+        self.__stats = {"submitted": 0, "duplicates": 0, "invalid": 0, "completed": 0, "failed": 0, "retries": 0}
+
+    def submit(self, payment: "Payment", vat: float = 0, coupon_code: str = None, card_number: str = None, idempotency_key: str = None) -> str:
+        """
+        Queues a payment for settlement and returns its idempotency key.
+
+        :param vat: VAT percentage to apply before charging.
+        :param coupon_code: Optional coupon to apply after VAT.
+        :param card_number: Card number to verify, for card payments.
+        :param idempotency_key: Key identifying this charge; defaults to "payment-<payment id>". Use a
+                                new key to retry a payment that failed.
+        :return: The key, or the key the payment is already in flight under.
+        """
+        payment_id = payment.get_payment_id()
+        key = idempotency_key if idempotency_key is not None else f"payment-{payment_id}"
+        with self.__lock:
+            in_flight_key = self.__in_flight.get(payment_id)
+            if key in self.__results or in_flight_key is not None:
+                self.__stats["duplicates"] += 1
+                return in_flight_key if in_flight_key is not None else key
+            self.__results[key] = "Pending"
+            self.__in_flight[payment_id] = key
+            self.__stats["submitted"] += 1
+        retryable = payment.get_payment_status() in ("Pending", "Failed")
+        if not retryable or not payment.validate_payment_details() or (card_number is not None and not payment.verify_card_details(card_number)):
+            if retryable:  # Settled payments are rejected without touching their status
+                payment.record_failed_transaction()
+            with self.__lock:
+                self.__results[key] = "Failed"
+                self.__stats["invalid"] += 1
+                self.__stats["failed"] += 1
+                del self.__in_flight[payment_id]
+            return key
+        if payment_id not in self.__adjusted:  # A retry charges the amount computed the first time
+            if vat:
+                payment.apply_vat(vat)
+            if coupon_code:
+                payment.apply_coupon(coupon_code)
+            self.__adjusted.add(payment_id)
+        payment.set_payment_status("Pending")
+        self.__batch.append((key, payment, time.perf_counter()))
+        if len(self.__batch) >= self.__batch_size:
+            self.flush()
+        return key
+
+    def flush(self) -> None:
+        """Dispatches the partially filled batch, blocking while too many batches are in flight."""
+        if not self.__batch:
+            return
+        batch, self.__batch = self.__batch, []
+        self.__batch_slots.acquire()
+        self.__futures.append(self.__executor.submit(self.__settle, batch))
+
+    def __settle(self, batch: list) -> None:
+        """Submits a batch with retries and records each payment's outcome (runs on a worker thread)."""
+        try:
+            charges = [(key, payment.get_amount(), payment.get_payment_method()) for key, payment, _ in batch]
+            decisions = None
+            for attempt in range(self.__max_retries + 1):
+                try:
+                    decisions = self.__gateway.submit_batch(charges)
+                    break
+                except GatewayError:
+                    if attempt < self.__max_retries:
+                        with self.__lock:
+                            self.__stats["retries"] += 1
+                        time.sleep(self.__retry_delay * 2 ** attempt)
+            if decisions is None:
+                decisions = [False] * len(batch)
+            if len(decisions) != len(batch):  # Outcomes are unknown, so the payments stay Pending
+                with self.__lock:
+                    for _, payment, _ in batch:
+                        del self.__in_flight[payment.get_payment_id()]
+                raise ValueError(f"Gateway returned {len(decisions)} decisions for a batch of {len(batch)} charges.")
+            settled_at = time.perf_counter()
+            for (key, payment, submitted_at), approved in zip(batch, decisions):
+                if approved:
+                    payment.process_payment()
+                else:
+                    payment.record_failed_transaction()
+                with self.__lock:
+                    self.__results[key] = "Completed" if approved else "Failed"
+                    self.__stats["completed" if approved else "failed"] += 1
+                    self.__latencies.append(settled_at - submitted_at)
+                    del self.__in_flight[payment.get_payment_id()]
+        finally:
+            self.__batch_slots.release()
+
+    def close(self) -> None:
+        """
+        Dispatches remaining payments and waits until every batch has settled.
+
+        :raises ValueError: If the gateway answered a batch with the wrong number of decisions.
+        """
+        self.flush()
+        futures, self.__futures = self.__futures, []
+        self.__executor.shutdown()  # Waits for every batch, so one failing batch does not strand the rest
+        for future in futures:
+            future.result()
+
+    def get_result(self, idempotency_key: str) -> str:
+        """Returns "Pending", "Completed" or "Failed" for a submitted key, or None if unknown."""
+        return self.__results.get(idempotency_key)
+
+    def get_stats(self) -> dict:
+        """Returns outcome counters plus p50/p99 settlement latency in milliseconds."""
+        with self.__lock:
+            stats = dict(self.__stats)
+            latencies = sorted(self.__latencies)
+        if latencies:
+            stats["p50_ms"] = latencies[len(latencies) // 2] * 1000
+            stats["p99_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        return stats
+
+
+# Example Usage
+pipeline = PaymentPipeline(FakePaymentGateway(latency=0.001, seed=1), batch_size=2)
+checkout_booking = Booking(1005, guest1, Room(108, "Deluxe", ["TV"], 180.0), "2025-10-01", "2025-10-03")
+checkout_payments = [Payment(6001 + i, checkout_booking, 360.0, "Credit Card") for i in range(3)]
+for checkout_payment in checkout_payments:
+    pipeline.submit(checkout_payment, vat=5, coupon_code="DISCOUNT10", card_number="4111111111111111")
+pipeline.submit(checkout_payments[0])  # Duplicate submission is ignored
+pipeline.close()
+print([checkout_payment.get_payment_status() for checkout_payment in checkout_payments])  # Output: ['Completed', 'Completed', 'Completed']
+print(checkout_payments[0].get_amount())  # Output: 340.2
+
     #Admin class 
 class Admin:
     """
     Represents an administrative user who manages hotel operations.
     """
 
-    def __init__(self, admin_id: int, username: str, password: str):
+    __slots__ = ("__admin_id", "__username", "__password_hash")
+
+    room_catalog = RoomCatalog()  # The hotel's room inventory managed by admins
+
+    def __init__(self, admin_id: int, username: str, password: str, password_hash: str = None):
         """
         Initializes an Admin instance.
 
         :param admin_id: Unique identifier for the admin.
         :param username: Admin's username.
-        :param password: Admin's password (should be securely stored in a real application).
+        :param password: Admin's password; only its salted hash is stored.
+        :param password_hash: An already encoded hash to store instead of hashing password.
         """
         self.__admin_id = admin_id
         self.__username = username
-        self.__password = password  # Consider using a hashing function for security.
+        self.__password_hash = password_hash if password_hash is not None else User.password_hasher.hash_password(password)
 
     # Getter and Setter for admin_id
     def get_admin_id(self) -> int:
@@ -949,56 +4842,96 @@ class Admin:
 
     # Getter and Setter for password
     def get_password(self) -> str:
-        """Returns the admin's password (not recommended for security reasons)."""
-        return self.__password
+        """Returns the admin's encoded password hash."""
+        return self.__password_hash
 
     def set_password(self, password: str) -> None:
-        """Updates the admin's password (should be hashed for security)."""
-        self.__password = password
+        """Updates the admin's password, storing only its salted hash."""
+        self.__password_hash = User.password_hasher.hash_password(password)
 
-    def manage_rooms(self) -> None:
-        """Manages hotel rooms, such as adding or removing rooms."""
-        print("Managing rooms...")
-
-    def view_reports(self) -> str:
-        """Retrieves and displays system reports."""
-        return "Displaying system reports..."
+    def authenticate(self, username: str, password: str, source: str = None) -> bool:
+        """Checks the admin's username and password against the stored hash, subject to User.rate_limiter."""
+        if not User.check_rate_limit(username, source):
+            return False
+        if self.__username != username:
+            return User.password_hasher.verify_unknown(password)
+        return User.password_hasher.verify_password(password, self.get_password())
+
+    def manage_rooms(self, add_rooms: list = (), remove_rooms: list = ()) -> int:
+        """Manages hotel rooms, adding and removing rooms in Admin.room_catalog; returns the catalog size."""
+        added = Admin.room_catalog.add_rooms(add_rooms)
+        removed = sum(Admin.room_catalog.remove_room(room) for room in remove_rooms)
+        EventLog.emit("admin.rooms_managed", "Managing rooms...", admin_id=self.__admin_id, added=added, removed=removed)
+        return len(Admin.room_catalog)
+
+    def view_reports(self, payments=None) -> str:
+        """Retrieves the financial report (see generate_financial_report()) formatted for display."""
+        report = self.generate_financial_report(payments)
+        lines = [f"Payments: {report['payments']}, Revenue: ${report['revenue']}, Refunds: {report['refunds']} (${report['refund_total']}), Failure rate: {report['failure_rate']:.1%}"]
+        for title, key in (("Revenue by room type", "revenue_by_room_type"), ("Revenue by payment method", "revenue_by_method")):
+            lines.append(f"{title}: " + ", ".join(f"{name}: ${total}" for name, total in report[key].items()))
+        return "\n".join(lines)
 
     def approve_service_requests(self, request_id: int) -> None:
         """Approves a service request based on its ID."""
-        print(f"Service request {request_id} approved.")
+        EventLog.emit("admin.service_request_approved", "Service request {request_id} approved.", admin_id=self.__admin_id, request_id=request_id)
 
-    def assign_employees_to_requests(self) -> None:
-        """Assigns employees to handle specific service requests."""
-        print("Assigning employees to service requests...")
+    def assign_employees_to_requests(self) -> list:
+        """Assigns queued service requests to the least-loaded employees; returns (request_id, employee_id) pairs."""
+        assignments = Employee.dispatcher.dispatch()
+        EventLog.emit("admin.employees_assigned", "Assigning employees to service requests...", admin_id=self.__admin_id, assigned=len(assignments))
+        return assignments
 
     def monitor_system_activity(self) -> dict:
-        """Monitors the system's current activity, including status and active users."""
-        return {"status": "System running smoothly", "active_users": 120}
+        """
+        Monitors the system's current activity: active sessions and, while Instrumentation is
+        enabled, live latency percentiles and throughput of the instrumented hot paths.
+        """
+        return {
+            "status": "System running smoothly",
+            "active_users": len(User.active_sessions),
+            "instrumented": Instrumentation.is_enabled(),
+            "latency": Instrumentation.snapshot(),
+        }
 
     def update_hotel_policies(self, policy: str) -> None:
         """Updates hotel policies."""
-        print(f"Updated hotel policy: {policy}")
+        EventLog.emit("admin.policy_updated", "Updated hotel policy: {policy}", admin_id=self.__admin_id, policy=policy)
 
-    def generate_financial_report(self) -> str:
-        """Generates a financial report for the hotel."""
-        return "Financial report generated."
+    def generate_financial_report(self, payments=None) -> dict:
+        """
+        Generates a financial report in one streaming pass over the given Payment objects, or over
+        every payment in User.repository when none are given.
+        """
+        if payments is not None:
+            records = FinancialReport.payment_records(payments)
+        elif User.repository is not None:
+            records = User.repository.iter_payments()
+        else:
+            records = ()
+        report = FinancialReport().consume(records).get_report()
+        EventLog.emit("admin.financial_report_generated", "Financial report generated.", admin_id=self.__admin_id, payments=report["payments"], revenue=report["revenue"])
+        return report
 
     def block_guest(self, guest_id: int) -> None:
         """Blocks a guest from making further bookings."""
-        print(f"Guest {guest_id} has been blocked.")
+        EventLog.emit("admin.guest_blocked", "Guest {guest_id} has been blocked.", admin_id=self.__admin_id, guest_id=guest_id)
 
-    def change_room_prices(self, new_price: float, room_type: str) -> None:
-        """Updates the price for a specific type of room."""
-        print(f"Updated price of {room_type} rooms to {new_price}.")
+    def change_room_prices(self, new_price: float, room_type: str) -> int:
+        """Updates the price for a specific type of room in Admin.room_catalog and returns how many rooms changed."""
+        changed = Admin.room_catalog.set_type_price(room_type, new_price)
+        EventLog.emit("admin.room_prices_changed", "Updated price of {room_type} rooms to {new_price}.", admin_id=self.__admin_id, room_type=room_type, new_price=new_price, rooms=changed)
+        return changed
 
     def add_new_employee(self, employee: "Employee") -> None:
-        """Adds a new employee to the system."""
-        print(f"New employee {employee.get_name()} added to the system.")
+        """Adds a new employee to the system and makes them available to Employee.dispatcher."""
+        Employee.dispatcher.add_employee(employee)
+        EventLog.emit("admin.employee_added", "New employee {name} added to the system.", admin_id=self.__admin_id, employee_id=employee.get_employee_id(), name=employee.get_name())
 
     def remove_employee(self, employee_id: int) -> None:
-        """Removes an employee from the system."""
-        print(f"Employee with ID {employee_id} has been removed.")
+        """Removes an employee from the system, returning their active service requests to the queue."""
+        Employee.dispatcher.remove_employee(employee_id)
+        EventLog.emit("admin.employee_removed", "Employee with ID {employee_id} has been removed.", admin_id=self.__admin_id, employee_id=employee_id)
 
     def __str__(self) -> str:
         """Returns a string representation of the Admin object."""
@@ -1019,6 +4952,121 @@ admin1.set_password("newsecurepass")
 # Printing Updated Admin Info
 print(admin1)  # Output: Admin(ID: 1, Username: superadmin)
 
+# Managing the room inventory
+new_rooms = [Room(801, "Single", ["Wi-Fi"], 90.0), Room(802, "Single", [], 95.0)]
+print(admin1.manage_rooms(add_rooms=new_rooms))  # Output: 2
+print(admin1.change_room_prices(99.0, "Single"))  # Output: 2
+print(admin1.manage_rooms(remove_rooms=new_rooms))  # Output: 0
+
+# Live activity: sessions from login/logout and latency of the instrumented hot paths
+Instrumentation.enable()
+user1.login("alice123", "pass123")
+for _ in range(3):
+    Room.availability_index.find_free_rooms("Single", "2025-10-01", "2025-10-03")
+activity = admin1.monitor_system_activity()
+print(activity["active_users"], activity["latency"]["login"]["calls"], activity["latency"]["availability_search"]["calls"])  # Output: 1 1 3
+user1.logout()
+Instrumentation.disable()
+print(admin1.monitor_system_activity()["active_users"], Instrumentation.is_enabled())  # Output: 0 False
+
+
+# FeedbackStore class
+class FeedbackStore:
+    """
+    Holds feedback entries with running rating aggregates and lookup indexes.
+
+    The rating sum, per-rating buckets and per-guest index are updated on every add, rating
+    change and removal, so averages are O(1) and guest or rating lookups never scan all feedback.
+    Every entry keeps the sequence number it was added with, and each rating bucket stays in that
+    order, so results merged across buckets come back in insertion order.
+    """
+
+    def __init__(self):
+        """Initializes an empty store."""
+        self.__entries = {}  # Feedback -> [guest_id, rating, sequence], in insertion order
+        self.__by_guest = {}  # guest_id -> {Feedback: None}
+        self.__by_rating = {}  # rating -> {Feedback: None}, in sequence order
+        self.__rating_sum = 0
+        self.__next_sequence = 0
+
+    def __len__(self) -> int:
+        """Returns the number of stored feedback entries."""
+        return len(self.__entries)
+
+    def __iter__(self):
+        """Iterates over feedback entries in the order they were added."""
+        return iter(self.__entries)
+
+    def __contains__(self, feedback: "Feedback") -> bool:
+        """Checks whether a feedback entry is stored."""
+        return feedback in self.__entries
+
+    def add(self, feedback: "Feedback", guest_id: int, rating: int) -> None:
+        """Stores a feedback entry and updates the aggregates."""
+        self.__entries[feedback] = [guest_id, rating, self.__next_sequence]
+        self.__next_sequence += 1
+        self.__by_guest.setdefault(guest_id, {})[feedback] = None
+        self.__by_rating.setdefault(rating, {})[feedback] = None
+        self.__rating_sum += rating
+
+    def remove(self, feedback: "Feedback") -> None:
+        """
+        Removes a feedback entry and updates the aggregates.
+
+        :raises ValueError: If the feedback is not stored.
+        """
+        if feedback not in self.__entries:
+            raise ValueError("Feedback is not in the store.")
+        guest_id, rating, _ = self.__entries.pop(feedback)
+        self.__discard(self.__by_guest, guest_id, feedback)
+        self.__discard(self.__by_rating, rating, feedback)
+        self.__rating_sum -= rating
+
+    def change_rating(self, feedback: "Feedback", new_rating: int) -> None:
+        """Moves a stored feedback entry to a new rating bucket."""
+        entry = self.__entries.get(feedback)
+        if entry is None or entry[1] == new_rating:
+            return
+        self.__discard(self.__by_rating, entry[1], feedback)
+        entries = self.__entries
+        bucket = self.__by_rating.setdefault(new_rating, {})
+        out_of_order = bool(bucket) and entries[next(reversed(bucket))][2] > entry[2]
+        bucket[feedback] = None
+        if out_of_order:  # An older entry moved in, so restore sequence order
+            self.__by_rating[new_rating] = dict.fromkeys(sorted(bucket, key=lambda other: entries[other][2]))
+        self.__rating_sum += new_rating - entry[1]
+        entry[1] = new_rating
+
+    @staticmethod
+    def __discard(index: dict, key, feedback: "Feedback") -> None:
+        """Removes feedback from an index bucket, dropping the bucket once it is empty."""
+        bucket = index[key]
+        del bucket[feedback]
+        if not bucket:
+            del index[key]
+
+    def get_average_rating(self) -> float:
+        """Returns the average rating, or 0.0 when the store is empty."""
+        if not self.__entries:
+            return 0.0
+        return self.__rating_sum / len(self.__entries)
+
+    def get_rating_histogram(self) -> dict:
+        """Returns the number of feedback entries per rating, in ascending rating order."""
+        return {rating: len(self.__by_rating[rating]) for rating in sorted(self.__by_rating)}
+
+    def filter_by_rating(self, min_rating: int) -> list:
+        """Returns feedback rated at least min_rating in the order it was added, merging the rating buckets by sequence."""
+        buckets = [bucket for rating, bucket in self.__by_rating.items() if rating >= min_rating]
+        if len(buckets) == 1:
+            return list(buckets[0])
+        entries = self.__entries
+        return list(heapq.merge(*buckets, key=lambda feedback: entries[feedback][2]))
+
+    def get_guest_feedback(self, guest_id: int) -> list:
+        """Returns the feedback entries left by a guest."""
+        return list(self.__by_guest.get(guest_id, ()))
+
 
 #Feedback Class
 class Feedback:
@@ -1026,7 +5074,9 @@ class Feedback:
     Represents guest feedback with rating and comments, along with admin interactions.
     """
 
-    all_feedbacks = []  # Stores all feedback instances for filtering and analysis
+    __slots__ = ("__feedback_id", "__guest", "__rating", "__comments")
+
+    all_feedbacks = FeedbackStore()  # Stores all feedback instances with indexes for filtering and analysis
 
     def __init__(self, feedback_id: int, guest: "Guest", rating: int, comments: str):
         """
@@ -1041,7 +5091,8 @@ class Feedback:
         self.__guest = guest
         self.__rating = rating
         self.__comments = comments
-        Feedback.all_feedbacks.append(self)  # Store feedback globally
+        Feedback.all_feedbacks.add(self, guest.get_guest_id(), rating)  # Store feedback globally
+        EventLog.emit("feedback.added", "Feedback {feedback_id} added with rating {rating}.", feedback_id=feedback_id, guest_id=guest.get_guest_id(), rating=rating, comments=comments)
 
     # Getter and Setter for feedback_id
     def get_feedback_id(self) -> int:
@@ -1059,6 +5110,7 @@ class Feedback:
 
     def set_rating(self, rating: int) -> None:
         """Updates the feedback rating."""
+        Feedback.all_feedbacks.change_rating(self, rating)
         self.__rating = rating
 
     # Getter and Setter for comments
@@ -1072,9 +5124,10 @@ class Feedback:
 
     def submit_feedback(self, rating: int, comments: str) -> None:
         """Updates feedback rating and comments."""
+        Feedback.all_feedbacks.change_rating(self, rating)
         self.__rating = rating
         self.__comments = comments
-        print(f"Feedback submitted: Rating {rating}, Comment: {comments}")
+        EventLog.emit("feedback.submitted", "Feedback submitted: Rating {rating}, Comment: {comments}", feedback_id=self.__feedback_id, rating=rating, comments=comments)
 
     def view_feedback(self) -> str:
         """Returns feedback details."""
@@ -1082,36 +5135,34 @@ class Feedback:
 
     @staticmethod
     def get_average_rating() -> float:
-        """Calculates and returns the average rating from all feedbacks."""
-        if not Feedback.all_feedbacks:
-            return 0.0
-        total_rating = sum(f.__rating for f in Feedback.all_feedbacks)
-        return total_rating / len(Feedback.all_feedbacks)
+        """Returns the average rating from all feedbacks, kept as a running total."""
+        return Feedback.all_feedbacks.get_average_rating()
 
     @staticmethod
     def filter_feedback_by_rating(min_rating: int) -> list:
-        """Filters and returns feedback with ratings greater than or equal to min_rating."""
-        return [f for f in Feedback.all_feedbacks if f.__rating >= min_rating]
+        """Returns feedback with ratings greater than or equal to min_rating, in the order it was added."""
+        return Feedback.all_feedbacks.filter_by_rating(min_rating)
 
     def edit_feedback(self, new_rating: int, new_comments: str) -> None:
         """Edits an existing feedback entry."""
+        Feedback.all_feedbacks.change_rating(self, new_rating)
         self.__rating = new_rating
         self.__comments = new_comments
-        print(f"Feedback updated: Rating {new_rating}, Comment: {new_comments}")
+        EventLog.emit("feedback.edited", "Feedback updated: Rating {rating}, Comment: {comments}", feedback_id=self.__feedback_id, rating=new_rating, comments=new_comments)
 
     def delete_feedback(self) -> None:
         """Deletes a feedback entry."""
         Feedback.all_feedbacks.remove(self)
-        print("Feedback deleted successfully.")
+        EventLog.emit("feedback.deleted", "Feedback deleted successfully.", feedback_id=self.__feedback_id)
 
     @staticmethod
     def get_guest_feedback(guest_id: int) -> list:
         """Retrieves all feedback entries for a specific guest ID."""
-        return [f for f in Feedback.all_feedbacks if f.__guest.get_guest_id() == guest_id]
+        return Feedback.all_feedbacks.get_guest_feedback(guest_id)
 
     def reply_to_feedback(self, admin: "Admin", response: str) -> None:
         """Allows an admin to reply to feedback."""
-        print(f"Admin {admin.get_username()} replied to Feedback {self.__feedback_id}: {response}")
+        EventLog.emit("feedback.replied", "Admin {admin} replied to Feedback {feedback_id}: {response}", feedback_id=self.__feedback_id, admin=admin.get_username(), response=response)
 
     @staticmethod
     def analyze_feedback_trends() -> dict:
@@ -1119,12 +5170,24 @@ class Feedback:
         return {
             "Total Feedbacks": len(Feedback.all_feedbacks),
             "Average Rating": Feedback.get_average_rating(),
+            "Rating Histogram": Feedback.all_feedbacks.get_rating_histogram(),
         }
 
     def __str__(self) -> str:
         """Returns a string representation of the Feedback object."""
         return f"Feedback(ID: {self.__feedback_id}, Guest: {self.__guest.get_name()}, Rating: {self.__rating}, Comments: {self.__comments})"
 
+    # Persistence
+    def to_record(self) -> tuple:
+        """Returns the feedback as a flat tuple for persistence, referencing its guest by ID."""
+        return (self.__feedback_id, self.__guest.get_guest_id(), self.__rating, self.__comments)
+
+    @classmethod
+    def from_record(cls, record: tuple, guest: "Guest") -> "Feedback":
+        """Rebuilds feedback from to_record() output and its already loaded guest (it joins Feedback.all_feedbacks)."""
+        feedback_id, _, rating, comments = record
+        return cls(feedback_id, guest, rating, comments)
+
 
 # Example Usage
 guest1 = Guest(301, "Alice Smith", "alice@email.com")
@@ -1144,3 +5207,431 @@ print(feedback1.view_feedback())  # Output: Feedback ID: 101, Rating: 4, Comment
 
 # Printing Feedback Object
 print(feedback1)  # Output: Feedback(ID: 101, Guest: Alice Smith, Rating: 4, Comments: Good service, but can improve.)
+
+# Aggregates come from the indexed feedback store
+feedback2 = Feedback(102, guest1, 2, "Noisy corridor.")
+print(Feedback.analyze_feedback_trends())  # Output: {'Total Feedbacks': 2, 'Average Rating': 3.0, 'Rating Histogram': {2: 1, 4: 1}}
+feedback2.delete_feedback()
+print(len(Feedback.get_guest_feedback(301)))  # Output: 1
+
+
+# HotelRepository class
+class HotelRepository:
+    """
+    Persists users, employees, guests, rooms, bookings, payments and feedback in SQLite.
+
+    One connection is opened in WAL mode and reused; statements are parameterized so sqlite3 caches
+    them, and bulk saves go through executemany inside a single transaction. Rows are the objects'
+    to_record() tuples, and loads rebuild objects with from_record().
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            user_id INTEGER PRIMARY KEY, name TEXT, contact_info TEXT,
+            username TEXT UNIQUE, password_hash TEXT, user_role TEXT, guest_id INTEGER);
+        CREATE TABLE IF NOT EXISTS employees (
+            employee_id INTEGER PRIMARY KEY, name TEXT, role TEXT, admin_id INTEGER,
+            username TEXT UNIQUE, password_hash TEXT, assigned_requests TEXT);
+        CREATE TABLE IF NOT EXISTS guests (
+            guest_id INTEGER PRIMARY KEY, name TEXT, contact_info TEXT,
+            loyalty_status INTEGER, loyalty_points INTEGER);
+        CREATE TABLE IF NOT EXISTS rooms (
+            room_number INTEGER PRIMARY KEY, room_type TEXT, amenities TEXT,
+            price_per_night REAL, availability_status INTEGER);
+        CREATE TABLE IF NOT EXISTS bookings (
+            booking_id INTEGER PRIMARY KEY, guest_id INTEGER, room_number INTEGER,
+            check_in INTEGER, check_out INTEGER, status TEXT, special_requests TEXT, discount REAL);
+        CREATE TABLE IF NOT EXISTS payments (
+            payment_id INTEGER PRIMARY KEY, booking_id INTEGER, amount REAL,
+            payment_method TEXT, status TEXT, splits TEXT);
+        CREATE TABLE IF NOT EXISTS feedback (
+            feedback_id INTEGER PRIMARY KEY, guest_id INTEGER, rating INTEGER, comments TEXT);
+        CREATE INDEX IF NOT EXISTS bookings_guest ON bookings (guest_id);
+        CREATE INDEX IF NOT EXISTS bookings_room_dates ON bookings (room_number, check_in, check_out);
+        CREATE INDEX IF NOT EXISTS bookings_dates ON bookings (check_in, check_out);
+        CREATE INDEX IF NOT EXISTS payments_booking ON payments (booking_id);
+        CREATE INDEX IF NOT EXISTS feedback_guest ON feedback (guest_id);
+    """
+
+    TABLES = {  # table -> column count of the matching to_record() tuple
+        "users": 7, "employees": 7, "guests": 5, "rooms": 5, "bookings": 8, "payments": 6, "feedback": 4,
+    }
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Opens (or creates) the database.
+
+        :param path: SQLite database file, or ":memory:" for a throwaway database.
+        """
+        self.__connection = sqlite3.connect(path, cached_statements=256)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(HotelRepository.SCHEMA)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.__connection.close()
+
+    # Saving
+    def __save(self, table: str, records) -> int:
+        """Inserts or replaces records in one transaction and returns how many were written."""
+        placeholders = ", ".join("?" * HotelRepository.TABLES[table])
+        with self.__connection:
+            cursor = self.__connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})", records)
+        return cursor.rowcount
+
+    def save_users(self, users) -> int:
+        """Saves User objects."""
+        return self.__save("users", (user.to_record() for user in users))
+
+    def save_employees(self, employees) -> int:
+        """Saves Employee objects."""
+        return self.__save("employees", (employee.to_record() for employee in employees))
+
+    def save_guests(self, guests) -> int:
+        """Saves Guest objects."""
+        return self.__save("guests", (guest.to_record() for guest in guests))
+
+    def save_rooms(self, rooms) -> int:
+        """Saves Room objects."""
+        return self.__save("rooms", (room.to_record() for room in rooms))
+
+    def save_bookings(self, bookings) -> int:
+        """Saves Booking objects (or anything with a compatible to_record())."""
+        return self.__save("bookings", (booking.to_record() for booking in bookings))
+
+    def save_payments(self, payments) -> int:
+        """Saves Payment objects."""
+        return self.__save("payments", (payment.to_record() for payment in payments))
+
+    def save_feedback(self, feedbacks) -> int:
+        """Saves Feedback objects."""
+        return self.__save("feedback", (feedback.to_record() for feedback in feedbacks))
+
+    # Loading
+    def __rows(self, table: str, order_by: str):
+        """Streams every row of a table."""
+        return self.__connection.execute(f"SELECT * FROM {table} ORDER BY {order_by}")
+
+    def load_users(self) -> dict:
+        """Loads all users keyed by user ID."""
+        return {row[0]: User.from_record(row) for row in self.__rows("users", "user_id")}
+
+    def load_employees(self) -> dict:
+        """Loads all employees keyed by employee ID."""
+        return {row[0]: Employee.from_record(row) for row in self.__rows("employees", "employee_id")}
+
+    def load_guests(self) -> dict:
+        """Loads all guests keyed by guest ID."""
+        return {row[0]: Guest.from_record(row) for row in self.__rows("guests", "guest_id")}
+
+    def load_rooms(self) -> dict:
+        """Loads all rooms keyed by room number."""
+        return {row[0]: Room.from_record(row) for row in self.__rows("rooms", "room_number")}
+
+    def load_bookings(self, guests: dict, rooms: dict) -> dict:
+        """Loads all bookings keyed by booking ID, linking them to already loaded guests and rooms."""
+        return {row[0]: Booking.from_record(row, guests[row[1]], rooms[row[2]]) for row in self.__rows("bookings", "booking_id")}
+
+    def load_payments(self, bookings: dict) -> dict:
+        """Loads all payments keyed by payment ID, linking them to already loaded bookings."""
+        return {row[0]: Payment.from_record(row, bookings.get(row[1])) for row in self.__rows("payments", "payment_id")}
+
+    def load_feedback(self, guests: dict) -> dict:
+        """Loads all feedback keyed by feedback ID, linking it to already loaded guests."""
+        return {row[0]: Feedback.from_record(row, guests[row[1]]) for row in self.__rows("feedback", "feedback_id")}
+
+    # Queries
+    def count(self, table: str) -> int:
+        """Returns the number of rows in a table."""
+        if table not in HotelRepository.TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        return self.__connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def get_guest_bookings(self, guest_id: int) -> list:
+        """Returns a guest's booking records ordered by check-in (uses the guest index)."""
+        return self.__connection.execute(
+            "SELECT * FROM bookings WHERE guest_id = ? ORDER BY check_in", (guest_id,)
+        ).fetchall()
+
+    def get_room_bookings(self, room_number: int, check_in, check_out, status: str = "Confirmed") -> list:
+        """Returns booking records for a room overlapping [check_in, check_out) (uses the room/date index)."""
+        return self.__connection.execute(
+            "SELECT * FROM bookings WHERE room_number = ? AND check_in < ? AND check_out > ? AND status = ?",
+            (room_number, to_ordinal(check_out), to_ordinal(check_in), status),
+        ).fetchall()
+
+    def iter_payments(self, batch_size: int = 10000):
+        """
+        Streams every payment as a FinancialReport record (amount, status, splits, day, room_type),
+        joining its booking's check-in day and room type and fetching batch_size rows at a time.
+        """
+        cursor = self.__connection.execute(
+            "SELECT p.amount, p.status, p.payment_method, p.splits, b.check_in, r.room_type FROM payments p "
+            "LEFT JOIN bookings b ON b.booking_id = p.booking_id LEFT JOIN rooms r ON r.room_number = b.room_number"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for amount, status, method, splits, day, room_type in rows:
+                splits = ((method, amount),) if splits is None else Payment.scale_splits(json.loads(splits), amount)
+                yield amount, status, splits, day, room_type
+
+    def get_bookings_between(self, start, end) -> list:
+        """Returns booking records checking in on a day in [start, end) (uses the date index)."""
+        return self.__connection.execute(
+            "SELECT * FROM bookings WHERE check_in >= ? AND check_in < ? ORDER BY check_in", (to_ordinal(start), to_ordinal(end))
+        ).fetchall()
+
+
+User.repository = HotelRepository()  # Default in-memory store, so booking history and reports work without configuration
+
+
+# Example Usage (a local repository, so the default store stays empty)
+repository = HotelRepository()
+default_repository, User.repository = User.repository, repository
+user1.set_guest_id(1)
+repository.save_guests([guest1])
+repository.save_rooms([Room(105, "Suite", ["Wi-Fi"], 250.0)])
+repository.save_bookings([Booking(1004, Guest(1, "Alicia", "newemail@email.com"), Room(106, "Double", [], 120.0), "2025-09-01", "2025-09-03")])
+print(user1.check_booking_history())  # Output: ['Booking 1004: Room 106, 2025-09-01 to 2025-09-03, Status: Pending']
+repository.save_rooms([booking1.get_room()])
+repository.save_bookings([booking1])
+repository.save_payments([split, refunded])
+print(admin1.view_reports())
+# Output: Payments: 2, Revenue: $600.0, Refunds: 1 ($300.0), Failure rate: 0.0%
+#         Revenue by room type: Suite: $600.0
+#         Revenue by payment method: Credit Card: $400.0, PayPal: $200.0
+User.repository = default_repository
+user1.set_guest_id(None)
+
+
+# HotelState class
+class HotelState:
+    """
+    Hotel state rebuilt from journaled events: bookings, payments, loyalty balances and feedback ratings.
+    """
+
+    def __init__(self):
+        """Initializes an empty state."""
+        self.bookings = {}  # booking_id -> [guest_id, room_number, check_in, check_out, status]
+        self.payments = {}  # payment_id -> [booking_id, amount, status]
+        self.loyalty_points = {}  # guest_id -> points
+        self.feedback = {}  # feedback_id -> [guest_id, rating]
+
+    def apply(self, event: str, fields: dict) -> None:
+        """Updates the state with one event (see EventJournal.EVENTS)."""
+        if event.startswith("booking."):
+            if event == "booking.created":
+                self.bookings[fields["booking_id"]] = [fields["guest_id"], fields["room_number"], fields["check_in"], fields["check_out"], fields["status"]]
+                return
+            booking = self.bookings.get(fields["booking_id"])
+            if booking is None:
+                return
+            if event == "booking.confirmed":
+                booking[4] = "Confirmed"
+            elif event == "booking.cancelled":
+                booking[4] = "Cancelled"
+            elif event == "booking.modified":
+                booking[2], booking[3] = fields["check_in"], fields["check_out"]
+            elif event == "booking.extended":
+                booking[3] = fields["check_out"]
+            elif event == "booking.room_assigned":
+                booking[1] = fields["room_number"]
+        elif event.startswith("payment."):
+            payment = self.payments.setdefault(fields["payment_id"], [None, 0.0, "Pending"])
+            if event == "payment.processed":
+                payment[0], payment[1], payment[2] = fields["booking_id"], fields["amount"], "Completed"
+            elif event == "payment.refunded":
+                payment[2] = "Refunded"
+            elif event == "payment.failed":
+                payment[2] = "Failed"
+        elif event in ("loyalty.earned", "loyalty.redeemed"):
+            self.loyalty_points[fields["guest_id"]] = fields["total"]
+        elif event == "guest.loyalty_joined":
+            self.loyalty_points[fields["guest_id"]] = fields["points"]
+        elif event == "feedback.added":
+            self.feedback[fields["feedback_id"]] = [fields["guest_id"], fields["rating"]]
+        elif event in ("feedback.edited", "feedback.submitted"):
+            if fields["feedback_id"] in self.feedback:
+                self.feedback[fields["feedback_id"]][1] = fields["rating"]
+        elif event == "feedback.deleted":
+            self.feedback.pop(fields["feedback_id"], None)
+
+    def to_dict(self) -> dict:
+        """Returns the state as JSON-compatible data."""
+        return {name: [[key, *value] if isinstance(value, list) else [key, value] for key, value in getattr(self, name).items()]
+                for name in ("bookings", "payments", "loyalty_points", "feedback")}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HotelState":
+        """Rebuilds a state from to_dict() output."""
+        state = cls()
+        state.bookings = {row[0]: row[1:] for row in data["bookings"]}
+        state.payments = {row[0]: row[1:] for row in data["payments"]}
+        state.loyalty_points = {row[0]: row[1] for row in data["loyalty_points"]}
+        state.feedback = {row[0]: row[1:] for row in data["feedback"]}
+        return state
+
+
+# EventJournal class
+class EventJournal(EventSink):
+    """
+    Append-only, crash-safe journal of domain events, attached with EventLog.add_sink.
+
+    File layout: an 8-byte magic header, then records of [payload length: u32][CRC32: u32][payload],
+    where the payload is a one-byte event code followed by the JSON-encoded fields. Records are
+    buffered and written with one fsync per group (group commit): after group_size records or once
+    group_interval seconds have passed since the last sync, checked as events arrive; sync() and
+    close() force it. Every snapshot_every events the replayed HotelState is written to
+    snapshot_path (atomically, via a temporary file and os.replace) along with the journal offset
+    it covers, so opening the journal after a crash loads the snapshot and replays only the tail.
+    A torn or corrupt tail record is truncated on open. Writes, syncs and snapshots hold one lock,
+    so events emitted from several threads (e.g. PaymentPipeline workers) are journaled whole.
+    """
+
+    MAGIC = b"RSJRNL01"
+    HEADER = struct.Struct("<II")
+    EVENTS = (
+        "booking.created", "booking.confirmed", "booking.cancelled", "booking.modified", "booking.extended", "booking.room_assigned",
+        "payment.processed", "payment.refunded", "payment.failed",
+        "guest.loyalty_joined", "loyalty.earned", "loyalty.redeemed",
+        "feedback.added", "feedback.edited", "feedback.submitted", "feedback.deleted",
+    )
+    CODES = {event: code for code, event in enumerate(EVENTS)}
+
+    def __init__(self, path: str, snapshot_path: str = None, group_size: int = 256, group_interval: float = 0.05, snapshot_every: int = 1000000):
+        """
+        Opens the journal, recovering state from the snapshot and the journal tail.
+
+        :param path: Journal file (created if missing).
+        :param snapshot_path: Snapshot file; None disables snapshots.
+        :param group_size: Records per fsync group.
+        :param group_interval: Maximum seconds between fsyncs while events keep arriving.
+        :param snapshot_every: Events between automatic snapshots.
+        """
+        self.__snapshot_path = snapshot_path
+        self.__group_size = group_size
+        self.__group_interval = group_interval
+        self.__snapshot_every = snapshot_every
+        self.__state, end_offset, self.__replayed = EventJournal.recover(path, snapshot_path)
+        self.__file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        if end_offset == 0:
+            self.__file.write(EventJournal.MAGIC)
+            end_offset = len(EventJournal.MAGIC)
+        self.__file.truncate(end_offset)
+        self.__file.seek(end_offset)
+        self.__offset = end_offset  # Byte offset just past the last durable record
+        self.__buffer = []
+        self.__buffered_bytes = 0
+        self.__last_sync = time.monotonic()
+        self.__since_snapshot = 0
+        self.__lock = threading.RLock()  # Reentrant: write() may sync() and snapshot(), which syncs again
+
+    @staticmethod
+    def recover(path: str, snapshot_path: str = None) -> tuple:
+        """
+        Loads the snapshot (if any) and replays the journal records after it.
+
+        :return: (HotelState, offset just past the last valid record or 0 for a new journal, events replayed).
+        """
+        state, offset = HotelState(), len(EventJournal.MAGIC)
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            with open(snapshot_path, "r", encoding="utf-8") as snapshot:
+                data = json.load(snapshot)
+            state, offset = HotelState.from_dict(data["state"]), data["offset"]
+        if not os.path.exists(path) or os.path.getsize(path) < len(EventJournal.MAGIC):
+            return state, 0, 0
+        replayed = 0
+        header = EventJournal.HEADER
+        with open(path, "rb") as journal:
+            if journal.read(len(EventJournal.MAGIC)) != EventJournal.MAGIC:
+                raise ValueError(f"{path} is not an event journal.")
+            journal.seek(offset)
+            data = journal.read()
+        position = 0
+        while position + header.size <= len(data):
+            length, checksum = header.unpack_from(data, position)
+            payload = data[position + header.size:position + header.size + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break  # Torn or corrupt tail: everything before it is intact
+            state.apply(EventJournal.EVENTS[payload[0]], json.loads(payload[1:]))
+            position += header.size + length
+            replayed += 1
+        return state, offset + position, replayed
+
+    def write(self, event: str, message: str, fields: dict) -> None:
+        """Buffers a journaled event; events not listed in EVENTS are ignored."""
+        code = EventJournal.CODES.get(event)
+        if code is None:
+            return
+        payload = bytes((code,)) + json.dumps(fields, separators=(",", ":")).encode()
+        record = EventJournal.HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self.__lock:
+            self.__buffer.append(record)
+            self.__buffered_bytes += len(record)
+            self.__state.apply(event, fields)
+            self.__since_snapshot += 1
+            if len(self.__buffer) >= self.__group_size or time.monotonic() - self.__last_sync >= self.__group_interval:
+                self.sync()
+            if self.__snapshot_path is not None and self.__since_snapshot >= self.__snapshot_every:
+                self.snapshot()
+
+    def sync(self) -> None:
+        """Writes buffered records and fsyncs them (one group commit)."""
+        with self.__lock:
+            if self.__buffer:
+                self.__file.write(b"".join(self.__buffer))
+                self.__offset += self.__buffered_bytes
+                self.__buffer.clear()
+                self.__buffered_bytes = 0
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__last_sync = time.monotonic()
+
+    flush = sync
+
+    def snapshot(self) -> None:
+        """Syncs the journal and atomically writes a snapshot of the current state."""
+        if self.__snapshot_path is None:
+            return
+        with self.__lock:
+            self.sync()
+            temporary = self.__snapshot_path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as snapshot:
+                json.dump({"offset": self.__offset, "state": self.__state.to_dict()}, snapshot)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+            os.replace(temporary, self.__snapshot_path)
+            self.__since_snapshot = 0
+
+    def close(self) -> None:
+        """Syncs outstanding records and closes the journal."""
+        with self.__lock:
+            self.sync()
+            self.__file.close()
+
+    def get_state(self) -> "HotelState":
+        """Returns the state as of the last journaled event."""
+        return self.__state
+
+    def get_replayed_count(self) -> int:
+        """Returns how many journal records were replayed when the journal was opened."""
+        return self.__replayed
+
+
+# Example Usage (run as a script only: it writes and fsyncs a journal in a temporary directory)
+if __name__ == "__main__":
+    journal_directory = tempfile.mkdtemp()
+    journal = EventJournal(os.path.join(journal_directory, "events.journal"), os.path.join(journal_directory, "state.snapshot"))
+    EventLog.add_sink(journal)
+    journaled_booking = Booking(1006, guest1, Room(109, "Suite", ["Wi-Fi"], 200.0), "2025-11-01", "2025-11-04")
+    journaled_booking.confirm_booking()
+    guest1.earn_loyalty_points(600.0)
+    EventLog.remove_sink(journal)
+    journal.close()
+    reopened = EventJournal(os.path.join(journal_directory, "events.journal"), os.path.join(journal_directory, "state.snapshot"))
+    print(reopened.get_replayed_count(), reopened.get_state().bookings[1006])  # Output: 3 [301, 109, 739556, 739559, 'Confirmed']
+    reopened.close()
+    shutil.rmtree(journal_directory)
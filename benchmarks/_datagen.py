@@ -0,0 +1,83 @@
+"""Synthetic, seed-reproducible hotel data for the benchmark suite."""
+import contextlib
+import random
+
+ROOM_TYPES = {"Single": 90.0, "Double": 130.0, "Deluxe": 190.0, "Suite": 280.0, "Penthouse": 650.0}
+AMENITIES = ["Wi-Fi", "TV", "Mini-Bar", "Jacuzzi", "Balcony", "Sea View", "Kitchenette", "Safe"]
+METHODS = ["Credit Card", "PayPal", "Debit Card", "Cash"]
+COMMENTS = ["Great stay", "Room was noisy", "Friendly staff", "Breakfast could improve", "Would come back"]
+
+
+@contextlib.contextmanager
+def isolated(hotel, password_work_factor: int = 2):
+    """
+    Gives a scenario its own availability index, feedback store and loyalty ledger, and a cheap
+    password hash (hashing is measured by bench_login.py, not here), restoring the shared ones after.
+    """
+    saved = (hotel.Room.availability_index, hotel.Feedback.all_feedbacks, hotel.Guest.loyalty_ledger, hotel.User.password_hasher, hotel.User.rate_limiter)
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    hotel.Feedback.all_feedbacks = hotel.FeedbackStore()
+    hotel.Guest.loyalty_ledger = hotel.LoyaltyLedger()
+    hotel.User.password_hasher = hotel.PasswordHasher(n=password_work_factor)
+    hotel.User.rate_limiter = None
+    try:
+        yield
+    finally:
+        (hotel.Room.availability_index, hotel.Feedback.all_feedbacks, hotel.Guest.loyalty_ledger,
+         hotel.User.password_hasher, hotel.User.rate_limiter) = saved
+
+
+def make_users(hotel, count: int, rng: random.Random) -> list:
+    """Users with unique usernames; every password is "pw"."""
+    return [hotel.User(number, f"User {number}", f"user{number}@example.com", f"user{number}", "pw", rng.choice(["Customer", "Staff"])) for number in range(count)]
+
+
+def make_guests(hotel, count: int, rng: random.Random) -> list:
+    """Guests, a tenth of them loyalty members."""
+    guests = [hotel.Guest(number, f"Guest {number}", f"guest{number}@example.com") for number in range(count)]
+    for guest in rng.sample(guests, count // 10):
+        guest.set_loyalty_status(True)
+    return guests
+
+
+def make_rooms(hotel, count: int, rng: random.Random) -> list:
+    """Rooms spread evenly over ROOM_TYPES with prices around the type's base and random amenities."""
+    types = list(ROOM_TYPES.items())
+    return [
+        hotel.Room(100 + number, room_type, [amenity for amenity in AMENITIES if rng.random() < 0.4], round(price * rng.uniform(0.9, 1.1), 2))
+        for number, (room_type, price) in enumerate(types[number % len(types)] for number in range(count))
+    ]
+
+
+def make_bookings(hotel, guests: list, rooms: list, count: int, rng: random.Random, first_day: int, horizon: int = 90, confirmed: float = 0.8) -> list:
+    """Bookings of 1-7 nights starting within horizon days of first_day; a share of them confirmed."""
+    bookings = []
+    for number in range(count):
+        check_in = first_day + rng.randrange(horizon)
+        status = "Confirmed" if rng.random() < confirmed else "Pending"
+        bookings.append(hotel.Booking(number, rng.choice(guests), rng.choice(rooms), check_in, check_in + rng.randint(1, 7), status))
+    return bookings
+
+
+def make_payments(hotel, bookings: list, rng: random.Random) -> list:
+    """One payment per booking for its total cost: mostly completed, some refunded, failed or split."""
+    payments = []
+    for number, booking in enumerate(bookings):
+        status = rng.choices(["Completed", "Refunded", "Failed", "Pending"], weights=[90, 4, 5, 1])[0]
+        payment = hotel.Payment(number, booking, booking.calculate_total_cost(), rng.choice(METHODS), status)
+        if number % 10 == 0 and payment.get_amount() > 50.0:
+            payment.split_payment([payment.get_payment_method(), "Cash"], [payment.get_amount() - 50.0, 50.0])
+        payments.append(payment)
+    return payments
+
+
+def make_feedback(hotel, guests: list, count: int, rng: random.Random) -> list:
+    """Feedback entries skewed towards good ratings."""
+    return [hotel.Feedback(number, rng.choice(guests), rng.choices(range(1, 6), weights=[1, 2, 4, 8, 10])[0], rng.choice(COMMENTS)) for number in range(count)]
+
+
+def release(guests: list) -> None:
+    """Drops the guests' reservation histories so finished scenarios do not keep their bookings alive."""
+    for guest in guests:
+        for booking_id in [booking_id for page in guest.iter_reservation_pages(page_size=1000) for booking_id, _ in page]:
+            guest.remove_reservation(booking_id)
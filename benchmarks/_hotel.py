@@ -0,0 +1,42 @@
+"""Helpers shared by the benchmark scripts."""
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Updated UML Classes code.py")
+
+
+def load_hotel():
+    """Imports the class module (its file name contains spaces) without echoing the example usage output."""
+    if "hotel" in sys.modules:
+        return sys.modules["hotel"]
+    spec = importlib.util.spec_from_file_location("hotel", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hotel"] = module
+    with quiet():
+        spec.loader.exec_module(module)
+    return module
+
+
+def quiet():
+    """Returns a context manager that discards anything printed inside it."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def best_of(function, repeat: int = 5) -> float:
+    """Runs function repeat times and returns the fastest wall-clock time in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_sizes(default: str) -> list:
+    """Reads a comma-separated list of sizes from the first command-line argument."""
+    text = sys.argv[1] if len(sys.argv) > 1 else default
+    return [int(size.replace("_", "")) for size in text.split(",")]
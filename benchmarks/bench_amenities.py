@@ -0,0 +1,55 @@
+"""
+Amenity bitmasks versus per-room string lists: memory per room and whole-inventory amenity filters.
+Rooms keep their amenity order in a tuple shared by every room listing the same names.
+
+Usage: python benchmarks/bench_amenities.py [room counts]   (default: 100000,1000000)
+"""
+import gc
+import random
+import tracemalloc
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+AMENITIES = ["Wi-Fi", "TV", "Mini-Bar", "Jacuzzi", "Balcony", "Sea View", "Kitchenette", "Safe", "Air Conditioning", "Coffee Machine"]
+REQUIRED = ["Jacuzzi", "Wi-Fi", "Balcony"]
+
+
+def traced(build):
+    """Runs build() and returns its result with the memory it allocated."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used
+
+
+def main() -> None:
+    rng = random.Random(17)
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()  # keep the module's shared index small
+    registry = hotel.Room.amenity_registry
+    required_mask = registry.mask_of(REQUIRED)
+    try:
+        print(f"{'rooms':>10} {'lists B/room':>13} {'shared B/room':>13} {'list filter ms':>15} {'mask filter ms':>15}")
+        for count in parse_sizes("100000,1000000"):
+            choices = [[amenity for amenity in AMENITIES if rng.random() < 0.5] for _ in range(count)]
+            # The previous representation: every room holds its own list of names
+            lists, list_bytes = traced(lambda: [list(amenities) for amenities in choices])
+            # What a room holds now: a shared tuple of names (in the room's order) and its bitmask
+            shared, mask_bytes = traced(lambda: [registry.intern_list(amenities) for amenities in choices])
+            masks = [mask for _, mask in shared]
+            rooms = [hotel.Room(number, "Double", amenities, 120.0) for number, amenities in enumerate(choices)]
+            list_time = best_of(lambda: [amenities for amenities in lists if all(name in amenities for name in REQUIRED)], 3)
+            mask_time = best_of(lambda: [room for room in rooms if room.has_amenities(required_mask)], 3)
+            assert sum(1 for amenities in lists if all(name in amenities for name in REQUIRED)) == sum(1 for mask in masks if mask & required_mask == required_mask)
+            print(f"{count:>10} {list_bytes / count:>13.1f} {mask_bytes / count:>13.1f} {list_time * 1e3:>15.1f} {mask_time * 1e3:>15.1f}")
+            del lists, shared, masks, rooms
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Availability search latency as the number of confirmed bookings grows.
+
+Usage: python benchmarks/bench_availability.py [sizes]   (default: 10000,100000,1000000)
+"""
+import random
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_COUNT = 2000
+ROOM_TYPES = ["Single", "Double", "Deluxe", "Suite"]
+FIRST_DAY = hotel.to_ordinal("2025-01-01")
+
+
+def build_index(booking_count: int, rng: random.Random) -> tuple:
+    """Fills a fresh index with back-to-back stays spread evenly over the rooms; returns the index and the rooms."""
+    index = hotel.AvailabilityIndex()
+    rooms = [hotel.Room(100 + number, ROOM_TYPES[number % len(ROOM_TYPES)], [], 100.0) for number in range(ROOM_COUNT)]
+    for room in rooms:
+        index.register_room(room)
+    guest = hotel.Guest(1, "Benchmark Guest", "bench@example.com")
+    next_free = [FIRST_DAY] * ROOM_COUNT
+    for booking_id in range(booking_count):
+        slot = booking_id % ROOM_COUNT
+        check_in = next_free[slot] + rng.randint(0, 2)
+        check_out = check_in + rng.randint(1, 7)
+        next_free[slot] = check_out
+        booking = hotel.Booking(booking_id, guest, rooms[slot], date_text(check_in), date_text(check_out))
+        index.add_booking(booking)
+    return index, rooms
+
+
+def date_text(ordinal: int) -> str:
+    """Formats a day ordinal as YYYY-MM-DD."""
+    return hotel.date.fromordinal(ordinal).isoformat()
+
+
+def main() -> None:
+    rng = random.Random(42)
+    print(f"{'bookings':>10} {'is_room_free (us)':>18} {'find_free_rooms (ms)':>21}")
+    for size in parse_sizes("10000,100000,1000000"):
+        index, rooms = build_index(size, rng)
+        horizon = FIRST_DAY + max(1, size // ROOM_COUNT) * 6
+        queries = [(rng.choice(rooms), rng.randrange(FIRST_DAY, horizon)) for _ in range(10000)]
+
+        def point_queries():
+            for room, check_in in queries:
+                index.is_room_free(room, check_in, check_in + 4)
+
+        def type_search():
+            index.find_free_rooms("Suite", horizon // 2, horizon // 2 + 4)
+
+        point = best_of(point_queries, 3) / len(queries) * 1e6
+        search = best_of(type_search, 3) * 1e3
+        print(f"{index.get_booking_count():>10} {point:>18.2f} {search:>21.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Bulk booking cost computation: parsed day ordinals versus re-splitting date strings on every call.
+
+Usage: python benchmarks/bench_booking_dates.py [sizes]   (default: 100000,1000000)
+"""
+import random
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+
+def string_path_cost(check_in_date: str, check_out_date: str, price: float) -> float:
+    """The previous calculate_total_cost: day-of-month difference from split strings."""
+    num_nights = int(check_out_date.split('-')[2]) - int(check_in_date.split('-')[2])
+    return num_nights * price
+
+
+def main() -> None:
+    rng = random.Random(7)
+    room = hotel.Room(101, "Suite", [], 150.0)
+    guest = hotel.Guest(1, "Benchmark Guest", "bench@example.com")
+    print(f"{'bookings':>10} {'string split (ms)':>18} {'ordinals (ms)':>14} {'speedup':>8}")
+    for size in parse_sizes("100000,1000000"):
+        stays = []
+        for _ in range(size):
+            check_in = hotel.date(2025, rng.randint(1, 12), rng.randint(1, 20))
+            stays.append((check_in.isoformat(), hotel.date.fromordinal(check_in.toordinal() + rng.randint(1, 7)).isoformat()))
+        bookings = [hotel.Booking(number, guest, room, check_in, check_out) for number, (check_in, check_out) in enumerate(stays)]
+
+        def string_path():
+            price = room.get_price()
+            return sum(string_path_cost(check_in, check_out, price) for check_in, check_out in stays)
+
+        def ordinal_path():
+            return sum(booking.calculate_total_cost() for booking in bookings)
+
+        string_time = best_of(string_path, 3)
+        ordinal_time = best_of(ordinal_path, 3)
+        print(f"{size:>10} {string_time * 1e3:>18.1f} {ordinal_time * 1e3:>14.1f} {string_time / ordinal_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Columnar BookingLedger versus a list of Booking objects: memory and bulk query time.
+
+Usage: python benchmarks/bench_booking_ledger.py [sizes]   (default: 100000,1000000)
+"""
+import gc
+import random
+import tracemalloc
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+YEAR_START = hotel.to_ordinal("2025-01-01")
+ROOM_TYPES = ["Single", "Double", "Deluxe", "Suite"]
+STATUSES = ["Pending", "Confirmed", "Confirmed", "Confirmed", "Cancelled"]
+
+
+def traced(build):
+    """Runs build() and returns its result with the memory it allocated."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, used
+
+
+def object_queries(bookings: list, room_types: dict) -> None:
+    """Occupancy, revenue and status counts computed object by object."""
+    occupancy = [0] * 365
+    revenue = {}
+    counts = {}
+    for booking in bookings:
+        status = booking.get_status()
+        counts[status] = counts.get(status, 0) + 1
+        if status != "Confirmed":
+            continue
+        for night in range(max(booking.get_check_in_ordinal(), YEAR_START), min(booking.get_check_out_ordinal(), YEAR_START + 365)):
+            occupancy[night - YEAR_START] += 1
+        room_type = room_types[booking.get_room().get_room_number()]
+        revenue[room_type] = revenue.get(room_type, 0.0) + booking.calculate_total_cost()
+
+
+def ledger_queries(ledger, room_types: dict) -> None:
+    """The same queries over the ledger columns."""
+    ledger.occupancy_by_night(YEAR_START, YEAR_START + 365)
+    ledger.revenue_by_room_type(room_types)
+    ledger.status_counts()
+
+
+def main() -> None:
+    rng = random.Random(11)
+    rooms = [hotel.Room(100 + number, ROOM_TYPES[number % 4], [], 80.0 + 40 * (number % 4)) for number in range(2000)]
+    room_types = {room.get_room_number(): room.get_room_type() for room in rooms}
+    guests = [hotel.Guest(number, "Guest", "guest@example.com") for number in range(1000)]
+    print(f"backend: {'numpy' if hotel.np is not None else 'pure python'}")
+    print(f"{'bookings':>10} {'objects MB':>11} {'ledger MB':>10} {'objects ms':>11} {'ledger ms':>10}")
+    for size in parse_sizes("100000,1000000"):
+        stays = []
+        for booking_id in range(size):
+            check_in = YEAR_START + rng.randrange(360)
+            stays.append((booking_id, rng.choice(guests), rng.choice(rooms), check_in, check_in + rng.randint(1, 7), rng.choice(STATUSES)))
+        bookings, object_bytes = traced(lambda: build_objects(stays))
+        ledger, ledger_bytes = traced(lambda: build_ledger(stays))
+        object_time = best_of(lambda: object_queries(bookings, room_types), 1)
+        ledger_time = best_of(lambda: ledger_queries(ledger, room_types), 3)
+        print(f"{size:>10} {object_bytes / 1e6:>11.1f} {ledger_bytes / 1e6:>10.1f} {object_time * 1e3:>11.1f} {ledger_time * 1e3:>10.1f}")
+        del bookings, ledger
+
+
+def build_objects(stays: list) -> list:
+    """Creates a Booking per stay without growing the shared availability index."""
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()  # freed again before memory is read
+    try:
+        return [hotel.Booking(booking_id, guest, room, check_in, check_out, status) for booking_id, guest, room, check_in, check_out, status in stays]
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+def build_ledger(stays: list):
+    """Appends every stay to a new ledger."""
+    ledger = hotel.BookingLedger()
+    for booking_id, guest, room, check_in, check_out, status in stays:
+        ledger.append(booking_id, guest.get_guest_id(), room.get_room_number(), check_in, check_out, status, (check_out - check_in) * room.get_price())
+    return ledger
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Concurrency stress test and throughput scaling for BookingService.
+
+The on_commit hook sleeps briefly to stand in for I/O, so commands interleave while holding
+their room locks. The stress run fires thousands of concurrent reserve/modify/extend/
+assign_room/cancel commands at a few rooms and then verifies that no two confirmed stays overlap.
+
+Usage: python benchmarks/bench_booking_service.py [commands]   (default: 5000)
+"""
+import asyncio
+import random
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+FIRST_DAY = hotel.to_ordinal("2026-01-01")
+next_room_number = 10000
+
+
+def make_rooms(count: int) -> list:
+    """Creates rooms with numbers no other benchmark or example uses."""
+    global next_room_number
+    rooms = [hotel.Room(next_room_number + number, "Suite", [], 150.0) for number in range(count)]
+    next_room_number += count
+    return rooms
+
+
+def assert_no_overlaps(bookings) -> int:
+    """Raises AssertionError if two confirmed bookings share a room night; returns how many were checked."""
+    stays = {}
+    for booking in bookings:
+        if booking.get_status() == "Confirmed":
+            stays.setdefault(booking.get_room().get_room_number(), []).append((booking.get_check_in_ordinal(), booking.get_check_out_ordinal()))
+    checked = 0
+    for room_number, intervals in stays.items():
+        intervals.sort()
+        for (_, previous_out), (next_in, _) in zip(intervals, intervals[1:]):
+            assert next_in >= previous_out, f"room {room_number} is double-booked"
+        checked += len(intervals)
+    return checked
+
+
+async def io_pause(action, booking) -> None:
+    """Stands in for persistence or a payment hold."""
+    await asyncio.sleep(random.random() * 0.001)
+
+
+async def stress(command_count: int) -> None:
+    rng = random.Random(13)
+    service = hotel.BookingService(on_commit=io_pause)
+    rooms = make_rooms(20)
+    guest = hotel.Guest(1, "Stress Guest", "stress@example.com")
+
+    async def reserve():
+        check_in = FIRST_DAY + rng.randrange(60)
+        return await service.reserve(guest, rng.choice(rooms), check_in, check_in + rng.randint(1, 5))
+
+    async def change(booking_id: int):
+        check_in = FIRST_DAY + rng.randrange(60)
+        action = rng.choice(("reserve", "modify", "extend", "assign_room", "cancel"))
+        if action == "reserve" or service.get_booking(booking_id) is None:
+            return await reserve()
+        if action == "modify":
+            return await service.modify(booking_id, (check_in, check_in + rng.randint(1, 5)))
+        if action == "extend":
+            return await service.extend(booking_id, rng.randint(1, 3))
+        if action == "assign_room":
+            return await service.assign_room(booking_id, rng.choice(rooms))
+        return await service.cancel(booking_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(reserve() for _ in range(command_count // 2)))
+    accepted = service.get_stats()["accepted"]
+    await asyncio.gather(*(change(rng.randint(1, command_count // 2)) for _ in range(command_count - command_count // 2)))
+    elapsed = time.perf_counter() - start
+    bookings = [service.get_booking(booking_id) for booking_id in range(1, command_count + 1) if service.get_booking(booking_id)]
+    print(f"phase 1: {accepted} reservations accepted; phase 2: mixed reserve/modify/extend/assign_room/cancel")
+    checked = assert_no_overlaps(bookings)
+    print(f"stress: {command_count:,} concurrent commands on {len(rooms)} rooms in {elapsed:.2f} s, "
+          f"{service.get_stats()}, {checked} confirmed stays verified with no overlaps")
+
+
+async def scaling(room_count: int, request_count: int) -> float:
+    """Returns reservations per second when requests are spread over room_count rooms."""
+    service = hotel.BookingService(on_commit=lambda action, booking: asyncio.sleep(0.001))
+    rooms = make_rooms(room_count)
+    guest = hotel.Guest(1, "Scaling Guest", "scaling@example.com")
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        service.reserve(guest, rooms[number % room_count], FIRST_DAY + 2 * (number // room_count), FIRST_DAY + 2 * (number // room_count) + 1)
+        for number in range(request_count)
+    ))
+    return request_count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    command_count = parse_sizes("5000")[0]
+    asyncio.run(stress(command_count))
+    print(f"{'rooms':>6} {'reservations/s':>15}")
+    for room_count in (1, 10, 100, 1000):
+        print(f"{room_count:>6} {asyncio.run(scaling(room_count, 2000)):>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Bulk pricing versus pricing one Room/Payment object at a time.
+
+The per-object loop builds real objects, so it is only run up to --loop-limit rows.
+
+Usage: python benchmarks/bench_bulk_pricing.py [sizes] [--loop-limit N]   (default: 10000,1000000,10000000)
+"""
+import random
+import sys
+
+from _hotel import best_of, load_hotel, parse_sizes, quiet
+
+hotel = load_hotel()
+
+
+def make_rows(size: int, rng: random.Random):
+    """Generates random prices, night counts, discounts, VAT rates and coupons (total_costs argument order)."""
+    prices = [rng.choice((90.0, 150.0, 220.0, 300.0)) for _ in range(size)]
+    nights = [rng.randint(1, 14) for _ in range(size)]
+    discounts = [rng.choice((0, 5, 10, 15)) for _ in range(size)]
+    vat_rates = [rng.choice((0, 5, 10)) for _ in range(size)]
+    coupons = [rng.choice(("DISCOUNT10", "", "EXPIRED")) for _ in range(size)]
+    return prices, nights, discounts, vat_rates, coupons
+
+
+def per_object_totals(rooms, rows) -> list:
+    """Prices each row through Room.calculate_discounted_price, Payment.apply_vat and Payment.apply_coupon."""
+    _, nights, discounts, vat_rates, coupons = rows
+    totals = []
+    for room, discount, night_count, vat, coupon in zip(rooms, discounts, nights, vat_rates, coupons):
+        payment = hotel.Payment(0, None, night_count * room.calculate_discounted_price(discount), "Credit Card")
+        payment.apply_vat(vat)
+        payment.apply_coupon(coupon)
+        totals.append(payment.get_amount())
+    return totals
+
+
+def main() -> None:
+    loop_limit = 1_000_000
+    if "--loop-limit" in sys.argv:
+        position = sys.argv.index("--loop-limit")
+        loop_limit = int(sys.argv[position + 1])
+        del sys.argv[position:position + 2]
+    rng = random.Random(3)
+    backend = "numpy" if hotel.np is not None else "pure python"
+    print(f"backend: {backend}")
+    print(f"{'rows':>10} {'per-object (ms)':>16} {'bulk (ms)':>10} {'speedup':>8}")
+    for size in parse_sizes("10000,1000000,10000000"):
+        rows = make_rows(size, rng)
+        if hotel.np is not None:
+            rows = tuple(hotel.np.asarray(column) for column in rows)
+        bulk_time = best_of(lambda: hotel.BulkPricing.total_costs(*rows), 3)
+        if size > loop_limit:
+            print(f"{size:>10} {'skipped':>16} {bulk_time * 1e3:>10.1f} {'-':>8}")
+            continue
+        rooms = [hotel.Room(0, "Benchmark", [], float(price)) for price in rows[0]]
+        with quiet():
+            loop_time = best_of(lambda: per_object_totals(rooms, rows), 1)
+            expected = per_object_totals(rooms, rows)
+        assert list(hotel.BulkPricing.total_costs(*rows)) == expected, "bulk totals differ from the scalar methods"
+        print(f"{size:>10} {loop_time * 1e3:>16.1f} {bulk_time * 1e3:>10.1f} {loop_time / bulk_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Booking-day replay throughput with each event sink attached.
+
+Each replayed booking is created, confirmed, paid (VAT + coupon) and earns loyalty points.
+"print" writes every message to stdout (redirected to os.devnull here) as the classes used to.
+
+Usage: python benchmarks/bench_event_sink.py [bookings]   (default: 500000)
+"""
+import contextlib
+import os
+import shutil
+import tempfile
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+
+def replay(booking_count: int) -> None:
+    """Replays one day of bookings through the domain classes."""
+    guest = hotel.Guest(1, "Replay Guest", "replay@example.com")
+    room = hotel.Room(101, "Suite", [], 150.0)
+    for booking_id in range(booking_count):
+        booking = hotel.Booking(booking_id, guest, room, "2025-03-01", "2025-03-04")
+        booking.confirm_booking()
+        booking.cancel_booking()  # keeps the shared availability index from growing during the replay
+        payment = hotel.Payment(booking_id, booking, booking.calculate_total_cost(), "Credit Card")
+        payment.process_payment()
+        payment.apply_vat(10)
+        payment.apply_coupon("DISCOUNT10")
+        guest.earn_loyalty_points(payment.get_amount())
+
+
+def main() -> None:
+    booking_count = parse_sizes("500000")[0]
+    workdir = tempfile.mkdtemp()
+    sinks = {
+        "none (default)": lambda: None,
+        "print": hotel.PrintSink,
+        "ring buffer": lambda: hotel.RingBufferSink(capacity=100000),
+        "json lines": lambda: hotel.JsonLinesSink(os.path.join(workdir, "events.jsonl")),
+        "queue -> json lines": lambda: hotel.QueueSink(hotel.JsonLinesSink(os.path.join(workdir, "queued.jsonl"))),
+    }
+    print(f"{'sink':>20} {'bookings/s':>12}")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = {}
+        for name, make_sink in sinks.items():
+            sink = make_sink()
+            hotel.EventLog.set_sink(sink)
+
+            def run():
+                replay(booking_count)
+                if sink is not None:
+                    sink.flush()
+
+            elapsed = best_of(run, 1)
+            hotel.EventLog.set_sink(None)
+            if sink is not None:
+                sink.close()
+            results[name] = booking_count / elapsed
+    shutil.rmtree(workdir)
+    for name, rate in results.items():
+        print(f"{name:>20} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
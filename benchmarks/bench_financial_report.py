@@ -0,0 +1,98 @@
+"""
+FinancialReport: one-pass aggregation throughput and peak memory as the payment stream grows, for
+generated records, Payment objects and rows streamed from HotelRepository.iter_payments().
+
+Usage: python benchmarks/bench_financial_report.py [payment counts]   (default: 1000000,5000000; 50000000 works, slowly)
+"""
+import itertools
+import random
+import time
+import tracemalloc
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = ["Single", "Double", "Deluxe", "Suite", "Penthouse"]
+METHODS = ["Credit Card", "PayPal", "Debit Card", "Cash"]
+STATUSES = ["Completed"] * 90 + ["Refunded"] * 4 + ["Failed"] * 5 + ["Pending"]
+FIRST_DAY = hotel.to_ordinal("2025-01-01")
+REPOSITORY_PAYMENTS = 200000
+
+
+def record_pool(size: int = 100003, seed: int = 22) -> list:
+    """Synthetic report records over two years, one in ten split across two methods."""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(size):
+        amount = round(rng.uniform(50.0, 2000.0), 2)
+        if rng.random() < 0.1:
+            splits = ((rng.choice(METHODS), amount * 0.6), (rng.choice(METHODS), amount * 0.4))
+        else:
+            splits = ((rng.choice(METHODS), amount),)
+        pool.append((amount, rng.choice(STATUSES), splits, FIRST_DAY + rng.randrange(730), rng.choice(ROOM_TYPES)))
+    return pool
+
+
+def records(pool: list, count: int):
+    """Streams count records by cycling over the pool, so generating them costs next to nothing."""
+    return itertools.islice(itertools.cycle(pool), count)
+
+
+def measured(run):
+    """Runs run() untraced for its result and elapsed seconds, then again under tracemalloc for its peak memory in bytes."""
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    pool = record_pool()
+    print(f"{'payments':>11} {'records/s':>11} {'peak KiB':>9} {'revenue':>16}")
+    for count in parse_sizes("1000000,5000000"):
+        report, elapsed, peak = measured(lambda: hotel.FinancialReport().consume(records(pool, count)).get_report())
+        print(f"{count:>11,} {count / elapsed:>11,.0f} {peak / 1024:>9.0f} {report['revenue']:>16,.2f}")
+        # Revenue split by day, room type and method must add back up to the total
+        for key in ("revenue_by_day", "revenue_by_room_type", "revenue_by_method"):
+            assert abs(sum(report[key].values()) - report["revenue"]) < 1e-3 * count, key
+
+    # Payment objects, as Admin.generate_financial_report(payments) sees them
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    try:
+        guest = hotel.Guest(1, "Ledger", "ledger@example.com")
+        rooms = [hotel.Room(number, ROOM_TYPES[number % len(ROOM_TYPES)], [], 100.0 + number % 400) for number in range(2000)]
+        bookings = [hotel.Booking(number, guest, rooms[number % len(rooms)], FIRST_DAY + number % 730, FIRST_DAY + number % 730 + 3) for number in range(20000)]
+        rng = random.Random(7)
+        payments = []
+        for number in range(REPOSITORY_PAYMENTS):
+            booking = bookings[number % len(bookings)]
+            payment = hotel.Payment(number, booking, booking.calculate_total_cost(), rng.choice(METHODS), rng.choice(STATUSES))
+            if number % 10 == 0:
+                payment.split_payment([rng.choice(METHODS), "Cash"], [payment.get_amount() - 50.0, 50.0])
+            payments.append(payment)
+        expected, elapsed, _ = measured(lambda: hotel.FinancialReport().consume(hotel.FinancialReport.payment_records(payments)).get_report())
+        print(f"\n{len(payments):,} Payment objects: {len(payments) / elapsed:>11,.0f} records/s")
+
+        repository = hotel.HotelRepository()
+        repository.save_rooms(rooms)
+        repository.save_bookings(bookings)
+        repository.save_payments(payments)
+        report, elapsed, peak = measured(lambda: hotel.FinancialReport().consume(repository.iter_payments()).get_report())
+        print(f"{len(payments):,} repository rows: {len(payments) / elapsed:>11,.0f} records/s, peak {peak / 1024:.0f} KiB")
+        assert report["payments"] == expected["payments"] and report["revenue_by_method"].keys() == expected["revenue_by_method"].keys()
+        assert abs(report["revenue"] - expected["revenue"]) < 1e-2
+        repository.close()
+        for booking in bookings:
+            guest.remove_reservation(booking.get_booking_id())
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
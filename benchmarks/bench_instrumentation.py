@@ -0,0 +1,121 @@
+"""
+Instrumentation overhead: per-call time of each instrumented hot path before the timing wrappers
+are installed ("bare"), with them installed but disabled ("off") and enabled ("on"), plus the cost
+of reading the live dashboard.
+
+Each side repeats its workload for at least DURATION seconds and the best of ROUNDS alternating
+runs is kept. The "calls" column of the snapshot is checked against the calls actually made.
+
+Usage: python benchmarks/bench_instrumentation.py [calls per workload]   (default: 20000)
+"""
+import random
+import time
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = {"Single": 90.0, "Double": 130.0, "Deluxe": 190.0, "Suite": 280.0}
+FIRST_DAY = hotel.to_ordinal("2026-04-01")
+LOGINS = 20  # each one is a full password hash with the default work factor
+DURATION = 0.5
+ROUNDS = 3
+
+
+def per_call(run, count: int) -> tuple:
+    """Repeats run() for at least DURATION seconds and returns the mean seconds per call and the calls made."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        run()
+        calls += count
+        elapsed = time.perf_counter() - start
+        if elapsed >= DURATION:
+            return elapsed / calls, calls
+
+
+def workloads(calls: int, rng: random.Random) -> dict:
+    """Builds one callable per instrumented hot path, each running a realistic batch of calls."""
+    rooms = [hotel.Room(number, room_type, [], price) for number, (room_type, price) in enumerate(list(ROOM_TYPES.items()) * 500)]
+    guest = hotel.Guest(1, "Monitor", "monitor@example.com")
+    bookings = []
+    for number in range(5000):
+        check_in = FIRST_DAY + rng.randrange(120)
+        bookings.append(hotel.Booking(number, guest, rng.choice(rooms), check_in, check_in + rng.randint(1, 5), "Confirmed"))
+    confirmed = bookings[:calls] if calls <= len(bookings) else bookings * (calls // len(bookings))
+    searches = [(rng.choice(list(ROOM_TYPES)), FIRST_DAY + day, FIRST_DAY + day + 3) for day in (rng.randrange(120) for _ in range(calls // 20))]
+    for number in range(200):
+        hotel.Feedback(number, guest, rng.randint(1, 5), "ok")
+    user = hotel.User(1, "Monitor", "monitor@example.com", "monitor", "pw", "Admin")
+
+    def confirm_booking():
+        for booking in confirmed:
+            booking.confirm_booking()
+
+    def process_payment():
+        for payment in [hotel.Payment(number, None, 100.0, "Cash") for number in range(calls)]:
+            payment.process_payment()
+
+    def availability_search():
+        for room_type, check_in, check_out in searches:
+            hotel.Room.availability_index.find_free_rooms(room_type, check_in, check_out)
+
+    def feedback_aggregation():
+        for _ in range(calls):
+            hotel.Feedback.analyze_feedback_trends()
+
+    def login():
+        for _ in range(LOGINS):
+            user.login("monitor", "pw")
+
+    return {
+        "login": (login, LOGINS),
+        "confirm_booking": (confirm_booking, len(confirmed)),
+        "process_payment": (process_payment, calls),
+        "availability_search": (availability_search, len(searches)),
+        "feedback_aggregation": (feedback_aggregation, calls),
+    }, bookings, guest
+
+
+def main() -> None:
+    calls = parse_sizes("20000")[0]
+    rng = random.Random(24)
+    hotel.User.rate_limiter = None  # repeated logins of one user are what is measured
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    try:
+        runs, bookings, guest = workloads(calls, rng)
+        bare = {name: min(per_call(run, count)[0] for _ in range(ROUNDS)) for name, (run, count) in runs.items()}
+        hotel.Instrumentation.enable()
+        hotel.Instrumentation.disable()
+        # Disabled wrappers stay installed, each wrapping the method it replaced
+        for name, (class_name, method) in hotel.Instrumentation.TARGETS.items():
+            assert hotel.__dict__[class_name].__dict__[method].__wrapped__ is not None, name
+        print(f"{'hot path':>21} {'calls':>7} {'bare us':>8} {'off us':>8} {'on us':>8} {'off':>7} {'on':>7} {'timed':>8} {'p50 us':>8} {'p99 us':>8}")
+        for name, (run, count) in runs.items():
+            off = on = float("inf")
+            for _ in range(ROUNDS):  # alternate so drift affects both sides alike
+                off = min(off, per_call(run, count)[0])
+                hotel.Instrumentation.enable()
+                hotel.Instrumentation.reset()
+                seconds, calls_made = per_call(run, count)
+                on = min(on, seconds)
+                stats = hotel.Instrumentation.snapshot()[name]
+                hotel.Instrumentation.disable()
+                assert stats["calls"] == calls_made, (name, stats["calls"], calls_made)
+            timed = stats.get("samples", stats["calls"]) / stats["calls"]
+            base = bare[name]
+            print(f"{name:>21} {count:>7,} {base * 1e6:>8.2f} {off * 1e6:>8.2f} {on * 1e6:>8.2f} {(off - base) / base:>7.1%} {(on - base) / base:>7.1%} {timed:>8.2%} {stats['p50_us']:>8.1f} {stats['p99_us']:>8.1f}")
+
+        hotel.Instrumentation.enable()
+        admin = hotel.Admin(1, "ops", "pw")
+        print(f"monitor_system_activity: {best_of(admin.monitor_system_activity, 20) * 1e6:.1f} us")
+        hotel.Instrumentation.disable()
+        for booking in bookings:
+            guest.remove_reservation(booking.get_booking_id())
+    finally:
+        hotel.Instrumentation.disable()
+        hotel.Room.availability_index = shared_index
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+EventJournal: append throughput per fsync group size, and recovery time with and without a snapshot.
+
+Usage: python benchmarks/bench_journal.py [sizes]   (default: 100000,1000000; pass 10000000 for the full run)
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+GROUP_SIZES = [1, 16, 256, 4096]
+APPEND_EVENTS = 20000
+
+
+def events(count: int):
+    """Yields a realistic mix of journaled events: create, confirm, pay, earn points."""
+    for number in range(count // 4):
+        booking_id = number
+        yield "booking.created", {"booking_id": booking_id, "guest_id": number % 5000, "room_number": 100 + number % 2000,
+                                  "check_in": 739252 + number % 365, "check_out": 739255 + number % 365, "status": "Pending"}
+        yield "booking.confirmed", {"booking_id": booking_id}
+        yield "payment.processed", {"payment_id": number, "amount": 300.0, "booking_id": booking_id}
+        yield "loyalty.earned", {"guest_id": number % 5000, "points": 30, "total": number}
+
+
+def append(journal, count: int) -> float:
+    """Writes count events and returns the elapsed seconds including the final sync."""
+    start = time.perf_counter()
+    for event, fields in events(count):
+        journal.write(event, "", fields)
+    journal.sync()
+    return time.perf_counter() - start
+
+
+def timed_recover(path: str, snapshot_path: str = None) -> tuple:
+    """Returns (seconds, events replayed) for one recovery."""
+    start = time.perf_counter()
+    _, _, replayed = hotel.EventJournal.recover(path, snapshot_path)
+    return time.perf_counter() - start, replayed
+
+
+def main() -> None:
+    directory = tempfile.mkdtemp()
+    try:
+        print(f"{'group size':>10} {'events/s':>12}")
+        for group_size in GROUP_SIZES:
+            path = os.path.join(directory, f"append-{group_size}.journal")
+            journal = hotel.EventJournal(path, group_size=group_size, group_interval=float("inf"))
+            elapsed = append(journal, APPEND_EVENTS)
+            journal.close()
+            print(f"{group_size:>10} {APPEND_EVENTS / elapsed:>12,.0f}")
+
+        print(f"\n{'events':>10} {'journal MB':>11} {'full replay s':>14} {'with snapshot s':>16} {'tail replayed':>14}")
+        for size in parse_sizes("100000,1000000"):
+            path = os.path.join(directory, "recover.journal")
+            snapshot_path = os.path.join(directory, "recover.snapshot")
+            for stale in (path, snapshot_path):
+                if os.path.exists(stale):
+                    os.remove(stale)
+            # Snapshot every 90% of the run so recovery replays only the last ~10% of events.
+            journal = hotel.EventJournal(path, snapshot_path, group_size=4096, group_interval=float("inf"), snapshot_every=size * 9 // 10)
+            append(journal, size)
+            journal.close()
+            full_time, _ = timed_recover(path)
+            snapshot_time, tail = timed_recover(path, snapshot_path)
+            print(f"{size:>10} {os.path.getsize(path) / 1e6:>11.1f} {full_time:>14.2f} {snapshot_time:>16.2f} {tail:>14,}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Login throughput through UserDirectory for several password hashing cost settings.
+
+"cold" logins run the full password hash; "cached" logins repeat a recently verified
+credential and are answered by the session cache (keyed HMAC-SHA256 comparison).
+
+Cost parameters: scrypt memory is about 128 * n * r bytes per hash (n=2**14, r=8 -> 16 MiB,
+the default), and time grows linearly with n (and with iterations for PBKDF2).
+
+Usage: python benchmarks/bench_login.py [users]   (default: 100000)
+"""
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+SETTINGS = {
+    "scrypt n=2**12": dict(algorithm="scrypt", n=2 ** 12),
+    "scrypt n=2**14 (default)": dict(algorithm="scrypt", n=2 ** 14),
+    "pbkdf2 100k": dict(algorithm="pbkdf2_sha256", iterations=100000),
+    "pbkdf2 600k": dict(algorithm="pbkdf2_sha256", iterations=600000),
+}
+
+
+def rate(function, seconds: float = 1.0) -> float:
+    """Calls function repeatedly for about the given time and returns calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        function(calls)
+        calls += 1
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    user_count = parse_sizes("100000")[0]
+    saved_hasher = hotel.User.password_hasher
+    saved_limiter = hotel.User.rate_limiter
+    hotel.User.rate_limiter = None  # measure hashing cost, not throttling
+    hotel.User.password_hasher = hotel.PasswordHasher(algorithm="pbkdf2_sha256", iterations=1)  # cheap hashes to build the directory
+    directory = hotel.UserDirectory(session_cache_size=user_count)
+    for user_id in range(user_count):
+        directory.add_user(hotel.User(user_id, "User", "user@example.com", f"user{user_id}", "secret", "Guest"))
+    lookup = rate(lambda i: directory.get_user(f"user{i % user_count}"))
+    print(f"{user_count:,} users, username lookups/s: {lookup:,.0f}")
+    print(f"{'setting':>26} {'cold logins/s':>14} {'cached logins/s':>16}")
+    for name, settings in SETTINGS.items():
+        hasher = hotel.PasswordHasher(**settings)
+        hotel.User.password_hasher = hasher
+        directory = hotel.UserDirectory()
+        users = [hotel.User(user_id, "User", "user@example.com", f"user{user_id}", "secret", "Guest") for user_id in range(50)]
+        for user in users:
+            directory.add_user(user)
+        cold = rate(lambda i: (directory.invalidate_session(f"user{i % 50}"), directory.authenticate(f"user{i % 50}", "secret")))
+        for user in users:
+            directory.authenticate(user.get_username(), "secret")
+        cached = rate(lambda i: directory.authenticate(f"user{i % 50}", "secret"))
+        print(f"{name:>26} {cold:>14,.1f} {cached:>16,.0f}")
+    hotel.User.password_hasher = saved_hasher
+    hotel.User.rate_limiter = saved_limiter
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+LoyaltyLedger at scale: per-entry recording, batched accrual from completed payments and the nightly recompute.
+
+Usage: python benchmarks/bench_loyalty_ledger.py [guest counts]   (default: 5000000)
+"""
+import random
+import time
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+BATCH = 200000
+
+
+def make_payments(rng: random.Random, guests: int, room, first_id: int) -> list:
+    """Builds a batch of completed payments, each on a pending booking for a random guest."""
+    payments = []
+    for payment_id in range(first_id, first_id + BATCH):
+        guest = hotel.Guest(rng.randrange(guests), "Guest", "guest@example.com")
+        booking = hotel.Booking(payment_id, guest, room, "2026-03-01", "2026-03-04", "Pending")
+        payments.append(hotel.Payment(payment_id, booking, rng.uniform(50.0, 2000.0), "Credit Card", "Completed"))
+    return payments
+
+
+def main() -> None:
+    rng = random.Random(14)
+    room = hotel.Room(9000, "Suite", [], 250.0)
+    print(f"backend: {'numpy' if hotel.np is not None else 'pure python'}")
+    for guests in parse_sizes("5000000"):
+        ledger = hotel.LoyaltyLedger()
+        start = time.perf_counter()
+        for guest_id in range(guests):
+            ledger.record(guest_id, 50, "join_bonus")
+        seeded = time.perf_counter() - start
+        print(f"\n{guests:,} guests")
+        print(f"  record (join bonus): {guests / seeded:>12,.0f} entries/s")
+
+        batches = [make_payments(rng, guests, room, number * BATCH) for number in range(3)]
+        start = time.perf_counter()
+        for payments in batches:
+            ledger.accrue_payments(payments)
+        accrued = time.perf_counter() - start
+        print(f"  accrue_payments:     {len(batches) * BATCH / accrued:>12,.0f} payments/s  (batches of {BATCH:,})")
+        start = time.perf_counter()
+        ledger.accrue_payments(batches[0])
+        print(f"  re-fed batch (no-op): {(time.perf_counter() - start) * 1e3:>11.1f} ms")
+
+        recompute = best_of(ledger.recompute_balances, 3)
+        print(f"  recompute_balances:  {recompute * 1e3:>12.1f} ms over {ledger.get_entry_count():,} entries")
+        lookups = min(guests, 100000)
+        start = time.perf_counter()
+        for guest_id in rng.sample(range(guests), lookups):
+            ledger.get_history(guest_id)
+        print(f"  get_history:         {lookups / (time.perf_counter() - start):>12,.0f} lookups/s")
+        print(f"  array memory:        {ledger.get_memory_usage() / 1e6:>12.1f} MB")
+        del batches, ledger
+
+
+if __name__ == "__main__":
+    main()
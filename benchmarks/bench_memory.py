@@ -0,0 +1,70 @@
+"""
+Bytes per instance for the slotted domain classes versus the same classes backed by a __dict__.
+
+The __dict__ variants are rebuilt from each class's own methods with __slots__ removed, so both
+sides run identical code. Memory is measured with tracemalloc while the instances are alive.
+
+Usage: python benchmarks/bench_memory.py [count]   (default: 1000000)
+"""
+import gc
+import tracemalloc
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+
+def dict_backed(cls: type) -> type:
+    """Returns a copy of cls without __slots__, so instances store attributes in a __dict__."""
+    slot_names = {f"_{cls.__name__}{name}" if name.startswith("__") else name for name in cls.__slots__}
+    namespace = {key: value for key, value in vars(cls).items() if key not in slot_names and key not in ("__slots__", "__dict__", "__weakref__")}
+    return type(cls.__name__, (), namespace)
+
+
+def factories() -> dict:
+    """Returns a constructor taking an index for each domain class."""
+    guest = hotel.Guest(1, "Memory Guest", "memory@example.com")
+    room = hotel.Room(0, "Suite", ["Wi-Fi"], 150.0)
+    booking = hotel.Booking(1, guest, room, "2025-03-01", "2025-03-04")
+    return {
+        "User": lambda cls, i: cls(i, "Name", "mail@example.com", "user", "secret", "Guest"),
+        "Guest": lambda cls, i: cls(i, "Name", "mail@example.com"),
+        "Room": lambda cls, i: cls(0, "Suite", ["Wi-Fi"], 150.0),
+        "Booking": lambda cls, i: cls(i, guest, room, "2025-03-01", "2025-03-04"),
+        "Payment": lambda cls, i: cls(i, booking, 450.0, "Credit Card"),
+        "Feedback": lambda cls, i: cls(i, guest, 5, "Great stay"),
+    }
+
+
+def bytes_per_instance(cls: type, make, count: int) -> float:
+    """Measures the traced memory held by count live instances of cls."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [make(cls, i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if cls.__name__ == "Feedback":
+        for feedback in instances:
+            feedback.delete_feedback()
+    if cls.__name__ == "Booking":
+        for booking in instances:
+            booking.get_guest().remove_reservation(booking.get_booking_id())
+    del instances
+    return (after - before) / count
+
+
+def main() -> None:
+    count = parse_sizes("1000000")[0]
+    # The stored hash is the same size at any work factor; a cheap one keeps a million User() calls fast
+    hotel.User.password_hasher = hotel.PasswordHasher(n=2)
+    print(f"{'class':>10} {'__dict__ (B)':>13} {'__slots__ (B)':>14} {'saved':>7}")
+    for name, make in factories().items():
+        cls = getattr(hotel, name)
+        before = bytes_per_instance(dict_backed(cls), make, count)
+        after = bytes_per_instance(cls, make, count)
+        print(f"{name:>10} {before:>13.1f} {after:>14.1f} {1 - after / before:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+OccupancyMetrics: cost of keeping per-night counters current through booking transitions and room
+maintenance, and dashboard reads against recomputing occupancy, ADR and RevPAR from every booking.
+
+Usage: python benchmarks/bench_occupancy_metrics.py [transitions]   (default: 100000)
+"""
+import random
+import time
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = {"Single": 90.0, "Double": 130.0, "Deluxe": 190.0, "Suite": 280.0}
+ROOMS = 2000
+BOOKINGS = 20000
+FIRST_DAY = hotel.to_ordinal("2026-01-01")
+HORIZON = 365
+DASHBOARD_DAYS = 30
+
+
+def recompute(rooms: list, bookings: list, maintenance: dict, start: int, end: int) -> dict:
+    """Occupancy, ADR and RevPAR for [start, end) from scratch: every room and every booking."""
+    available = sum(1 for _ in rooms) * (end - start) - sum(1 for nights in maintenance.values() for night in nights if start <= night < end)
+    sold = 0
+    revenue = 0.0
+    for booking in bookings:
+        if booking.get_status() != "Confirmed":
+            continue
+        check_in = booking.get_check_in_ordinal()
+        first, last = max(check_in, start), min(booking.get_check_out_ordinal(), end)
+        if last > first:
+            sold += last - first
+            revenue += sum(booking.get_nightly_rates()[first - check_in:last - check_in])
+    return {
+        "rooms_available": available,
+        "rooms_sold": sold,
+        "occupancy": round(sold / available, 4) if available else 0.0,
+        "adr": round(revenue / sold, 2) if sold else 0.0,
+        "revpar": round(revenue / available, 2) if available else 0.0,
+    }
+
+
+def same(measured: dict, expected: dict) -> bool:
+    """Compares two metric dicts, allowing for float summation order in the rounded figures."""
+    return all(abs(measured[key] - expected[key]) <= 0.011 for key in expected)
+
+
+def transition(booking, rooms: list, maintenance: dict, rng: random.Random) -> None:
+    """Applies one random booking transition or maintenance change."""
+    choice = rng.random()
+    if choice < 0.3:
+        booking.confirm_booking()
+    elif choice < 0.5:
+        booking.cancel_booking()
+    elif choice < 0.65:
+        check_in = FIRST_DAY + rng.randrange(HORIZON)
+        booking.modify_booking((check_in, check_in + rng.randint(1, 7)))
+    elif choice < 0.75:
+        booking.extend_booking(rng.randint(1, 3))
+    elif choice < 0.9:
+        booking.assign_room(rng.choice(rooms))
+    elif choice < 0.97:
+        room = rng.choice(rooms)
+        night = FIRST_DAY + rng.randrange(HORIZON)
+        room.schedule_maintenance(night)
+        maintenance.setdefault(room, set()).add(night)
+    elif maintenance:
+        room = rng.choice(list(maintenance))
+        night = rng.choice(sorted(maintenance[room]))
+        room.release_room(night)
+        maintenance[room].discard(night)
+        if not maintenance[room]:
+            del maintenance[room]
+
+
+def main() -> None:
+    count = parse_sizes("100000")[0]
+    rng = random.Random(23)
+    shared_index, shared_pricing = hotel.Room.availability_index, hotel.Booking.pricing_engine
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    hotel.Booking.pricing_engine = hotel.PricingEngine()
+    hotel.Booking.pricing_engine.add_seasonal_rule(FIRST_DAY + 150, FIRST_DAY + 240, 1.4, "Suite")  # Stays crossing it have uneven nightly rates
+    try:
+        rooms = [hotel.Room(number, room_type, [], price) for number, (room_type, price) in enumerate(list(ROOM_TYPES.items()) * (ROOMS // len(ROOM_TYPES)))]
+        guest = hotel.Guest(1, "Dashboard", "ops@example.com")
+        bookings = []
+        for number in range(BOOKINGS):
+            check_in = FIRST_DAY + rng.randrange(HORIZON)
+            bookings.append(hotel.Booking(number, guest, rng.choice(rooms), check_in, check_in + rng.randint(1, 7), rng.choice(["Confirmed", "Pending"])))
+        maintenance = {}
+
+        start = time.perf_counter()
+        for _ in range(count):
+            transition(rng.choice(bookings), rooms, maintenance, rng)
+        without = time.perf_counter() - start
+
+        for room, nights in maintenance.items():
+            for night in nights:
+                room.release_room(night)  # OccupancyMetrics only learns maintenance scheduled after it starts observing
+        maintenance.clear()
+        metrics = hotel.OccupancyMetrics(rooms, bookings)
+        start = time.perf_counter()
+        for _ in range(count):
+            transition(rng.choice(bookings), rooms, maintenance, rng)
+        with_metrics = time.perf_counter() - start
+        print(f"transitions without metrics: {without / count * 1e6:>7.2f} us each")
+        print(f"transitions with metrics:    {with_metrics / count * 1e6:>7.2f} us each")
+
+        window = (FIRST_DAY + 100, FIRST_DAY + 100 + DASHBOARD_DAYS)
+        incremental = best_of(lambda: metrics.get_range(*window), 20)
+        full = best_of(lambda: recompute(rooms, bookings, maintenance, *window), 3)
+        print(f"{DASHBOARD_DAYS}-day dashboard read:       {incremental * 1e6:>7.1f} us   (full recompute {full * 1e3:.1f} ms, {full / incremental:,.0f}x)")
+        print(f"single night read:           {best_of(lambda: metrics.get_night(window[0]), 20) * 1e6:>7.2f} us")
+
+        # The incremental counters must match a recompute from scratch for every window
+        for offset in range(0, HORIZON, DASHBOARD_DAYS):
+            first, last = FIRST_DAY + offset, FIRST_DAY + offset + DASHBOARD_DAYS
+            assert same(metrics.get_range(first, last), recompute(rooms, bookings, maintenance, first, last)), offset
+        for night in range(FIRST_DAY, FIRST_DAY + HORIZON, 7):
+            assert same(metrics.get_night(night), recompute(rooms, bookings, maintenance, night, night + 1)), night
+        print("incremental metrics match a full recompute")
+        for booking in bookings:
+            guest.remove_reservation(booking.get_booking_id())
+    finally:
+        hotel.Room.availability_index, hotel.Booking.pricing_engine = shared_index, shared_pricing
+
+
+if __name__ == "__main__":
+    main()
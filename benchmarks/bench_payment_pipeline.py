@@ -0,0 +1,41 @@
+"""
+Checkout-rush settlement throughput and latency through PaymentPipeline and FakePaymentGateway.
+
+Usage: python benchmarks/bench_payment_pipeline.py [payments]   (default: 20000)
+"""
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+CONFIGURATIONS = [  # (batch size, workers)
+    (1, 8),
+    (50, 4),
+    (100, 8),
+    (250, 16),
+]
+
+
+def main() -> None:
+    payment_count = parse_sizes("20000")[0]
+    guest = hotel.Guest(1, "Rush Guest", "rush@example.com")
+    booking = hotel.Booking(1, guest, hotel.Room(101, "Suite", [], 150.0), "2025-03-01", "2025-03-03")
+    print("gateway: 20 ms per batch + 0.2 ms per charge, 2% transient batch failures, 1% declines")
+    print(f"{'batch':>6} {'workers':>8} {'payments/s':>11} {'p50 ms':>8} {'p99 ms':>8} {'retries':>8} {'failed':>7}")
+    for batch_size, workers in CONFIGURATIONS:
+        count = payment_count if batch_size > 1 else min(payment_count, 2000)
+        payments = [hotel.Payment(payment_id, booking, 300.0, "Credit Card") for payment_id in range(count)]
+        gateway = hotel.FakePaymentGateway(latency=0.02, per_charge_latency=0.0002, failure_rate=0.02, decline_rate=0.01, seed=1)
+        pipeline = hotel.PaymentPipeline(gateway, batch_size=batch_size, max_workers=workers, max_pending_batches=2 * workers)
+        start = time.perf_counter()
+        for payment in payments:
+            pipeline.submit(payment, vat=5, coupon_code="DISCOUNT10", card_number="4111111111111111")
+        pipeline.close()
+        elapsed = time.perf_counter() - start
+        stats = pipeline.get_stats()
+        print(f"{batch_size:>6} {workers:>8} {count / elapsed:>11,.0f} {stats['p50_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['retries']:>8} {stats['failed']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+PricingEngine: quoting a 14-night stay for every room type with cached rate tables, against
+evaluating the seasonal and occupancy rules night by night for each quote.
+
+Usage: python benchmarks/bench_pricing_engine.py [quotes]   (default: 100000)
+"""
+import random
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = {"Single": 90.0, "Double": 130.0, "Deluxe": 190.0, "Suite": 280.0, "Penthouse": 650.0}
+STAY = 14
+YEAR_START = hotel.to_ordinal("2026-01-01")
+SEASONS = [("2026-06-15", "2026-09-01", 1.3), ("2026-12-18", "2027-01-04", 1.6), ("2026-01-10", "2026-03-01", 0.85)]
+
+
+def configure(engine, rng: random.Random) -> None:
+    """Adds seasonal rules for every type and a year of occupancy forecasts per type."""
+    for start, end, multiplier in SEASONS:
+        engine.add_seasonal_rule(start, end, multiplier)
+    for room_type in ROOM_TYPES:
+        engine.set_occupancy_forecast(room_type, YEAR_START, [rng.random() for _ in range(730)])
+
+
+def naive_quote(room_type: str, base_price: float, check_in: int, forecasts: dict) -> float:
+    """Applies every rule to every night of the stay, as a table-less engine would."""
+    total = 0.0
+    for night in range(check_in, check_in + STAY):
+        rate = base_price
+        for start, end, multiplier in SEASONS:
+            if hotel.to_ordinal(start) <= night < hotel.to_ordinal(end):
+                rate *= multiplier
+        occupancy = forecasts[room_type][night - YEAR_START]
+        for threshold, multiplier in hotel.PricingEngine.OCCUPANCY_BANDS:
+            if occupancy >= threshold:
+                rate *= multiplier
+                break
+        total += rate
+    return total
+
+
+def main() -> None:
+    quotes = parse_sizes("100000")[0]
+    rng = random.Random(18)
+    arrivals = [YEAR_START + rng.randrange(700 - STAY) for _ in range(quotes // len(ROOM_TYPES))]
+
+    plain = hotel.PricingEngine()
+    start = time.perf_counter()
+    for check_in in arrivals:
+        for room_type, price in ROOM_TYPES.items():
+            plain.quote(room_type, price, check_in, check_in + STAY)
+    print(f"no rules (nights * price):   {(time.perf_counter() - start) / quotes * 1e6:>7.2f} us/quote")
+
+    engine = hotel.PricingEngine()
+    configure(engine, random.Random(1))
+    forecast_rng = random.Random(1)  # replays the forecasts configure() drew
+    forecasts = {room_type: [forecast_rng.random() for _ in range(730)] for room_type in ROOM_TYPES}
+    start = time.perf_counter()
+    for room_type, price in ROOM_TYPES.items():
+        engine.quote(room_type, price, arrivals[0], arrivals[0] + STAY)
+    print(f"first quotes (table builds): {(time.perf_counter() - start) / len(ROOM_TYPES) * 1e6:>7.2f} us/quote")
+    start = time.perf_counter()
+    for check_in in arrivals:
+        for room_type, price in ROOM_TYPES.items():
+            engine.quote(room_type, price, check_in, check_in + STAY)
+    cached = time.perf_counter() - start
+    print(f"cached rate tables:          {cached / quotes * 1e6:>7.2f} us/quote   {engine.get_stats()}")
+
+    start = time.perf_counter()
+    for check_in in arrivals:
+        for room_type, price in ROOM_TYPES.items():
+            naive_quote(room_type, price, check_in, forecasts)
+    naive = time.perf_counter() - start
+    print(f"rules per night per quote:   {naive / quotes * 1e6:>7.2f} us/quote   ({naive / cached:.1f}x slower)")
+    for check_in in arrivals[:200]:
+        for room_type, price in ROOM_TYPES.items():
+            assert abs(engine.quote(room_type, price, check_in, check_in + STAY) - naive_quote(room_type, price, check_in, forecasts)) < 1e-6
+
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    try:
+        catalog = hotel.RoomCatalog(hotel.Room(number, "Suite", [], 280.0) for number in range(1000))
+        catalog.set_type_price("Suite", 300.0)  # fires Room.update_price for every suite
+        assert engine.get_stats()["tables"] == len(ROOM_TYPES) * 2 - 2, engine.get_stats()
+        print(f"after a Suite price change:  {engine.get_stats()}")
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+QuoteCache: search latency for a skewed ("popular dates and room types") query mix with bookings
+confirmed and cancelled in between, cached versus uncached.
+
+Usage: python benchmarks/bench_quote_cache.py [searches]   (default: 200000)
+"""
+import random
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = {"Single": 90.0, "Double": 130.0, "Deluxe": 190.0, "Suite": 280.0, "Penthouse": 650.0}
+ROOMS_PER_TYPE = 400
+FIRST_DAY = hotel.to_ordinal("2026-05-01")
+WRITE_EVERY = 200  # one booking confirmed or cancelled per this many searches
+
+
+def zipf_weights(count: int, skew: float = 1.1) -> list:
+    """Relative popularity of the count most-searched values."""
+    return [1 / rank ** skew for rank in range(1, count + 1)]
+
+
+def make_queries(count: int, rng: random.Random) -> list:
+    """Skewed searches: a few arrival dates, stay lengths and types dominate, like a real front end."""
+    types = list(ROOM_TYPES)
+    arrivals = rng.choices(range(90), weights=zipf_weights(90), k=count)
+    lengths = rng.choices(range(1, 8), weights=zipf_weights(7), k=count)
+    room_types = rng.choices(types, weights=zipf_weights(len(types)), k=count)
+    guests = rng.choices(range(1, 5), weights=[2, 5, 2, 1], k=count)
+    return [(room_type, FIRST_DAY + arrival, FIRST_DAY + arrival + length, party)
+            for room_type, arrival, length, party in zip(room_types, arrivals, lengths, guests)]
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Returns the sample at a fraction of the sorted samples."""
+    return sorted(samples)[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def run(searches: list, search, rooms: list, guest, rng: random.Random) -> list:
+    """Runs the searches, interleaving booking writes, and returns per-search latencies in seconds."""
+    latencies = []
+    live = []
+    for number, (room_type, check_in, check_out, party) in enumerate(searches):
+        if number % WRITE_EVERY == 0:
+            if live and rng.random() < 0.4:
+                live.pop(rng.randrange(len(live))).cancel_booking()
+            else:
+                arrival = FIRST_DAY + rng.randrange(90)
+                live.append(hotel.Booking(number, guest, rng.choice(rooms), arrival, arrival + rng.randint(1, 7), "Confirmed"))
+        start = time.perf_counter()
+        search(room_type, check_in, check_out, party)
+        latencies.append(time.perf_counter() - start)
+    for booking in live:
+        booking.cancel_booking()
+    return latencies
+
+
+def main() -> None:
+    count = parse_sizes("200000")[0]
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()
+    try:
+        rooms = [hotel.Room(1000 + number, room_type, [], price) for number, (room_type, price) in enumerate(list(ROOM_TYPES.items()) * ROOMS_PER_TYPE)]
+        guest = hotel.Guest(1, "Front End", "search@example.com")
+        searches = make_queries(count, random.Random(19))
+        cache = hotel.QuoteCache(capacity=5000, ttl=300.0)
+
+        uncached = run(searches[:count // 10], lambda *query: cache.compute(*query[:3]), rooms, guest, random.Random(1))
+        cached = run(searches, cache.search, rooms, guest, random.Random(1))
+        print(f"{'':>9} {'p50 us':>9} {'p99 us':>9} {'mean us':>9}")
+        for name, latencies in (("uncached", uncached), ("cached", cached)):
+            print(f"{name:>9} {percentile(latencies, 0.5) * 1e6:>9.1f} {percentile(latencies, 0.99) * 1e6:>9.1f} {sum(latencies) / len(latencies) * 1e6:>9.1f}")
+        print(cache.get_stats())
+
+        # Cached answers must equal a fresh computation after all the writes
+        for room_type, check_in, check_out, party in searches[:2000]:
+            assert cache.search(room_type, check_in, check_out, party) == cache.compute(room_type, check_in, check_out)
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+SQLite repository ingest and query throughput.
+
+Bookings are generated lazily and streamed into save_bookings, so the benchmark never holds all
+Booking objects at once.
+
+Usage: python benchmarks/bench_repository.py [bookings]   (default: 1000000)
+"""
+import os
+import random
+import tempfile
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+YEAR_START = hotel.to_ordinal("2025-01-01")
+
+
+def check_ins_on(repository, day: int) -> list:
+    """Returns the bookings checking in on one day."""
+    return repository.get_bookings_between(day, day + 1)
+
+
+def main() -> None:
+    booking_count = parse_sizes("1000000")[0]
+    rng = random.Random(9)
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "hotel.db")
+    repository = hotel.HotelRepository(path)
+
+    guests = [hotel.Guest(guest_id, "Guest", "guest@example.com") for guest_id in range(50000)]
+    rooms = [hotel.Room(100 + number, "Suite", ["Wi-Fi"], 150.0) for number in range(2000)]
+    repository.save_guests(guests)
+    repository.save_rooms(rooms)
+
+    def bookings():
+        for booking_id in range(booking_count):
+            check_in = YEAR_START + rng.randrange(365)
+            guest = rng.choice(guests)
+            yield hotel.Booking(booking_id, guest, rng.choice(rooms), check_in, check_in + rng.randint(1, 7))
+            guest.remove_reservation(booking_id)  # bookings register with their guest; drop them so the stream stays flat
+
+    start = time.perf_counter()
+    repository.save_bookings(bookings())
+    elapsed = time.perf_counter() - start
+    print(f"ingest: {booking_count:,} bookings in {elapsed:.1f} s ({booking_count / elapsed:,.0f} rows/s)")
+
+    queries = {
+        "bookings by guest": lambda: repository.get_guest_bookings(rng.randrange(len(guests))),
+        "room overlap check": lambda: repository.get_room_bookings(100 + rng.randrange(len(rooms)), YEAR_START + 100, YEAR_START + 104, "Pending"),
+        "check-ins on a day": lambda: check_ins_on(repository, YEAR_START + rng.randrange(365)),
+    }
+    for name, query in queries.items():
+        count = 2000
+        start = time.perf_counter()
+        for _ in range(count):
+            query()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20}: {count / elapsed:,.0f} queries/s")
+
+    start = time.perf_counter()
+    loaded_guests = repository.load_guests()
+    loaded_rooms = repository.load_rooms()
+    loaded = repository.load_bookings(loaded_guests, loaded_rooms)
+    elapsed = time.perf_counter() - start
+    print(f"bulk load: {len(loaded):,} bookings as objects in {elapsed:.1f} s")
+    repository.close()
+    for name in os.listdir(workdir):
+        os.remove(os.path.join(workdir, name))
+    os.rmdir(workdir)
+
+
+if __name__ == "__main__":
+    main()
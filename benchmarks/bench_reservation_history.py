@@ -0,0 +1,61 @@
+"""
+Guest reservation history: membership, invoice lookup and cancellation for corporate-sized histories,
+compared with the previous list-backed history.
+
+Usage: python benchmarks/bench_reservation_history.py [history sizes]   (default: 1000,10000,50000)
+"""
+import random
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+OPERATIONS = 2000
+
+
+def list_backed(booking_ids: list, lookups: list, cancels: list) -> float:
+    """The old behaviour: `in` and list.remove on a list of booking IDs."""
+    history = list(booking_ids)
+    start = time.perf_counter()
+    for booking_id in lookups:
+        if booking_id in history:
+            f"Invoice for booking {booking_id} is available."
+    for booking_id in cancels:
+        if booking_id in history:
+            history.remove(booking_id)
+    return time.perf_counter() - start
+
+
+def guest_backed(guest, lookups: list, cancels: list) -> float:
+    """Guest.view_invoice and Guest.cancel_booking on the hash-backed history."""
+    start = time.perf_counter()
+    for booking_id in lookups:
+        guest.view_invoice(booking_id)
+    for booking_id in cancels:
+        guest.cancel_booking(booking_id)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(15)
+    room = hotel.Room(9500, "Double", [], 120.0)
+    print(f"{'history':>8} {'list ms':>10} {'guest ms':>10} {'first page us':>14}")
+    for size in parse_sizes("1000,10000,50000"):
+        guest = hotel.Guest(size, "Corporate Account", "travel@example.com")
+        start_day = hotel.to_ordinal("2025-01-01")
+        for booking_id in range(size):
+            hotel.Booking(booking_id, guest, room, start_day + booking_id, start_day + booking_id + 1, "Pending")
+        booking_ids = guest.get_reservation_history()
+        lookups = [rng.randrange(size) for _ in range(OPERATIONS)]
+        cancels = rng.sample(booking_ids, min(OPERATIONS, size // 2))
+        list_time = list_backed(booking_ids, lookups, cancels)
+        guest_time = guest_backed(guest, lookups, cancels)
+        start = time.perf_counter()
+        next(guest.iter_reservation_pages(page_size=50))
+        page_time = time.perf_counter() - start
+        print(f"{size:>8} {list_time * 1e3:>10.1f} {guest_time * 1e3:>10.1f} {page_time * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+RoomCatalog on a large inventory: multi-attribute queries versus a linear scan, and bulk price changes.
+
+Usage: python benchmarks/bench_room_catalog.py [room counts]   (default: 100000)
+"""
+import random
+import time
+
+from _hotel import best_of, load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROOM_TYPES = ["Single", "Double", "Deluxe", "Suite", "Penthouse"]
+AMENITIES = ["Wi-Fi", "TV", "Mini-Bar", "Jacuzzi", "Balcony", "Sea View", "Kitchenette", "Safe"]
+QUERIES = [
+    {"room_type": "Suite", "max_price": 300.0, "amenities": ("Jacuzzi", "Wi-Fi"), "available": True},
+    {"room_type": "Double", "min_price": 100.0, "max_price": 150.0, "amenities": ("Balcony",)},
+    {"amenities": ("Sea View", "Kitchenette", "Safe"), "available": True},
+    {"min_price": 400.0},
+]
+
+
+def make_rooms(count: int, rng: random.Random) -> list:
+    """Builds rooms with random types, prices, amenities and availability."""
+    rooms = []
+    for number in range(count):
+        room_type = rng.choice(ROOM_TYPES)
+        price = round(rng.uniform(60.0, 80.0) * (1 + ROOM_TYPES.index(room_type)), 2)
+        amenities = [amenity for amenity in AMENITIES if rng.random() < 0.4]
+        rooms.append(hotel.Room(100000 + number, room_type, amenities, price, rng.random() < 0.8))
+    return rooms
+
+
+def scan(rooms: list, room_type=None, min_price=None, max_price=None, amenities=(), available=False) -> list:
+    """The same query as a pass over every room."""
+    return [
+        room for room in rooms
+        if (room_type is None or room.get_room_type() == room_type)
+        and (min_price is None or room.get_price() >= min_price)
+        and (max_price is None or room.get_price() <= max_price)
+        and all(amenity in room.get_amenities() for amenity in amenities)
+        and (not available or room.check_availability())
+    ]
+
+
+def main() -> None:
+    rng = random.Random(16)
+    shared_index = hotel.Room.availability_index
+    hotel.Room.availability_index = hotel.AvailabilityIndex()  # keep the module's shared index small
+    try:
+        for count in parse_sizes("100000"):
+            rooms = make_rooms(count, rng)
+            start = time.perf_counter()
+            catalog = hotel.RoomCatalog(rooms)
+            print(f"\n{count:,} rooms, catalog built in {(time.perf_counter() - start) * 1e3:.0f} ms")
+            print(f"{'query':>6} {'matches':>8} {'scan ms':>9} {'catalog ms':>11}")
+            for number, query in enumerate(QUERIES):
+                expected = scan(rooms, **query)
+                assert catalog.find_rooms(**query) == expected
+                scan_time = best_of(lambda: scan(rooms, **query), 3)
+                catalog_time = best_of(lambda: catalog.find_rooms(**query), 5)
+                print(f"{number:>6} {len(expected):>8,} {scan_time * 1e3:>9.2f} {catalog_time * 1e3:>11.2f}")
+
+            suites = [room for room in rooms if room.get_room_type() == "Suite"]
+            start = time.perf_counter()
+            for room in suites:
+                room.update_price(310.0)  # each update re-indexes its price through Room.observers
+            per_room = time.perf_counter() - start
+            start = time.perf_counter()
+            changed = catalog.set_type_price("Suite", 290.0)
+            bulk = time.perf_counter() - start
+            assert catalog.find_rooms(**QUERIES[0]) == scan(rooms, **QUERIES[0])
+            print(f"price change for {changed:,} suites: per room {per_room * 1e3:.0f} ms, set_type_price {bulk * 1e3:.0f} ms")
+
+            sample = rng.sample(rooms, 1000)
+            start = time.perf_counter()
+            for room in sample:
+                room.add_amenity("Jacuzzi")
+                room.update_status(not room.check_availability())
+            print(f"amenity/status updates: {(time.perf_counter() - start) / 2000 * 1e6:.1f} us each")
+            for query in QUERIES:
+                assert catalog.find_rooms(**query) == scan(rooms, **query)
+            del catalog, rooms
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+ServiceDispatcher throughput with 100k open requests and 2k employees: queueing, bulk dispatch,
+and a steady state of completions, transfers, cancellations and new requests.
+
+Usage: python benchmarks/bench_service_dispatcher.py [requests] [employees]   (default: 100000 2000)
+"""
+import random
+import sys
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+SERVICES = list(hotel.ServiceDispatcher.SERVICE_ROLES)
+ROLES = sorted(set(hotel.ServiceDispatcher.SERVICE_ROLES.values()))
+
+
+def main() -> None:
+    requests = parse_sizes("100000")[0]
+    employees = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = random.Random(20)
+    # Password hashing is not what is measured; a cheap work factor keeps 2k Employee() calls fast
+    hotel.User.password_hasher = hotel.PasswordHasher(n=2)
+    dispatcher = hotel.ServiceDispatcher(max_load=2 * requests // employees + 10)  # Housekeeping gets a third of the requests
+    staff = [hotel.Employee(number, "Staff", ROLES[number % len(ROLES)], 1, f"staff{number}", "pw") for number in range(employees)]
+    for employee in staff:
+        dispatcher.add_employee(employee)
+
+    start = time.perf_counter()
+    for number in range(requests):
+        dispatcher.create_request(number % 50000, rng.choice(SERVICES), rng.randint(1, 5))
+    elapsed = time.perf_counter() - start
+    print(f"queue {requests:,} requests:    {requests / elapsed:>10,.0f} requests/s")
+
+    start = time.perf_counter()
+    assignments = dispatcher.dispatch()
+    elapsed = time.perf_counter() - start
+    print(f"dispatch {len(assignments):,} to {employees:,}: {len(assignments) / elapsed:>10,.0f} assignments/s")
+    for role in ROLES:
+        loads = [dispatcher.get_employee_load(employee.get_employee_id()) for employee in staff if employee.get_role() == role]
+        assert max(loads) - min(loads) <= 1, (role, min(loads), max(loads))  # least-loaded keeps loads level
+
+    active = [request_id for request_id, _ in assignments]
+    operations = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        choice = rng.random()
+        position = rng.randrange(len(active))
+        request_id = active[position]
+        if choice < 0.5:
+            dispatcher.complete(request_id)
+        elif choice < 0.7:
+            dispatcher.transfer(request_id)
+            operations += 1
+            continue
+        else:
+            dispatcher.cancel(request_id)
+        active[position] = active[-1]
+        active.pop()
+        dispatcher.create_request(rng.randrange(50000), rng.choice(SERVICES), rng.randint(1, 5))
+        for assigned_id, _ in dispatcher.dispatch():
+            active.append(assigned_id)
+        operations += 3
+    elapsed = time.perf_counter() - start
+    print(f"steady state mix:            {operations / elapsed:>10,.0f} operations/s")
+    print(dispatcher.get_stats())
+
+
+if __name__ == "__main__":
+    main()
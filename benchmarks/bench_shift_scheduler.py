@@ -0,0 +1,73 @@
+"""
+ShiftScheduler: time to build a 4-week roster against forecast occupancy as the staff grows, and
+the cost of an incremental leave check against re-solving the whole roster.
+
+Usage: python benchmarks/bench_shift_scheduler.py [staff counts]   (default: 100,250,500,1000)
+"""
+import random
+import time
+
+from _hotel import load_hotel, parse_sizes
+
+hotel = load_hotel()
+
+ROLES = {"Housekeeping": 0.5, "Kitchen": 0.2, "Front Desk": 0.15, "Technician": 0.1, "Concierge": 0.05}
+FIRST_DAY = hotel.to_ordinal("2026-03-02")
+WEEKS = 4
+ROOMS_PER_STAFF = 2
+OCCUPANCY = 0.7
+
+
+def make_bookings(rooms: list, rng: random.Random) -> None:
+    """Fills about OCCUPANCY of the room-nights in the roster period with back-to-back confirmed stays."""
+    guest = hotel.Guest(1, "Forecast", "forecast@example.com")
+    booking_id = 0
+    for room in rooms:
+        night = FIRST_DAY - rng.randrange(4)
+        while night < FIRST_DAY + WEEKS * 7:
+            length = rng.randint(1, 6)
+            if rng.random() < OCCUPANCY:
+                booking_id += 1
+                hotel.Booking(booking_id, guest, room, night, night + length, "Confirmed")
+            night += length
+
+
+def make_staff(count: int) -> list:
+    """Employees split across roles by the ROLES shares."""
+    roles = [role for role, share in ROLES.items() for _ in range(round(count * share))]
+    return [hotel.Employee(number, f"Staff {number}", role, 1, f"staff{number}", "pw") for number, role in enumerate(roles)]
+
+
+def main() -> None:
+    rng = random.Random(21)
+    # Password hashing is not what is measured; a cheap work factor keeps 1000 Employee() calls fast
+    hotel.User.password_hasher = hotel.PasswordHasher(n=2)
+    shared_index = hotel.Room.availability_index
+    try:
+        print(f"{'staff':>6} {'rooms':>6} {'required':>9} {'shortfall':>10} {'solve s':>8} {'leave us':>9} {'granted':>8}")
+        for count in parse_sizes("100,250,500,1000"):
+            hotel.Room.availability_index = hotel.AvailabilityIndex()
+            rooms = [hotel.Room(number, "Double", [], 120.0) for number in range(count * ROOMS_PER_STAFF)]
+            make_bookings(rooms, rng)
+            staff = make_staff(count)
+            scheduler = hotel.ShiftScheduler(staff, FIRST_DAY, weeks=WEEKS)
+            start = time.perf_counter()
+            coverage = scheduler.solve()
+            solve_time = time.perf_counter() - start
+
+            requests = [(rng.choice(staff).get_employee_id(), FIRST_DAY + rng.randrange(WEEKS * 7), rng.randint(1, 5)) for _ in range(200)]
+            granted = 0
+            start = time.perf_counter()
+            for employee_id, first_day, days in requests:
+                granted += scheduler.request_leave(employee_id, first_day, days)
+            leave_time = (time.perf_counter() - start) / len(requests)
+            # Granted leave never costs coverage: the roster is only changed when every freed shift is refilled
+            assert scheduler.get_coverage()["shortfall"] <= coverage["shortfall"], (coverage, scheduler.get_coverage())
+            print(f"{len(staff):>6} {len(rooms):>6} {coverage['required']:>9,} {coverage['shortfall']:>10} {solve_time:>8.2f} {leave_time * 1e6:>9.0f} {granted:>8}")
+            del scheduler, staff, rooms
+    finally:
+        hotel.Room.availability_index = shared_index
+
+
+if __name__ == "__main__":
+    main()
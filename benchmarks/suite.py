@@ -0,0 +1,273 @@
+"""
+Scenario benchmark suite: replays realistic workloads over synthetic data and writes comparable JSON.
+
+Each scenario builds its data from a fixed seed (untimed), then times one run of the workload; the
+best and median of --repeat runs are reported as seconds and operations per second. --profile and
+--trace-memory add one extra run per scenario under cProfile or tracemalloc. Results saved with
+--json can be passed to --compare on a later commit to flag regressions.
+
+Usage:
+    python benchmarks/suite.py                                  # every scenario at scale 1
+    python benchmarks/suite.py checkout_rush --scale 5 --repeat 3
+    python benchmarks/suite.py --json before.json
+    python benchmarks/suite.py --compare before.json --threshold 0.15
+    python benchmarks/suite.py financial_report --profile profiles/ --trace-memory
+"""
+import argparse
+import cProfile
+import gc
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import _datagen as datagen
+from _hotel import load_hotel
+
+hotel = load_hotel()
+
+FIRST_DAY = hotel.to_ordinal("2026-06-01")
+SCENARIOS = {}  # name -> setup(scale, rng) returning (run, operations, guests to release)
+
+
+def scenario(function):
+    """Registers a scenario setup function under its name."""
+    SCENARIOS[function.__name__] = function
+    return function
+
+
+@scenario
+def staff_logins(scale: float, rng: random.Random):
+    """Shift change: every staff account logs in and out once."""
+    users = datagen.make_users(hotel, int(500 * scale), rng)
+
+    def run():
+        for user in users:
+            user.login(user.get_username(), "pw")
+        for user in users:
+            user.logout()
+
+    return run, len(users), []
+
+
+@scenario
+def booking_day_replay(scale: float, rng: random.Random):
+    """A day of front-desk traffic: searches, new bookings with payment, modifications and cancellations."""
+    guests = datagen.make_guests(hotel, int(2000 * scale), rng)
+    rooms = datagen.make_rooms(hotel, int(1000 * scale), rng)
+    existing = datagen.make_bookings(hotel, guests, rooms, int(10000 * scale), rng, FIRST_DAY)
+    requests = []
+    for _ in range(int(2000 * scale)):
+        check_in = FIRST_DAY + rng.randrange(60)
+        requests.append((rng.random(), rng.choice(list(datagen.ROOM_TYPES)), check_in, check_in + rng.randint(1, 5), rng.choice(guests)))
+
+    def run():
+        booking_id = len(existing)
+        live = list(existing)
+        for choice, room_type, check_in, check_out, guest in requests:
+            if choice < 0.1:
+                live[int(choice * 10 * len(live))].modify_booking((check_in, check_out))
+            elif choice < 0.15:
+                live[int((choice - 0.1) * 20 * len(live))].cancel_booking()
+            else:
+                free = hotel.Room.availability_index.find_free_rooms(room_type, check_in, check_out)
+                if free:
+                    booking = hotel.Booking(booking_id, guest, free[0], check_in, check_out)
+                    booking.confirm_booking()
+                    hotel.Payment(booking_id, booking, booking.calculate_total_cost(), "Credit Card").process_payment()
+                    live.append(booking)
+                    booking_id += 1
+
+    return run, len(requests), guests
+
+
+@scenario
+def checkout_rush(scale: float, rng: random.Random):
+    """Morning departures: settle each stay's payment, free the room, collect feedback, then accrue loyalty points."""
+    guests = datagen.make_guests(hotel, int(3000 * scale), rng)
+    rooms = datagen.make_rooms(hotel, int(2000 * scale), rng)
+    departures = [booking for booking in datagen.make_bookings(hotel, guests, rooms, int(3000 * scale), rng, FIRST_DAY, horizon=7, confirmed=1.0)]
+    ratings = [rng.choices(range(1, 6), weights=[1, 2, 4, 8, 10])[0] if rng.random() < 0.3 else None for _ in departures]
+
+    def run():
+        payments = []
+        for number, (booking, rating) in enumerate(zip(departures, ratings)):
+            payment = hotel.Payment(number, booking, booking.calculate_total_cost(), "Credit Card")
+            payment.apply_vat(5)
+            payment.process_payment()
+            payments.append(payment)
+            booking.get_room().release_room()
+            if rating is not None:
+                hotel.Feedback(number, booking.get_guest(), rating, "Checkout survey")
+        hotel.Guest.loyalty_ledger.accrue_payments(payments)
+
+    return run, len(departures), guests
+
+
+@scenario
+def feedback_dashboard(scale: float, rng: random.Random):
+    """Dashboard polls (trends, top reviews, one guest's history) while new feedback keeps arriving."""
+    guests = datagen.make_guests(hotel, int(5000 * scale), rng)
+    datagen.make_feedback(hotel, guests, int(20000 * scale), rng)
+    polls = [(rng.choice(guests), rng.randint(1, 5)) for _ in range(int(2000 * scale))]
+
+    def run():
+        feedback_id = 10 ** 9
+        for guest, rating in polls:
+            hotel.Feedback(feedback_id, guest, rating, "Live review")
+            feedback_id += 1
+            hotel.Feedback.analyze_feedback_trends()
+            hotel.Feedback.filter_feedback_by_rating(5)[:20]
+            hotel.Feedback.get_guest_feedback(guest.get_guest_id())
+
+    return run, len(polls), guests
+
+
+@scenario
+def financial_report(scale: float, rng: random.Random):
+    """Month-end report: one streaming pass over every payment."""
+    guests = datagen.make_guests(hotel, int(2000 * scale), rng)
+    rooms = datagen.make_rooms(hotel, int(500 * scale), rng)
+    bookings = datagen.make_bookings(hotel, guests, rooms, int(50000 * scale), rng, FIRST_DAY, horizon=30)
+    payments = datagen.make_payments(hotel, bookings, rng)
+    admin = hotel.Admin(1, "finance", "pw")
+
+    def run():
+        admin.generate_financial_report(payments)
+
+    return run, len(payments), guests
+
+
+@scenario
+def occupancy_dashboard(scale: float, rng: random.Random):
+    """Ops dashboard: 30-day occupancy, ADR and RevPAR reads between booking confirmations and cancellations."""
+    guests = datagen.make_guests(hotel, int(2000 * scale), rng)
+    rooms = datagen.make_rooms(hotel, int(1000 * scale), rng)
+    bookings = datagen.make_bookings(hotel, guests, rooms, int(20000 * scale), rng, FIRST_DAY)
+    metrics = hotel.OccupancyMetrics(rooms, bookings)
+    changes = [(rng.choice(bookings), rng.random() < 0.5) for _ in range(int(5000 * scale))]
+
+    def run():
+        for number, (booking, confirm) in enumerate(changes):
+            if confirm:
+                booking.confirm_booking()
+            else:
+                booking.cancel_booking()
+            metrics.get_range(FIRST_DAY + number % 60, FIRST_DAY + number % 60 + 30)
+
+    run.metrics = metrics  # keeps the observer alive for the scenario's lifetime
+    return run, len(changes), guests
+
+
+def measure(name: str, scale: float, seed: int, repeat: int, profile_dir: str = None, trace_memory: bool = False) -> dict:
+    """Times a scenario repeat times from freshly generated data and returns its result entry."""
+    timings = []
+    result = {}
+    for attempt in range(repeat + bool(profile_dir) + bool(trace_memory)):
+        with datagen.isolated(hotel):
+            run, operations, guests = SCENARIOS[name](scale, random.Random(seed))
+            gc.collect()
+            if attempt < repeat:
+                start = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - start)
+            elif profile_dir and "profile" not in result:
+                profiler = cProfile.Profile()
+                profiler.runcall(run)
+                os.makedirs(profile_dir, exist_ok=True)
+                result["profile"] = os.path.join(profile_dir, f"{name}.prof")
+                profiler.dump_stats(result["profile"])
+                report = io.StringIO()
+                pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(8)
+                result["profile_top"] = [line.strip() for line in report.getvalue().splitlines() if line.strip()[:1].isdigit() and "(" in line][:8]
+            else:
+                tracemalloc.start()
+                run()
+                snapshot = tracemalloc.take_snapshot()
+                result["peak_kib"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+                result["top_allocations"] = [str(stat) for stat in snapshot.statistics("lineno")[:5]]
+            datagen.release(guests)
+    best = min(timings)
+    result.update({
+        "operations": operations,
+        "best_s": round(best, 6),
+        "median_s": round(statistics.median(timings), 6),
+        "ops_per_s": round(operations / best, 1),
+        "runs": len(timings),
+    })
+    return result
+
+
+def git_commit() -> str:
+    """Returns the short commit hash of the checkout, or None outside a git work tree."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> list:
+    """Prints each scenario's change against a saved run and returns the names that regressed beyond threshold."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    print(f"\nagainst {baseline_path} ({baseline['meta'].get('commit')}, scale {baseline['meta']['scale']}):")
+    regressions = []
+    for name, result in results.items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:>22}  (new)")
+            continue
+        change = before["ops_per_s"] / result["ops_per_s"] - 1  # > 0 means slower now
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:>22} {change:>+8.1%} time{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the hotel scenario benchmarks.")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario", help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="data size multiplier (default: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per scenario (default: 5)")
+    parser.add_argument("--seed", type=int, default=25, help="random seed for the generated data (default: 25)")
+    parser.add_argument("--profile", metavar="DIR", help="write a cProfile .prof per scenario to DIR")
+    parser.add_argument("--trace-memory", action="store_true", help="record peak memory and top allocation sites per scenario")
+    parser.add_argument("--json", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a previous --json result")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown reported as a regression by --compare (default: 0.1)")
+    args = parser.parse_args()
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    results = {}
+    print(f"{'scenario':>22} {'ops':>8} {'best ms':>9} {'median ms':>10} {'ops/s':>11}")
+    for name in args.scenarios or SCENARIOS:
+        result = results[name] = measure(name, args.scale, args.seed, args.repeat, args.profile, args.trace_memory)
+        print(f"{name:>22} {result['operations']:>8,} {result['best_s'] * 1e3:>9.1f} {result['median_s'] * 1e3:>10.1f} {result['ops_per_s']:>11,.0f}"
+              + (f"   peak {result['peak_kib']:,.0f} KiB" if "peak_kib" in result else ""))
+        for line in result.get("profile_top", ()):
+            print(f"{'':>24}{line}")
+
+    if args.json:
+        meta = {"commit": git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+                "scale": args.scale, "repeat": args.repeat, "seed": args.seed, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"meta": meta, "scenarios": results}, file, indent=2)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Tests for OccupancyMetrics: incremental per-night counters against a recompute from the bookings.
+
+Run with pytest, or directly: python test_occupancy_metrics.py
+"""
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Updated UML Classes code.py")
+
+
+def load_hotel():
+    """Imports the class module (its file name contains spaces) without echoing the example usage output."""
+    if "hotel" in sys.modules:
+        return sys.modules["hotel"]
+    spec = importlib.util.spec_from_file_location("hotel", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hotel"] = module
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+
+hotel = load_hotel()
+
+
+@contextlib.contextmanager
+def isolated():
+    """Runs a test against a fresh availability index, pricing engine and loyalty ledger."""
+    saved = hotel.Room.availability_index, hotel.Booking.pricing_engine
+    hotel.Room.availability_index, hotel.Booking.pricing_engine = hotel.AvailabilityIndex(), hotel.PricingEngine()
+    try:
+        yield hotel.Guest(1, "Metrics Guest", "metrics@example.com", ledger=hotel.LoyaltyLedger())
+    finally:
+        hotel.Room.availability_index, hotel.Booking.pricing_engine = saved
+
+
+def test_incremental_metrics_match_the_bookings():
+    with isolated() as guest:
+        rooms = [hotel.Room(901 + number, "Double", [], 100.0 + 10 * number) for number in range(4)]
+        bookings = [hotel.Booking(901 + number, guest, rooms[number], "2025-05-01", "2025-05-04") for number in range(4)]
+        metrics = hotel.OccupancyMetrics(rooms, bookings)
+        try:
+            for booking in bookings[:3]:
+                booking.confirm_booking()
+            bookings[1].extend_booking(2)
+            bookings[2].modify_booking(("2025-05-05", "2025-05-07"))
+            bookings[2].assign_room(rooms[3])
+            bookings[0].cancel_booking()
+            bookings[0].confirm_booking()
+            rooms[1].update_price(180.0)
+            rooms[0].schedule_maintenance("2025-05-06")
+            rooms[0].schedule_maintenance("2025-05-07")
+            rooms[0].release_room("2025-05-07")
+
+            metrics_range = metrics.get_range("2025-05-01", "2025-05-08")
+            confirmed = [booking for booking in bookings if booking.get_status() == "Confirmed"]
+            expected_sold = sum(booking.get_num_nights() for booking in confirmed)
+            expected_revenue = sum(booking.calculate_total_cost() for booking in confirmed)
+            assert metrics_range["rooms_available"] == 4 * 7 - 1, "Only the maintenance night still scheduled should be out of order"
+            assert metrics_range["rooms_sold"] == expected_sold, "Rooms sold should match the confirmed stays"
+            assert metrics_range["adr"] == round(expected_revenue / expected_sold, 2), "ADR should follow the current room prices"
+            assert metrics_range["revpar"] == round(expected_revenue / (4 * 7 - 1), 2), "RevPAR should follow the current room prices"
+        finally:
+            metrics.detach()
+
+
+def test_revenue_lands_on_the_nights_it_was_charged():
+    with isolated() as guest:
+        hotel.Booking.pricing_engine.add_seasonal_rule("2025-12-22", "2026-01-02", 1.5, "Suite")
+        room = hotel.Room(950, "Suite", [], 200.0)
+        booking = hotel.Booking(950, guest, room, "2025-12-20", "2025-12-24", "Confirmed")
+        metrics = hotel.OccupancyMetrics([room], [booking])
+        try:
+            assert [metrics.get_night(night)["adr"] for night in ("2025-12-20", "2025-12-21", "2025-12-22", "2025-12-23")] == [200.0, 200.0, 300.0, 300.0]
+            assert metrics.get_range("2025-12-20", "2025-12-24")["adr"] == round(booking.calculate_total_cost() / 4, 2)
+            room.update_price(100.0)
+            assert metrics.get_night("2025-12-20")["adr"] == 100.0, "A price change should recount the nightly rates"
+            assert metrics.get_night("2025-12-23")["adr"] == 150.0, "A price change should recount the nightly rates"
+        finally:
+            metrics.detach()
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")